@@ -6,6 +6,7 @@ __all__ = ['logger', 'generate_app_and_test']
 # %% ../../nbs/App_And_Test_Generator.ipynb 1
 from typing import *
 import time
+import asyncio
 import importlib.util
 from tempfile import TemporaryDirectory
 from pathlib import Path
@@ -16,13 +17,19 @@ import subprocess  # nosec: B404: Consider possible security implications associ
 from yaspin import yaspin
 
 from .._components.logger import get_logger
-from .chat import CustomAIChat, ValidateAndFixResponse
+from faststream_gen._code_generator.chat import (
+    CustomAIChat,
+    AsyncCustomAIChat,
+    ValidateAndFixResponse,
+    _check_no_code_fence,
+    _check_marker,
+)
 from faststream_gen._code_generator.helper import (
     write_file_contents,
     read_file_contents,
     validate_python_code,
     retry_on_error,
-    set_cwd
+    run_async,
 )
 from .prompts import APP_AND_TEST_GENERATION_PROMPT
 from faststream_gen._code_generator.constants import (
@@ -45,17 +52,24 @@ Fix the provided Python code following these rules:
 - Do not modify the line starting with 'from app.application'; it must remain unchanged. Adherence to this rule is crucial.
 """
 
-def _fix_generated_code(s: str) -> str:
-    ai = CustomAIChat(
+async def _fix_generated_code(s: str) -> str:
+    ai = AsyncCustomAIChat(
         params={
             "temperature": 0.2,
         },
         model=OpenAIModel.gpt3.value,
         user_prompt=_code_fix_prompt,
     )
-    response, usage = ai(s) # todo: add this usage to total usage
+    response, usage = await ai(s) # todo: add this usage to total usage
     return str(response)
 
+
+def _fix_generated_codes(*codes: str) -> List[str]:
+    async def _fix_all() -> List[str]:
+        return await asyncio.gather(*[_fix_generated_code(s) for s in codes])
+
+    return run_async(_fix_all())  # type: ignore
+
 # %% ../../nbs/App_And_Test_Generator.ipynb 7
 def _split_app_and_test_code(response: str) -> Tuple[str, str]:
     app_code, test_code = response.split("### application.py ###")[1].split(
@@ -78,8 +92,8 @@ def _validate_response(
     app_code = app_code.replace("### application.py ###", "").strip()
     test_code = test_code.strip()
 
-    fixed_app_code = _fix_generated_code(app_code)
-    fixed_test_code = _fix_generated_code(test_code).replace("from application import ", "from app.application import ")
+    fixed_app_code, fixed_test_code = _fix_generated_codes(app_code, test_code)
+    fixed_test_code = fixed_test_code.replace("from application import ", "from app.application import ")
 
     app_file_name = Path(output_directory) / APPLICATION_FILE_PATH
     test_file_name = Path(output_directory) / TEST_FILE_PATH
@@ -87,15 +101,16 @@ def _validate_response(
     write_file_contents(str(app_file_name), fixed_app_code)
     write_file_contents(str(test_file_name), fixed_test_code)
 
-    with set_cwd(output_directory):
-        cmd = ["pytest", "--tb=short"]
-        # nosemgrep: python.lang.security.audit.subprocess-shell-true.subprocess-shell-true
-        p = subprocess.run(  # nosec: B602, B603 subprocess call - check for execution of untrusted input.
-            cmd,
-            stderr=subprocess.PIPE,
-            stdout=subprocess.PIPE,
-            shell=True if platform.system() == "Windows" else False,
-        )
+    cmd = ["pytest", "--tb=short"]
+    # the working directory is passed to the subprocess, the batch command runs the jobs in threads of one process
+    # nosemgrep: python.lang.security.audit.subprocess-shell-true.subprocess-shell-true
+    p = subprocess.run(  # nosec: B602, B603 subprocess call - check for execution of untrusted input.
+        cmd,
+        stderr=subprocess.PIPE,
+        stdout=subprocess.PIPE,
+        shell=True if platform.system() == "Windows" else False,
+        cwd=Path(output_directory).resolve(),
+    )
     if p.returncode != 0:
         response = f"### application.py ###\n{fixed_app_code}\n\n### test.py ###\n{fixed_test_code}\n"
         return ([str(p.stdout.decode("utf-8"))], response)
@@ -110,6 +125,7 @@ def _generate(
     app_skeleton: str,
     total_usage: List[Dict[str, int]],
     output_directory: str,
+    num_candidates: int = 1,
     **kwargs,
 ) -> Tuple[str, List[Dict[str, int]], bool]:
     test_generator = CustomAIChat(
@@ -118,8 +134,11 @@ def _generate(
         },
         model=model,
         user_prompt=prompt,
+        stream_checks=[_check_no_code_fence, _check_marker("### application.py ###")],
+    )
+    test_validator = ValidateAndFixResponse(
+        test_generator, _validate_response, num_candidates=num_candidates
     )
-    test_validator = ValidateAndFixResponse(test_generator, _validate_response)
     validator_result = test_validator.fix(
         app_skeleton,
         total_usage,
@@ -141,6 +160,7 @@ def generate_app_and_test(
     output_directory: str,
     total_usage: List[Dict[str, int]],
     relevant_prompt_examples: str,
+    num_candidates: int = 1,
 ) -> Tuple[List[Dict[str, int]], bool]:
     """Generate integration test for the FastStream app
 
@@ -148,6 +168,7 @@ def generate_app_and_test(
         description: Validated User application description
         code_gen_directory: The directory containing the generated files.
         relevant_prompt_examples: Relevant examples to add in the prompts.
+        num_candidates: The number of candidate responses generated and validated in parallel in each attempt.
 
     Returns:
         The generated integration test code for the application
@@ -170,7 +191,7 @@ def generate_app_and_test(
         )
 
         total_usage, is_valid_app_code = _generate(
-            model, prompt, app_skeleton, total_usage, output_directory
+            model, prompt, app_skeleton, total_usage, output_directory, num_candidates
         )
         
         sp.text = ""
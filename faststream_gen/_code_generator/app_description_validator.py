@@ -6,13 +6,21 @@ __all__ = ['logger', 'ERROR_RESPONSE', 'GENERAL_FASTKAFKA_RESPONSE', 'validate_a
 # %% ../../nbs/App_Description_Validator.ipynb 1
 from typing import *
 import time
+from pathlib import Path
 
 from yaspin import yaspin
 
 from .._components.logger import get_logger
-from .chat import CustomAIChat
+from .._components.package_data import get_root_data_path
+from .chat import CustomAIChat, _get_relevant_document
 from .prompts import APP_VALIDATION_PROMPT
-from .constants import INCOMPLETE_DESCRIPTION, DESCRIPTION_EXAMPLE, OpenAIModel
+from faststream_gen._code_generator.constants import (
+    INCOMPLETE_DESCRIPTION,
+    DESCRIPTION_EXAMPLE,
+    DESCRIPTION_VALIDATION_QUERY,
+    DESCRIPTION_VALIDATION_CONTEXT_FILE_NAME,
+    OpenAIModel,
+)
 
 # %% ../../nbs/App_Description_Validator.ipynb 3
 logger = get_logger(__name__)
@@ -22,6 +30,21 @@ ERROR_RESPONSE = "I apologize, but I can only respond to queries related to Fast
 GENERAL_FASTKAFKA_RESPONSE = "Great to see your interest in FastStream! Unfortunately, I can only generate FastStream code and offer assistance in that area. For general information about FastStream, please visit https://faststream.airt.ai/"
 
 # %% ../../nbs/App_Description_Validator.ipynb 6
+def _get_description_validation_context(path: Optional[Path] = None) -> str:
+    """Return the docs context for the app description validation.
+
+    Args:
+        path: The file with the precomputed context. Defaults to the one in the package data.
+
+    Returns:
+        The precomputed context if it exists, otherwise the result of the semantic search.
+    """
+    path = path if path is not None else get_root_data_path() / DESCRIPTION_VALIDATION_CONTEXT_FILE_NAME
+    if path.exists():
+        return path.read_text(encoding="utf-8")
+    return _get_relevant_document(DESCRIPTION_VALIDATION_QUERY)
+
+# %% ../../nbs/App_Description_Validator.ipynb 8
 def validate_app_description(description: str, model: str, total_usage: List[Dict[str, int]]) -> Tuple[str, List[Dict[str, int]]]:
     """Validate the user's application description
 
@@ -41,7 +64,7 @@ def validate_app_description(description: str, model: str, total_usage: List[Dic
         text="Validating the application description...", color="cyan", spinner="clock"
     ) as sp:
         
-        ai = CustomAIChat(user_prompt=APP_VALIDATION_PROMPT, model=model, semantic_search_query="What is FastStream?")
+        ai = CustomAIChat(user_prompt=APP_VALIDATION_PROMPT, model=model, context=_get_description_validation_context())
         response, usage = ai(description)
         total_usage.append(usage)
         
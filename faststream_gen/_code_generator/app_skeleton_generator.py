@@ -14,7 +14,7 @@ from collections import defaultdict
 from yaspin import yaspin
 
 from .._components.logger import get_logger
-from .chat import CustomAIChat, ValidateAndFixResponse
+from .chat import CustomAIChat, ValidateAndFixResponse, _check_no_code_fence
 from faststream_gen._code_generator.helper import (
     write_file_contents,
     validate_python_code,
@@ -75,6 +75,7 @@ def _generate(
     app_description_content: str,
     total_usage: List[Dict[str, int]],
     output_directory: str,
+    num_candidates: int = 1,
     **kwargs,
 ) -> Tuple[str, List[Dict[str, int]]]:
     app_generator = CustomAIChat(
@@ -84,8 +85,11 @@ def _generate(
         model=model,
         user_prompt=prompt,
         #         semantic_search_query=app_description_content,
+        stream_checks=[_check_no_code_fence],
+    )
+    app_validator = ValidateAndFixResponse(
+        app_generator, _validate_response, num_candidates=num_candidates
     )
-    app_validator = ValidateAndFixResponse(app_generator, _validate_response)
     validator_result = app_validator.fix(
         app_description_content,
         total_usage,
@@ -100,13 +104,14 @@ def _generate(
         else validator_result
     )
 
-# %% ../../nbs/App_Skeleton_Generator.ipynb 18
+# %% ../../nbs/App_Skeleton_Generator.ipynb 19
 def generate_app_skeleton(
     validated_description: str,
     output_directory: str,
     model: str,
     total_usage: List[Dict[str, int]],
     relevant_prompt_examples: str,
+    num_candidates: int = 1,
 ) -> Tuple[List[Dict[str, int]], bool]:
     """Generate skeleton code for the new FastStream app from the application description
 
@@ -114,6 +119,7 @@ def generate_app_skeleton(
         code_gen_directory: The directory containing the generated files.
         total_usage: list of token usage.
         relevant_prompt_examples: Relevant examples to add in the prompts.
+        num_candidates: The number of candidate responses generated and validated in parallel in each attempt.
 
     Returns:
         The total token used to generate the FastStream code
@@ -129,7 +135,7 @@ def generate_app_skeleton(
         )
 
         total_usage, is_valid_skeleton_code = _generate(
-            model, prompt, validated_description, total_usage, output_directory
+            model, prompt, validated_description, total_usage, output_directory, num_candidates
         )
         sp.text = ""
         if is_valid_skeleton_code:
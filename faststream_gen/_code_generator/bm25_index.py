@@ -0,0 +1,121 @@
+# AUTOGENERATED! DO NOT EDIT! File to edit: ../../nbs/BM25_Index.ipynb.
+
+# %% auto 0
+__all__ = ['BM25Index']
+
+# %% ../../nbs/BM25_Index.ipynb 1
+from typing import *
+import re
+import json
+import math
+from collections import Counter
+from pathlib import Path
+
+import numpy as np
+
+from .constants import BM25_K1, BM25_B
+
+# %% ../../nbs/BM25_Index.ipynb 3
+def _tokenize(text: str) -> List[str]:
+    return re.findall(r"\w+", text.lower())
+
+# %% ../../nbs/BM25_Index.ipynb 5
+class BM25Index:
+    """A BM25 index of the documents for lexical search without embeddings.
+
+    Attributes:
+        term_frequencies: The number of occurrences of each term, one dictionary per document.
+        k1: The term frequency saturation parameter.
+        b: The document length normalization parameter.
+    """
+
+    def __init__(
+        self,
+        term_frequencies: List[Dict[str, int]],
+        k1: float = BM25_K1,
+        b: float = BM25_B,
+    ):
+        """Instantiates a new BM25Index object.
+
+        Args:
+            term_frequencies: The number of occurrences of each term, one dictionary per document.
+            k1: The term frequency saturation parameter.
+            b: The document length normalization parameter.
+        """
+        self.term_frequencies = term_frequencies
+        self.k1 = k1
+        self.b = b
+
+        num_docs = len(term_frequencies)
+        doc_lengths = np.array([sum(tf.values()) for tf in term_frequencies], dtype=np.float32)
+        avg_doc_length = doc_lengths.mean() if num_docs > 0 else 0.0
+        self._length_norm = k1 * (1 - b + b * doc_lengths / max(avg_doc_length, 1.0))
+
+        postings: Dict[str, Tuple[List[int], List[int]]] = {}
+        for i, tf in enumerate(term_frequencies):
+            for term, count in tf.items():
+                doc_ids, counts = postings.setdefault(term, ([], []))
+                doc_ids.append(i)
+                counts.append(count)
+        self._postings = {
+            term: (
+                np.array(doc_ids),
+                np.array(counts, dtype=np.float32),
+                math.log(1 + (num_docs - len(doc_ids) + 0.5) / (len(doc_ids) + 0.5)),
+            )
+            for term, (doc_ids, counts) in postings.items()
+        }
+
+    @classmethod
+    def from_texts(cls, texts: List[str], k1: float = BM25_K1, b: float = BM25_B) -> "BM25Index":
+        """Create the index of the texts.
+
+        Args:
+            texts: The texts of the documents.
+            k1: The term frequency saturation parameter.
+            b: The document length normalization parameter.
+
+        Returns:
+            The new index.
+        """
+        return cls([dict(Counter(_tokenize(t))) for t in texts], k1=k1, b=b)
+
+    def save(self, path: Union[str, Path]) -> None:
+        """Save the index to a JSON file.
+
+        Args:
+            path: The path of the file.
+        """
+        Path(path).write_text(
+            json.dumps({"k1": self.k1, "b": self.b, "term_frequencies": self.term_frequencies}),
+            encoding="utf-8",
+        )
+
+    @classmethod
+    def load(cls, path: Union[str, Path]) -> "BM25Index":
+        """Load the index from a JSON file.
+
+        Args:
+            path: The path of the file.
+
+        Returns:
+            The loaded index.
+        """
+        return cls(**json.loads(Path(path).read_text(encoding="utf-8")))
+
+    def get_scores(self, query: str) -> np.ndarray:
+        """Return the BM25 score of every document for the query.
+
+        Args:
+            query: The query text.
+
+        Returns:
+            The scores of the documents in the order they were indexed.
+        """
+        scores = np.zeros(len(self.term_frequencies), dtype=np.float32)
+        for term in set(_tokenize(query)):
+            if term not in self._postings:
+                continue
+            doc_ids, counts, idf = self._postings[term]
+            scores[doc_ids] += idf * counts * (self.k1 + 1) / (counts + self._length_norm[doc_ids])
+        return scores
@@ -1,34 +1,51 @@
 # AUTOGENERATED! DO NOT EDIT! File to edit: ../../nbs/Chat.ipynb.
 
 # %% auto 0
-__all__ = ['logger', 'CustomAIChat', 'ValidateAndFixResponse']
+__all__ = ['logger', 'StreamCheck', 'StreamAbortedError', 'CustomAIChat', 'AsyncCustomAIChat', 'ValidateAndFixResponse']
 
 # %% ../../nbs/Chat.ipynb 1
 from typing import *
 import random
+import re
+import asyncio
+import functools
+import weakref
+import os
+import sys
+import pickle
+import signal
+import platform
+import subprocess  # nosec: B404: Consider possible security implications associated with the subprocess module.
+import shutil
 import logging
 import time
 from collections import defaultdict
 from pathlib import Path
+from tempfile import TemporaryDirectory
 
 import openai
 from fastcore.foundation import patch
-from langchain.schema.document import Document
-from langchain.embeddings import OpenAIEmbeddings
-from langchain.vectorstores import FAISS
 
 from faststream_gen._code_generator.constants import (
     DEFAULT_PARAMS,
     MAX_RETRIES,
+    MAX_CONCURRENT_REQUESTS,
+    STREAM_CHECK_MAX_TOKENS,
+    FIX_HISTORY_SUMMARY_MAX_LENGTH,
     STEP_LOG_DIR_NAMES,
     MAX_NUM_FIXES_MSG,
     INCOMPLETE_DESCRIPTION,
     DESCRIPTION_EXAMPLE,
     LOGS_DIR_NAME,
+    TOKEN_TYPES,
+    LLM_CACHE_MODE_ENV_VAR,
 )
 from .._components.logger import get_logger, set_level
 from .prompts import SYSTEM_PROMPT
-from .helper import add_tokens_usage
+from .helper import add_tokens_usage, load_vector_store
+from .llm_cache import get_llm_cache, _get_cache_key, _set_cache_attempt
+from .rate_limiter import get_rate_limiter
+from .token_counter import count_tokens, count_message_tokens
 from .._components.package_data import get_root_data_path
 
 # %% ../../nbs/Chat.ipynb 3
@@ -88,22 +105,128 @@ def _retry_with_exponential_backoff(
     return decorator
 
 # %% ../../nbs/Chat.ipynb 8
-def _get_relevant_document(query: str) -> str:
+def _aretry_with_exponential_backoff(
+    initial_delay: float = 1,
+    exponential_base: float = 2,
+    jitter: bool = True,
+    max_retries: int = 10,
+    max_wait: float = 60,
+    errors: tuple = (
+        openai.error.RateLimitError,
+        openai.error.ServiceUnavailableError,
+        openai.error.APIError,
+    ),
+) -> Callable:
+    """Retry a coroutine function with exponential backoff without blocking the event loop."""
+
+    def decorator(
+        func: Callable[..., Awaitable[Any]]
+    ) -> Callable[..., Awaitable[Any]]:
+        @functools.wraps(func)
+        async def wrapper(*args, **kwargs):  # type: ignore
+            num_retries = 0
+            delay = initial_delay
+
+            while True:
+                try:
+                    return await func(*args, **kwargs)
+
+                except errors as e:
+                    num_retries += 1
+                    if num_retries > max_retries:
+                        raise Exception(
+                            f"Maximum number of retries ({max_retries}) exceeded."
+                        )
+                    delay = min(
+                        delay
+                        * exponential_base
+                        * (1 + jitter * random.random()),  # nosec
+                        max_wait,
+                    )
+                    logger.info(
+                        f"Note: OpenAI's API rate limit reached. Command will automatically retry in {int(delay)} seconds. For more information visit: https://help.openai.com/en/articles/5955598-is-api-usage-subject-to-any-rate-limits",
+                    )
+                    await asyncio.sleep(delay)
+
+        return wrapper
+
+    return decorator
+
+# %% ../../nbs/Chat.ipynb 10
+def _get_relevant_document(query: str, db_path: Optional[Path] = None) -> str:
     """Load the vector database and retrieve the most relevant document based on the given query.
 
     Args:
         query: The query for relevance-based document retrieval.
+        db_path: The path to the docs vector database. Defaults to the one in the package data.
 
     Returns:
         The content of the most relevant document as a string.
     """
-    db_path = get_root_data_path() / "docs"
-    db = FAISS.load_local(db_path, OpenAIEmbeddings())
+    db = load_vector_store(db_path if db_path is not None else get_root_data_path() / "docs")
     results = db.max_marginal_relevance_search(query, k=1, fetch_k=3)
     results_str = "\n".join([result.page_content for result in results])
     return results_str
 
-# %% ../../nbs/Chat.ipynb 10
+# %% ../../nbs/Chat.ipynb 12
+StreamCheck = Callable[[str, int], Optional[str]]
+
+
+class StreamAbortedError(Exception):
+    """Raised when a streamed response fails an incremental check and the request is cancelled.
+
+    Attributes:
+        response: The part of the response received before the request was cancelled.
+        errors: The errors returned by the failed checks.
+        usage: The estimated number of tokens used by the cancelled request.
+    """
+
+    def __init__(self, response: str, errors: List[str], usage: Dict[str, int]):
+        super().__init__("\n".join(errors))
+        self.response = response
+        self.errors = errors
+        self.usage = usage
+
+
+def _check_no_code_fence(response: str, num_tokens: int) -> Optional[str]:
+    if response.lstrip().startswith("```"):
+        return "Do not enclose the generated Python code with ```. Your response must be a valid and executable Python code."
+    return None
+
+
+def _check_marker(marker: str, max_tokens: int = STREAM_CHECK_MAX_TOKENS) -> StreamCheck:
+    """Create a stream check which fails if the marker is missing after max_tokens tokens.
+
+    Args:
+        marker: The string which must appear at the beginning of the response, e.g. a section header.
+        max_tokens: The number of tokens within which the marker must appear.
+
+    Returns:
+        The stream check.
+    """
+
+    def _check(response: str, num_tokens: int) -> Optional[str]:
+        if num_tokens >= max_tokens and marker not in response:
+            return f"Please add {marker} in your response"
+        return None
+
+    return _check
+
+
+def _get_chunk_content(chunk: Dict[str, Any]) -> str:
+    # the first chunk carries only the role
+    return chunk["choices"][0]["delta"].get("content") or ""
+
+
+def _get_stream_usage(prompt_tokens: int, completion_tokens: int) -> Dict[str, int]:
+    # streamed responses don't report the usage, so it is counted with the model's tokenizer
+    return {
+        "prompt_tokens": prompt_tokens,
+        "completion_tokens": completion_tokens,
+        "total_tokens": prompt_tokens + completion_tokens,
+    }
+
+# %% ../../nbs/Chat.ipynb 14
 class CustomAIChat:
     """Custom class for interacting with OpenAI
 
@@ -112,6 +235,8 @@ class CustomAIChat:
         system_prompt: Initial system prompt to the AI model. If not passed, defaults to SYSTEM_PROMPT.
         initial_user_prompt: Initial user prompt to the AI model.
         params: Parameters to use while initiating the OpenAI chat model. DEFAULT_PARAMS used if not provided.
+        stream_checks: Checks run on the partial response while it is streamed. If any of them returns an error,
+            the request is cancelled and StreamAbortedError is raised. If not passed, the response is not streamed.
     """
 
     def __init__(
@@ -120,6 +245,8 @@ class CustomAIChat:
         user_prompt: Optional[str] = None,
         params: Dict[str, float] = DEFAULT_PARAMS,
         semantic_search_query: Optional[str] = None,
+        stream_checks: Optional[List[StreamCheck]] = None,
+        context: Optional[str] = None,
     ):
         """Instantiates a new CustomAIChat object.
 
@@ -128,25 +255,64 @@ class CustomAIChat:
             user_prompt: The user prompt to the AI model.
             params: Parameters to use while initiating the OpenAI chat model. DEFAULT_PARAMS used if not provided.
             semantic_search_query: A query string to fetch relevant documents from the database
+            stream_checks: Checks run on the partial response while it is streamed.
+            context: A precomputed document used instead of searching the database with semantic_search_query.
         """
         self.model = model
         self.messages = [
             {"role": role, "content": content}
             for role, content in [
                 ("system", SYSTEM_PROMPT),
-                ("user", self._get_doc(semantic_search_query)),
+                ("user", context if context is not None else self._get_doc(semantic_search_query)),
                 ("user", user_prompt),
             ]
             if content is not None
         ]
         self.params = params
+        self.stream_checks = stream_checks
 
     @staticmethod
     def _get_doc(semantic_search_query: Optional[str] = None) -> str:
         if semantic_search_query is None:
             return ""
         return _get_relevant_document(semantic_search_query)
-    
+
+    def _add_user_prompt(self, user_prompt: str) -> None:
+        self.messages.append(
+            {"role": "user", "content": f"{user_prompt}\n==== YOUR RESPONSE ====\n"}
+        )
+        prompt_str = "\n\n".join([f"===Role:{m['role']}===\n\nMessage:\n{m['content']}" for m in self.messages])
+        logger.info(f"\n\nPrompt to the model: \n\n{prompt_str}")
+
+    def _run_stream_checks(self, response: str, num_tokens: int) -> List[str]:
+        errors = [check(response, num_tokens) for check in self.stream_checks or []]
+        return [e for e in errors if e is not None]
+
+    def _create_streaming(self, prompt_tokens: int) -> Tuple[Dict[str, Any], List[str]]:
+        chunks = openai.ChatCompletion.create(
+            model=self.model,
+            messages=self.messages,
+            temperature=self.params["temperature"],
+            stream=True,
+        )
+        content, num_tokens, errors = "", 0, []
+        try:
+            for chunk in chunks:
+                content += _get_chunk_content(chunk)
+                num_tokens += 1
+                errors = self._run_stream_checks(content, num_tokens)
+                if len(errors) > 0:
+                    break
+        finally:
+            # closing the stream cancels the request, the rest of the response is not generated
+            chunks.close()
+
+        response = {
+            "choices": [{"message": {"content": content}}],
+            "usage": _get_stream_usage(prompt_tokens, count_tokens(content, self.model)),
+        }
+        return response, errors
+
     @_retry_with_exponential_backoff()
     def __call__(self, user_prompt: str) -> Tuple[str, Dict[str, int]]:
         """Call OpenAI API chat completion endpoint and generate a response.
@@ -156,25 +322,227 @@ class CustomAIChat:
 
         Returns:
             A tuple with AI's response message content and the total number of tokens used while generating the response.
+
+        Raises:
+            StreamAbortedError: If the streamed response fails any of the stream checks.
         """
-        self.messages.append(
-            {"role": "user", "content": f"{user_prompt}\n==== YOUR RESPONSE ====\n"}
-        )
-        prompt_str = "\n\n".join([f"===Role:{m['role']}===\n\nMessage:\n{m['content']}" for m in self.messages])
-        logger.info(f"\n\nPrompt to the model: \n\n{prompt_str}")
+        self._add_user_prompt(user_prompt)
         
+        llm_cache = get_llm_cache()
+        cache_key = _get_cache_key(self.model, self.params, self.messages)
+        cached_response = llm_cache.get(cache_key)
+        if cached_response is not None:
+            logger.info("Using the cached response, no tokens were used.")
+            return (
+                cached_response["choices"][0]["message"]["content"],
+                {token_type: 0 for token_type in TOKEN_TYPES},
+            )
+
+        rate_limiter = get_rate_limiter()
+        estimated_tokens = count_message_tokens(self.messages, self.model)
+        taken_tokens = rate_limiter.acquire(self.model, estimated_tokens)
+        errors: List[str] = []
+        if self.stream_checks is None:
+            response = openai.ChatCompletion.create(
+                model=self.model,
+                messages=self.messages,
+                temperature=self.params["temperature"],
+            )
+        else:
+            response, errors = self._create_streaming(estimated_tokens)
+        rate_limiter.record_usage(self.model, taken_tokens, response["usage"]["total_tokens"])
+        if len(errors) > 0:
+            logger.info(f"The streamed response was cancelled. Errors:\n{errors}")
+            raise StreamAbortedError(
+                response["choices"][0]["message"]["content"], errors, response["usage"]
+            )
+        llm_cache.set(cache_key, response)
+
+        return (
+            response["choices"][0]["message"]["content"],
+            response["usage"],
+        )
+
+    @_retry_with_exponential_backoff()
+    def sample(self, user_prompt: str, n: int) -> Tuple[List[str], Dict[str, int]]:
+        """Generate n candidate responses with a single OpenAI API call.
+
+        The stream checks are not used, the candidates are returned only when all of them are completed.
+
+        Args:
+            user_prompt: A string containing user's input prompt.
+            n: The number of candidate responses to generate.
+
+        Returns:
+            A tuple with the list of candidate responses and the total number of tokens used while generating them.
+        """
+        self._add_user_prompt(user_prompt)
+
+        llm_cache = get_llm_cache()
+        cache_key = _get_cache_key(self.model, {**self.params, "n": n}, self.messages)
+        cached_response = llm_cache.get(cache_key)
+        if cached_response is not None:
+            logger.info("Using the cached response, no tokens were used.")
+            return (
+                [choice["message"]["content"] for choice in cached_response["choices"]],
+                {token_type: 0 for token_type in TOKEN_TYPES},
+            )
+
+        rate_limiter = get_rate_limiter()
+        estimated_tokens = count_message_tokens(self.messages, self.model)
+        taken_tokens = rate_limiter.acquire(self.model, estimated_tokens)
         response = openai.ChatCompletion.create(
             model=self.model,
             messages=self.messages,
             temperature=self.params["temperature"],
+            n=n,
+        )
+        rate_limiter.record_usage(self.model, taken_tokens, response["usage"]["total_tokens"])
+        llm_cache.set(cache_key, response)
+
+        return (
+            [choice["message"]["content"] for choice in response["choices"]],
+            response["usage"],
+        )
+
+# %% ../../nbs/Chat.ipynb 20
+_semaphores: "weakref.WeakKeyDictionary[asyncio.AbstractEventLoop, asyncio.Semaphore]" = weakref.WeakKeyDictionary()
+
+
+def _get_default_semaphore() -> asyncio.Semaphore:
+    """Return the semaphore shared by all AsyncCustomAIChat instances in the running event loop."""
+    loop = asyncio.get_running_loop()
+    if loop not in _semaphores:
+        _semaphores[loop] = asyncio.Semaphore(MAX_CONCURRENT_REQUESTS)
+    return _semaphores[loop]
+
+
+class AsyncCustomAIChat(CustomAIChat):
+    """Async variant of CustomAIChat which limits the number of in-flight requests
+
+    Attributes:
+        model: The OpenAI model to use. If not passed, defaults to gpt-3.5-turbo-16k.
+        system_prompt: Initial system prompt to the AI model. If not passed, defaults to SYSTEM_PROMPT.
+        initial_user_prompt: Initial user prompt to the AI model.
+        params: Parameters to use while initiating the OpenAI chat model. DEFAULT_PARAMS used if not provided.
+        stream_checks: Checks run on the partial response while it is streamed. If any of them returns an error,
+            the request is cancelled and StreamAbortedError is raised. If not passed, the response is not streamed.
+        semaphore: Semaphore limiting the number of concurrent requests. If not passed, all instances within
+            the running event loop share one which allows MAX_CONCURRENT_REQUESTS requests at a time.
+    """
+
+    def __init__(
+        self,
+        model: str,
+        user_prompt: Optional[str] = None,
+        params: Dict[str, float] = DEFAULT_PARAMS,
+        semantic_search_query: Optional[str] = None,
+        stream_checks: Optional[List[StreamCheck]] = None,
+        semaphore: Optional[asyncio.Semaphore] = None,
+        context: Optional[str] = None,
+    ):
+        """Instantiates a new AsyncCustomAIChat object.
+
+        Args:
+            model: The OpenAI model to use. If not passed, defaults to gpt-3.5-turbo-16k.
+            user_prompt: The user prompt to the AI model.
+            params: Parameters to use while initiating the OpenAI chat model. DEFAULT_PARAMS used if not provided.
+            semantic_search_query: A query string to fetch relevant documents from the database
+            stream_checks: Checks run on the partial response while it is streamed.
+            semaphore: Semaphore limiting the number of concurrent requests.
+            context: A precomputed document used instead of searching the database with semantic_search_query.
+        """
+        super().__init__(
+            model=model,
+            user_prompt=user_prompt,
+            params=params,
+            semantic_search_query=semantic_search_query,
+            stream_checks=stream_checks,
+            context=context,
+        )
+        self.semaphore = semaphore
+
+    async def _acreate_streaming(self, prompt_tokens: int) -> Tuple[Dict[str, Any], List[str]]:
+        chunks = await openai.ChatCompletion.acreate(
+            model=self.model,
+            messages=self.messages,
+            temperature=self.params["temperature"],
+            stream=True,
         )
+        content, num_tokens, errors = "", 0, []
+        try:
+            async for chunk in chunks:
+                content += _get_chunk_content(chunk)
+                num_tokens += 1
+                errors = self._run_stream_checks(content, num_tokens)
+                if len(errors) > 0:
+                    break
+        finally:
+            # closing the stream cancels the request, the rest of the response is not generated
+            await chunks.aclose()
+
+        response = {
+            "choices": [{"message": {"content": content}}],
+            "usage": _get_stream_usage(prompt_tokens, count_tokens(content, self.model)),
+        }
+        return response, errors
+
+    @_aretry_with_exponential_backoff()
+    async def _acreate(self) -> Tuple[Dict[str, Any], List[str]]:
+        rate_limiter = get_rate_limiter()
+        estimated_tokens = count_message_tokens(self.messages, self.model)
+        taken_tokens = await rate_limiter.aacquire(self.model, estimated_tokens)
+        errors: List[str] = []
+        async with self.semaphore or _get_default_semaphore():
+            if self.stream_checks is None:
+                response = await openai.ChatCompletion.acreate(
+                    model=self.model,
+                    messages=self.messages,
+                    temperature=self.params["temperature"],
+                )
+            else:
+                response, errors = await self._acreate_streaming(estimated_tokens)
+        rate_limiter.record_usage(self.model, taken_tokens, response["usage"]["total_tokens"])
+        return response, errors
+
+    async def __call__(self, user_prompt: str) -> Tuple[str, Dict[str, int]]:  # type: ignore
+        """Call OpenAI API chat completion endpoint and generate a response.
+
+        Args:
+            user_prompt: A string containing user's input prompt.
+
+        Returns:
+            A tuple with AI's response message content and the total number of tokens used while generating the response.
+
+        Raises:
+            StreamAbortedError: If the streamed response fails any of the stream checks.
+        """
+        self._add_user_prompt(user_prompt)
+
+        llm_cache = get_llm_cache()
+        cache_key = _get_cache_key(self.model, self.params, self.messages)
+        cached_response = llm_cache.get(cache_key)
+        if cached_response is not None:
+            logger.info("Using the cached response, no tokens were used.")
+            return (
+                cached_response["choices"][0]["message"]["content"],
+                {token_type: 0 for token_type in TOKEN_TYPES},
+            )
+
+        response, errors = await self._acreate()
+        if len(errors) > 0:
+            logger.info(f"The streamed response was cancelled. Errors:\n{errors}")
+            raise StreamAbortedError(
+                response["choices"][0]["message"]["content"], errors, response["usage"]
+            )
+        llm_cache.set(cache_key, response)
 
         return (
             response["choices"][0]["message"]["content"],
             response["usage"],
         )
 
-# %% ../../nbs/Chat.ipynb 12
+# %% ../../nbs/Chat.ipynb 24
 class ValidateAndFixResponse:
     """Generates and validates response from OpenAI
 
@@ -182,6 +550,11 @@ class ValidateAndFixResponse:
         generate: A callable object for generating responses.
         validate: A callable object for validating responses.
         max_retries: An optional integer specifying the maximum number of attempts to generate and validate a response.
+        num_candidates: The number of candidate responses generated in each attempt. If more than one, the candidates
+            are generated with a single call to generate.sample and validated in parallel.
+        compact_history: If True, only the original task and the latest response with its errors are kept in the
+            conversation, the errors of the earlier tries are kept as short summaries. This keeps the prompt size
+            bounded regardless of max_retries.
     """
 
     def __init__(
@@ -189,10 +562,14 @@ class ValidateAndFixResponse:
         generate: Callable[..., Any],
         validate: Callable[..., Any],
         max_retries: Optional[int] = MAX_RETRIES,
+        num_candidates: int = 1,
+        compact_history: bool = True,
     ):
         self.generate = generate
         self.validate = validate
         self.max_retries = max_retries
+        self.num_candidates = num_candidates
+        self.compact_history = compact_history
 
     def fix(
         self,
@@ -204,7 +581,7 @@ class ValidateAndFixResponse:
     ) -> Tuple[str, List[Dict[str, int]]]:
         raise NotImplementedError()
 
-# %% ../../nbs/Chat.ipynb 13
+# %% ../../nbs/Chat.ipynb 25
 def _save_log_results(
     step_name: str,
     log_dir_path: str,
@@ -237,10 +614,29 @@ def _save_log_results(
             f_output.write(response)
             f_errors.write(error_str)
 
-# %% ../../nbs/Chat.ipynb 15
+# %% ../../nbs/Chat.ipynb 27
+def _summarize_errors(errors: str, max_length: int = FIX_HISTORY_SUMMARY_MAX_LENGTH) -> str:
+    """Shorten the errors of a failed try to the lines which name the failures.
+
+    Args:
+        errors: The errors of the failed try.
+        max_length: The maximum length of the summary.
+
+    Returns:
+        A single line summary of the errors.
+    """
+    lines = [line.strip() for line in errors.splitlines() if line.strip()]
+    important_lines = [
+        line for line in lines if re.search(r"error|failed|^E\s", line, re.IGNORECASE)
+    ]
+    summary = "; ".join(dict.fromkeys(important_lines or lines))
+    return summary if len(summary) <= max_length else f"{summary[: max_length - 3]}..."
+
+
 def _construct_prompt_with_error_msg(
     response: str,
     errors: str,
+    previous_errors: Optional[List[str]] = None,
 ) -> str:
     """Construct prompt message along with the error message.
 
@@ -248,6 +644,7 @@ def _construct_prompt_with_error_msg(
         prompt: The original prompt string.
         response: The invalid response string from OpenAI.
         errors: The errors which needs to be fixed in the invalid response.
+        previous_errors: Short summaries of the errors of the earlier tries which were removed from the conversation.
 
     Returns:
         A string combining the original prompt, invalid response, and the error message.
@@ -256,9 +653,138 @@ def _construct_prompt_with_error_msg(
         f"\n\n==== YOUR RESPONSE (WITH ISSUES) ====\n\n{response}"
         + f"\n\nRead the contents of ==== YOUR RESPONSE (WITH ISSUES) ==== section and fix the below mentioned issues:\n\n{errors}"
     )
+    if previous_errors:
+        previous_errors_str = "\n".join(f"- {e}" for e in previous_errors)
+        prompt_with_errors += f"\n\nYour earlier responses failed with the below issues, do not repeat them:\n\n{previous_errors_str}"
     return prompt_with_errors
 
-# %% ../../nbs/Chat.ipynb 17
+# %% ../../nbs/Chat.ipynb 30
+def _validate_candidate(
+    validate: Callable[..., Any],
+    response: str,
+    output_directory: str,
+    returns_response: bool,
+    kwargs: Dict[str, Any],
+) -> Tuple[List[str], str]:
+    if returns_response:
+        return validate(response, output_directory, **kwargs)  # type: ignore
+    return validate(response, output_directory, **kwargs), response
+
+
+def _run_candidate_validation(arguments_path: str, result_path: str) -> None:
+    """Validate a candidate in a separate process, the arguments and the result are pickled."""
+    # like multiprocessing, the parent's import path is restored before the validation function is unpickled
+    sys_path, arguments = pickle.loads(Path(arguments_path).read_bytes())
+    sys.path.extend(p for p in sys_path if p not in sys.path)
+    validate, response, output_directory, returns_response, kwargs = pickle.loads(arguments)
+    try:
+        with _set_cache_attempt(kwargs.get("attempt", 0)):
+            result = _validate_candidate(validate, response, output_directory, returns_response, kwargs)
+    except Exception as e:
+        result = ([f"{type(e).__name__}: {e}"], response)
+    tmp_path = Path(f"{result_path}.tmp")
+    tmp_path.write_bytes(pickle.dumps(result))
+    tmp_path.replace(result_path)
+
+
+def _read_candidate_result(process: subprocess.Popen, result_path: Path, log_path: Path, response: str) -> Tuple[List[str], str]:
+    # the output is passed on only now, so the output of the parallel candidates is not interleaved
+    sys.stdout.write(log_path.read_text(encoding="utf-8", errors="replace"))
+    if not result_path.exists():
+        return [f"The validation exited with code {process.returncode}"], response
+    return pickle.loads(result_path.read_bytes())  # type: ignore
+
+
+def _kill_candidate_validation(process: subprocess.Popen) -> None:
+    if platform.system() != "Windows":
+        try:
+            # the tests started by the validation are in the same process group
+            os.killpg(process.pid, signal.SIGKILL)
+        except ProcessLookupError:
+            pass
+    process.kill()
+    process.wait()
+
+
+def _validate_candidates(
+    validate: Callable[..., Any],
+    responses: List[str],
+    output_directory: str,
+    returns_response: bool,
+    **kwargs: Dict[str, Any],
+) -> Tuple[List[str], str]:
+    """Validate the candidate responses in parallel worker processes and pick the first one that passes.
+
+    Every candidate is validated in its own copy of the output directory by a separate Python process
+    which leads its own process group. As soon as one of them passes, the groups of the remaining ones
+    are killed, together with the tests they started. The directory of the picked candidate is copied
+    back to the output directory.
+
+    Args:
+        validate: The validation function.
+        responses: The candidate responses.
+        output_directory: The path to the output directory.
+        returns_response: True if the validation function returns a tuple with the errors and the response.
+        kwargs: Additional keyword arguments to be passed to the validation function.
+
+    Returns:
+        A tuple with the errors and the response of the first valid candidate. If none of the candidates
+        is valid, the errors and the response of the candidate with the fewest errors.
+    """
+    command = [
+        sys.executable,
+        "-c",
+        "import sys; from faststream_gen._code_generator.chat import _run_candidate_validation; _run_candidate_validation(*sys.argv[1:])",
+    ]
+    with TemporaryDirectory() as d:
+        candidate_dirs = [Path(d) / f"candidate_{j}" for j in range(len(responses))]
+        for candidate_dir in candidate_dirs:
+            shutil.copytree(
+                output_directory,
+                candidate_dir,
+                ignore=shutil.ignore_patterns(LOGS_DIR_NAME),
+            )
+
+        processes: List[subprocess.Popen] = []
+        candidates: Dict[int, Tuple[List[str], str]] = {}
+        try:
+            for j, (response, candidate_dir) in enumerate(zip(responses, candidate_dirs)):
+                arguments = (validate, response, str(candidate_dir), returns_response, kwargs)
+                (Path(d) / f"candidate_{j}.pkl").write_bytes(pickle.dumps((sys.path, pickle.dumps(arguments))))
+                with open(Path(d) / f"candidate_{j}.log", "wb") as log_file:
+                    # a new session makes the process the leader of a process group which can be killed at once
+                    processes.append(
+                        subprocess.Popen(  # nosec B603
+                            command + [str(Path(d) / f"candidate_{j}.pkl"), str(Path(d) / f"candidate_{j}.result")],
+                            stdout=log_file,
+                            stderr=subprocess.STDOUT,
+                            start_new_session=True,
+                            # the cache mode may have been set only in this process, e.g. by a command line option
+                            env={**os.environ, LLM_CACHE_MODE_ENV_VAR: get_llm_cache().mode.value},
+                        )
+                    )
+
+            while len(candidates) < len(responses) and all(len(errors) > 0 for errors, _ in candidates.values()):
+                finished = [j for j, process in enumerate(processes) if j not in candidates and process.poll() is not None]
+                for j in finished:
+                    candidates[j] = _read_candidate_result(
+                        processes[j], Path(d) / f"candidate_{j}.result", Path(d) / f"candidate_{j}.log", responses[j]
+                    )
+                if len(finished) == 0:
+                    time.sleep(0.1)
+        finally:
+            # the candidate directories are removed only after the processes using them are gone
+            for process in processes:
+                if process.poll() is None:
+                    _kill_candidate_validation(process)
+
+        picked = min(candidates, key=lambda j: (len(candidates[j][0]) > 0, len(candidates[j][0]), j))
+        if len(candidates[picked][0]) == 0:
+            logger.info(f"Candidate {picked + 1} of {len(responses)} passed the validation.")
+        shutil.copytree(candidate_dirs[picked], output_directory, dirs_exist_ok=True)
+        return candidates[picked]
+
+# %% ../../nbs/Chat.ipynb 33
 @patch  # type: ignore
 def fix(
     self: ValidateAndFixResponse,
@@ -282,14 +808,34 @@ def fix(
     """
     total_tokens_usage: Dict[str, int] = defaultdict(int)
     log_dir_path = Path(output_directory) / LOGS_DIR_NAME
+    # the index of the message with the original task
+    task_message_idx = len(self.generate.messages)  # type: ignore
+    previous_errors: List[str] = []
     for i in range(self.max_retries):  # type: ignore
-        response, usage = self.generate(prompt)
-        total_tokens_usage = add_tokens_usage([total_tokens_usage, usage])
-        
-        if step_name == STEP_LOG_DIR_NAMES["app"]:
-            errors, response = self.validate(response, output_directory, **kwargs)
+        if self.num_candidates > 1:
+            responses, usage = self.generate.sample(prompt, self.num_candidates)  # type: ignore
+            total_tokens_usage = add_tokens_usage([total_tokens_usage, usage])
+            errors, response = _validate_candidates(
+                self.validate,
+                responses,
+                output_directory,
+                step_name == STEP_LOG_DIR_NAMES["app"],
+                **kwargs,
+            )
         else:
-            errors = self.validate(response, output_directory, **kwargs)
+            try:
+                response, usage = self.generate(prompt)
+            except StreamAbortedError as e:
+                # the response was cancelled early, no need to validate it
+                total_tokens_usage = add_tokens_usage([total_tokens_usage, e.usage])
+                response, errors = e.response, e.errors
+            else:
+                total_tokens_usage = add_tokens_usage([total_tokens_usage, usage])
+
+                if step_name == STEP_LOG_DIR_NAMES["app"]:
+                    errors, response = self.validate(response, output_directory, **kwargs)
+                else:
+                    errors = self.validate(response, output_directory, **kwargs)
         error_str = "\n".join(errors)
         _save_log_results(
             step_name,
@@ -304,10 +850,15 @@ def fix(
             total_usage.append(total_tokens_usage)
             return total_usage
 
+        if self.compact_history:
+            # drop the previous fix requests, the latest response and errors are sent again below
+            del self.generate.messages[task_message_idx + 1 :]  # type: ignore
         self.generate.messages[-1]["content"] = self.generate.messages[-1][ # type: ignore
             "content"
         ].rsplit("==== YOUR RESPONSE ====", 1)[0]
-        prompt = _construct_prompt_with_error_msg(response, error_str)
+        prompt = _construct_prompt_with_error_msg(response, error_str, previous_errors)
+        if self.compact_history:
+            previous_errors.append(_summarize_errors(error_str))
         logger.info(f"Validation failed, trying again...Errors:\n{error_str}")
 
     total_usage.append(total_tokens_usage)
@@ -1,23 +1,42 @@
 # AUTOGENERATED! DO NOT EDIT! File to edit: ../../nbs/Constants.ipynb.
 
 # %% auto 0
-__all__ = ['APPLICATION_FILE_PATH', 'TEST_FILE_PATH', 'TOML_FILE_NAME', 'LOGS_DIR_NAME', 'STEP_LOG_DIR_NAMES', 'DEFAULT_PARAMS',
-           'MAX_RETRIES', 'MAX_RESTARTS', 'MAX_ASYNC_SPEC_RETRIES', 'TOKEN_TYPES', 'MODEL_PRICING',
+__all__ = ['APPLICATION_FILE_PATH', 'TEST_FILE_PATH', 'TOML_FILE_NAME', 'LOGS_DIR_NAME', 'CHECKPOINT_FILE_NAME',
+           'CHECKPOINT_FILES', 'STEP_LOG_DIR_NAMES', 'DEFAULT_PARAMS', 'MAX_RETRIES', 'MAX_RESTARTS',
+           'MAX_ASYNC_SPEC_RETRIES', 'MAX_CONCURRENT_REQUESTS', 'STREAM_CHECK_MAX_TOKENS',
+           'FIX_HISTORY_SUMMARY_MAX_LENGTH', 'OPENAI_EMBEDDING_MODEL', 'DESCRIPTION_VALIDATION_QUERY',
+           'EMBEDDING_BATCH_MAX_TOKENS', 'EMBEDDING_BATCH_MAX_SIZE', 'DOCS_CHUNK_MAX_TOKENS', 'TOKEN_ENCODING_NAME',
+           'TOKEN_ENCODING_LOAD_TIMEOUT_SECONDS', 'TOKEN_TYPES', 'MODEL_PRICING', 'MODEL_RATE_LIMITS',
            'OPENAI_KEY_EMPTY_ERROR', 'OPENAI_KEY_NOT_SET_ERROR', 'EMPTY_DESCRIPTION_ERROR', 'INCOMPLETE_DESCRIPTION',
            'DESCRIPTION_EXAMPLE', 'MAX_NUM_FIXES_MSG', 'INCOMPLETE_APP_ERROR_MSG', 'FASTSTREAM_GEN_REPO_ZIP_URL',
            'FASTSTREAM_GEN_EXAMPLES_DIR_SUFFIX', 'FASTSTREAM_REPO_ZIP_URL', 'FASTSTREAM_ROOT_DIR_NAME',
-           'FASTSTREAM_DOCS_DIR_SUFFIX', 'FASTSTREAM_EN_DOCS_DIR', 'FASTSTREAM_EXAMPLE_FILES',
-           'FASTSTREAM_TMP_DIR_PREFIX', 'FASTSTREAM_DIR_TO_EXCLUDE', 'STAT_0o775', 'FASTSTREAM_TEMPLATE_ZIP_URL',
-           'FASTSTREAM_TEMPLATE_DIR_SUFFIX', 'OpenAIModel']
+           'FASTSTREAM_DOCS_DIR_SUFFIX', 'FASTSTREAM_EN_DOCS_DIR', 'FASTSTREAM_DOCS_SRC_DIR',
+           'GITHUB_ARCHIVE_CHUNK_SIZE', 'FASTSTREAM_EXAMPLE_FILES', 'FASTSTREAM_TMP_DIR_PREFIX',
+           'FASTSTREAM_DIR_TO_EXCLUDE', 'VECTOR_STORE_VECTORS_FILE_NAME', 'VECTOR_STORE_DOCUMENTS_FILE_NAME',
+           'VECTOR_STORE_BM25_FILE_NAME', 'VECTOR_STORE_MANIFEST_FILE_NAME', 'BM25_K1', 'BM25_B',
+           'HYBRID_RETRIEVAL_VECTOR_WEIGHT', 'RETRIEVAL_MODE_ENV_VAR', 'STAT_0o775', 'FASTSTREAM_TEMPLATE_ZIP_URL',
+           'FASTSTREAM_TEMPLATE_DIR_SUFFIX', 'FASTSTREAM_GEN_CACHE_DIR', 'FASTSTREAM_GEN_OFFLINE_ENV_VAR',
+           'WHEELHOUSE_DIR_NAME', 'WHEELHOUSE_INDEX_FILE_NAME', 'VENV_POOL_DIR_NAME', 'VENV_POOL_MAX_IDLE',
+           'VENV_POOL_CLONE_MAX_AGE_HOURS', 'VENV_INSTALLED_REQUIREMENTS_FILE_NAME', 'VENV_POOL_BASE_REQUIREMENTS',
+           'LLM_CACHE_DIR_NAME', 'LLM_CACHE_MODE_ENV_VAR', 'LLM_CACHE_MAX_SIZE_BYTES', 'LLM_CACHE_MAX_AGE_SECONDS',
+           'RATE_LIMITER_DB_FILE_NAME', 'RATE_LIMITER_BURST_SECONDS', 'RATE_LIMITS_ENV_VAR',
+           'QUERY_EMBEDDINGS_CACHE_DIR_NAME', 'QUERY_EMBEDDINGS_CACHE_MAX_ENTRIES', 'QUERY_EMBEDDINGS_FILE_NAME',
+           'EMBEDDING_CHECKPOINTS_DIR_NAME', 'DESCRIPTION_VALIDATION_CONTEXT_FILE_NAME', 'TEMPLATE_CACHE_DIR_NAME',
+           'TEMPLATE_CACHE_MAX_AGE_SECONDS', 'TEMPLATE_ARCHIVE_FILE_NAME', 'OpenAIModel', 'RetrievalMode',
+           'LLMCacheMode']
 
 # %% ../../nbs/Constants.ipynb 1
+import os
 import stat
+from pathlib import Path
 
 # %% ../../nbs/Constants.ipynb 3
 APPLICATION_FILE_PATH = "app/application.py"
 TEST_FILE_PATH = "tests/test_application.py"
 TOML_FILE_NAME = "pyproject.toml"
 LOGS_DIR_NAME = "_faststream_gen_logs"
+CHECKPOINT_FILE_NAME = "checkpoint.json"
+CHECKPOINT_FILES = [APPLICATION_FILE_PATH, TEST_FILE_PATH, TOML_FILE_NAME]
 
 STEP_LOG_DIR_NAMES = {
     "skeleton": "app-skeleton-generation-logs",
@@ -33,6 +52,17 @@ DEFAULT_PARAMS = {
 MAX_RETRIES = 3
 MAX_RESTARTS = 3
 MAX_ASYNC_SPEC_RETRIES = 3
+MAX_CONCURRENT_REQUESTS = 4
+STREAM_CHECK_MAX_TOKENS = 50
+FIX_HISTORY_SUMMARY_MAX_LENGTH = 300
+
+OPENAI_EMBEDDING_MODEL = "text-embedding-ada-002"
+DESCRIPTION_VALIDATION_QUERY = "What is FastStream?"
+EMBEDDING_BATCH_MAX_TOKENS = 8000
+EMBEDDING_BATCH_MAX_SIZE = 100
+DOCS_CHUNK_MAX_TOKENS = 500
+TOKEN_ENCODING_NAME = "cl100k_base"
+TOKEN_ENCODING_LOAD_TIMEOUT_SECONDS = 10
 
 
 from enum import Enum
@@ -55,6 +85,22 @@ MODEL_PRICING = {
     },
 }
 
+# the limits of the lowest paid usage tier, higher tiers can raise them with FASTSTREAM_GEN_RATE_LIMITS
+MODEL_RATE_LIMITS = {
+    OpenAIModel.gpt4.value: {
+        "requests_per_minute": 200,
+        "tokens_per_minute": 40000
+    },
+    OpenAIModel.gpt3.value: {
+        "requests_per_minute": 3500,
+        "tokens_per_minute": 180000
+    },
+    OPENAI_EMBEDDING_MODEL: {
+        "requests_per_minute": 3000,
+        "tokens_per_minute": 1000000
+    },
+}
+
 # %% ../../nbs/Constants.ipynb 10
 OPENAI_KEY_EMPTY_ERROR = "Error: OPENAI_API_KEY cannot be empty. Please set a valid OpenAI API key in OPENAI_API_KEY environment variable and try again.\nYou can generate API keys in the OpenAI web interface. See https://platform.openai.com/account/api-keys for details."
 OPENAI_KEY_NOT_SET_ERROR = "Error: OPENAI_API_KEY not found in environment variables. Set a valid OpenAI API key in OPENAI_API_KEY environment variable and try again. You can generate API keys in the OpenAI web interface. See https://platform.openai.com/account/api-keys for details."
@@ -91,11 +137,30 @@ FASTSTREAM_REPO_ZIP_URL = "http://github.com/airtai/faststream/archive/main.zip"
 FASTSTREAM_ROOT_DIR_NAME = "faststream-main"
 FASTSTREAM_DOCS_DIR_SUFFIX = ".faststream_gen"
 FASTSTREAM_EN_DOCS_DIR = "docs/docs/en"
+FASTSTREAM_DOCS_SRC_DIR = "docs/docs_src"
+
+GITHUB_ARCHIVE_CHUNK_SIZE = 1024 * 1024
 
 FASTSTREAM_EXAMPLE_FILES = ['description.txt', 'app_skeleton.py', 'app.py', 'test_app.py']
 FASTSTREAM_TMP_DIR_PREFIX = "appended_examples"
 FASTSTREAM_DIR_TO_EXCLUDE = "api"
 
+VECTOR_STORE_VECTORS_FILE_NAME = "vectors.npy"
+VECTOR_STORE_DOCUMENTS_FILE_NAME = "documents.json"
+VECTOR_STORE_BM25_FILE_NAME = "bm25.json"
+VECTOR_STORE_MANIFEST_FILE_NAME = "manifest.json"
+
+BM25_K1 = 1.5
+BM25_B = 0.75
+HYBRID_RETRIEVAL_VECTOR_WEIGHT = 0.5
+RETRIEVAL_MODE_ENV_VAR = "FASTSTREAM_GEN_RETRIEVAL_MODE"
+
+
+class RetrievalMode(str, Enum):
+    vector = "vector"
+    lexical = "lexical"
+    hybrid = "hybrid"
+
 # %% ../../nbs/Constants.ipynb 13
 STAT_0o775 = ( stat.S_IRUSR | stat.S_IWUSR | stat.S_IXUSR
              | stat.S_IRGRP | stat.S_IWGRP | stat.S_IXGRP
@@ -105,3 +170,56 @@ STAT_0o775 = ( stat.S_IRUSR | stat.S_IWUSR | stat.S_IXUSR
 # %% ../../nbs/Constants.ipynb 15
 FASTSTREAM_TEMPLATE_ZIP_URL = "http://github.com/airtai/faststream-template/archive/main.zip"
 FASTSTREAM_TEMPLATE_DIR_SUFFIX = "faststream-template-main"
+
+# %% ../../nbs/Constants.ipynb 17
+FASTSTREAM_GEN_CACHE_DIR = Path(
+    os.environ.get("FASTSTREAM_GEN_CACHE_DIR", Path.home() / ".cache" / "faststream_gen")
+)
+FASTSTREAM_GEN_OFFLINE_ENV_VAR = "FASTSTREAM_GEN_OFFLINE"
+
+WHEELHOUSE_DIR_NAME = "wheelhouse"
+WHEELHOUSE_INDEX_FILE_NAME = "index.json"
+
+VENV_POOL_DIR_NAME = "venvs"
+VENV_POOL_MAX_IDLE = 2
+VENV_POOL_CLONE_MAX_AGE_HOURS = 24
+VENV_INSTALLED_REQUIREMENTS_FILE_NAME = ".faststream_gen_requirements.json"
+VENV_POOL_BASE_REQUIREMENTS = [
+    "faststream[kafka, rabbit, testing, docs]>=0.1.5",
+    "pytest==7.4.2",
+    "pytest-asyncio==0.21.1",
+    "black==23.9.1",
+    "ruff==0.0.291",
+    "pyupgrade-directories",
+    "types-PyYAML",
+    "types-setuptools",
+    "types-ujson",
+    "mypy==1.5.1",
+    "bandit==1.7.5",
+]
+
+LLM_CACHE_DIR_NAME = "llm-responses"
+LLM_CACHE_MODE_ENV_VAR = "FASTSTREAM_GEN_LLM_CACHE"
+LLM_CACHE_MAX_SIZE_BYTES = 512 * 1024 * 1024
+LLM_CACHE_MAX_AGE_SECONDS = 30 * 24 * 60 * 60
+
+RATE_LIMITER_DB_FILE_NAME = "rate-limits.sqlite"
+RATE_LIMITER_BURST_SECONDS = 10
+RATE_LIMITS_ENV_VAR = "FASTSTREAM_GEN_RATE_LIMITS"
+
+QUERY_EMBEDDINGS_CACHE_DIR_NAME = "query-embeddings"
+QUERY_EMBEDDINGS_CACHE_MAX_ENTRIES = 1000
+QUERY_EMBEDDINGS_FILE_NAME = "query_embeddings.json"
+EMBEDDING_CHECKPOINTS_DIR_NAME = "embedding-checkpoints"
+DESCRIPTION_VALIDATION_CONTEXT_FILE_NAME = "description_validation_context.txt"
+
+TEMPLATE_CACHE_DIR_NAME = "faststream-template"
+TEMPLATE_CACHE_MAX_AGE_SECONDS = 60 * 60
+TEMPLATE_ARCHIVE_FILE_NAME = "faststream-template.zip"
+
+
+class LLMCacheMode(str, Enum):
+    off = "off"
+    read_write = "read-write"
+    replay = "replay"
+    record = "record"
@@ -1,30 +1,31 @@
 # AUTOGENERATED! DO NOT EDIT! File to edit: ../../nbs/Helper.ipynb.
 
 # %% auto 0
-__all__ = ['logger', 'examples_delimiter', 'set_cwd', 'set_logger_level', 'retry_on_error', 'ensure_openai_api_key_set',
-           'add_tokens_usage', 'get_relevant_prompt_examples', 'strip_white_spaces', 'write_file_contents',
-           'read_file_contents', 'mock_openai_create', 'download_and_extract_github_repo', 'validate_python_code']
+__all__ = ['logger', 'examples_delimiter', 'set_cwd', 'run_async', 'set_logger_level', 'retry_on_error',
+           'ensure_openai_api_key_set', 'add_tokens_usage', 'load_vector_store', 'clear_vector_stores',
+           'get_relevant_prompt_examples', 'strip_white_spaces', 'write_file_contents', 'read_file_contents',
+           'mock_openai_create', 'download_and_extract_github_repo', 'validate_python_code']
 
 # %% ../../nbs/Helper.ipynb 1
 from typing import *
 import os
 import re
+import asyncio
+import concurrent.futures
 import functools
 import logging
 from collections import defaultdict
-from tempfile import TemporaryDirectory
+from tempfile import TemporaryDirectory, TemporaryFile
 from pathlib import Path
 from contextlib import contextmanager
 import unittest.mock
 import zipfile
 import importlib.util
 import time
+import threading
 
 import typer
 import requests
-from langchain.schema.document import Document
-from langchain.embeddings import OpenAIEmbeddings
-from langchain.vectorstores import FAISS
 
 from .._components.logger import get_logger, set_level
 from .._components.logger import suppress_timestamps
@@ -35,8 +36,13 @@ from faststream_gen._code_generator.constants import (
     MAX_RESTARTS,
     MAX_RETRIES,
     STEP_LOG_DIR_NAMES,
+    RetrievalMode,
+    GITHUB_ARCHIVE_CHUNK_SIZE,
 )
 from .._components.package_data import get_root_data_path
+from .llm_cache import _set_cache_attempt
+from .query_embeddings import CachedQueryEmbeddings
+from .vector_store import VectorStore
 
 # %% ../../nbs/Helper.ipynb 3
 logger = get_logger(__name__, level=logging.WARNING)
@@ -63,6 +69,27 @@ def set_cwd(cwd_path: Union[Path, str]) -> Generator:
         os.chdir(original_cwd)
 
 # %% ../../nbs/Helper.ipynb 7
+def run_async(coro: Coroutine[Any, Any, Any]) -> Any:
+    """Run a coroutine to completion from synchronous code.
+
+    If an event loop is already running in the current thread (e.g. inside Jupyter),
+    the coroutine is run in a new event loop in a separate thread.
+
+    Args:
+        coro: The coroutine to run.
+
+    Returns:
+        The result of the coroutine.
+    """
+    try:
+        asyncio.get_running_loop()
+    except RuntimeError:
+        return asyncio.run(coro)
+
+    with concurrent.futures.ThreadPoolExecutor(max_workers=1) as executor:
+        return executor.submit(asyncio.run, coro).result()
+
+# %% ../../nbs/Helper.ipynb 9
 def set_logger_level(func: Callable[..., Any]) -> Callable[..., Any]:
     """Decorator to set the logger level based on verbosity.
 
@@ -83,14 +110,15 @@ def set_logger_level(func: Callable[..., Any]) -> Callable[..., Any]:
 
     return wrapper_decorator
 
-# %% ../../nbs/Helper.ipynb 10
+# %% ../../nbs/Helper.ipynb 12
 def retry_on_error(max_retries: int = MAX_RESTARTS, delay: int = 1):  # type: ignore
     def decorator(func):  # type: ignore
         def wrapper(*args, **kwargs):  # type: ignore
             for i in range(max_retries):
                 try:
                     kwargs["attempt"] = i
-                    return func(*args, **kwargs)
+                    with _set_cache_attempt(i):
+                        return func(*args, **kwargs)
                 except ValueError as e:
                     # Log the error here
                     logger.info(f"Attempt {i} failed. Restarting step.")
@@ -102,7 +130,7 @@ def retry_on_error(max_retries: int = MAX_RESTARTS, delay: int = 1):  # type: ig
 
     return decorator
 
-# %% ../../nbs/Helper.ipynb 13
+# %% ../../nbs/Helper.ipynb 16
 def ensure_openai_api_key_set() -> None:
     """Ensure the 'OPENAI_API_KEY' environment variable is set and is not empty.
 
@@ -117,7 +145,7 @@ def ensure_openai_api_key_set() -> None:
     except KeyError:
         raise KeyError(OPENAI_KEY_NOT_SET_ERROR)
 
-# %% ../../nbs/Helper.ipynb 17
+# %% ../../nbs/Helper.ipynb 20
 def add_tokens_usage(usage_list: List[Dict[str, int]]) -> Dict[str, int]:
     """Add list of OpenAI "usage" dictionaries by categories defined in TOKEN_TYPES (prompt_tokens, completion_tokens and total_tokens).
 
@@ -135,7 +163,7 @@ def add_tokens_usage(usage_list: List[Dict[str, int]]) -> Dict[str, int]:
             
     return added_tokens
 
-# %% ../../nbs/Helper.ipynb 20
+# %% ../../nbs/Helper.ipynb 23
 examples_delimiter = {
     "description": {
         "start": "==== description.txt starts ====",
@@ -185,24 +213,65 @@ def _format_examples(parent_docs_str: List[str]) -> Dict[str, str]:
 
     return ret_val
 
-# %% ../../nbs/Helper.ipynb 22
-def get_relevant_prompt_examples(query: str) -> Dict[str, str]:
+# %% ../../nbs/Helper.ipynb 25
+_vector_stores: Dict[Path, Tuple[Tuple[Tuple[str, int], ...], VectorStore]] = {}
+_vector_stores_lock = threading.Lock()
+
+
+def _get_db_version(db_path: Path) -> Tuple[Tuple[str, int], ...]:
+    return tuple(sorted((p.name, p.stat().st_mtime_ns) for p in db_path.iterdir()))
+
+
+def load_vector_store(db_path: Union[str, Path]) -> VectorStore:
+    """Load the vector database once per process.
+
+    Loaded databases are kept in memory keyed by the database path and reloaded when the
+    modification time of any of its files changes.
+
+    Args:
+        db_path: The path to the directory with the vector database.
+
+    Returns:
+        The loaded vector database.
+    """
+    db_path = Path(db_path).resolve()
+    version = _get_db_version(db_path)
+    with _vector_stores_lock:
+        if db_path not in _vector_stores or _vector_stores[db_path][0] != version:
+            logger.info(f"Loading the vector database from '{db_path}'.")
+            _vector_stores[db_path] = (
+                version,
+                VectorStore.load_local(db_path, CachedQueryEmbeddings()),
+            )
+        return _vector_stores[db_path][1]
+
+
+def clear_vector_stores() -> None:
+    """Remove all loaded vector databases from memory."""
+    with _vector_stores_lock:
+        _vector_stores.clear()
+
+# %% ../../nbs/Helper.ipynb 27
+def get_relevant_prompt_examples(
+    query: str, mode: RetrievalMode = RetrievalMode.vector
+) -> Dict[str, str]:
     """Load the vector database and retrieve the most relevant examples based on the given query for each step.
 
     Args:
         query: The query for relevance-based document retrieval.
+        mode: Retrieve by the embeddings, by BM25 which works offline, or by both scores fused.
 
     Returns:
         The dictionary of the most relevant examples for each step.
     """
-    db_path = get_root_data_path() / "examples"
-    db = FAISS.load_local(db_path, OpenAIEmbeddings())
-    results = db.similarity_search(query, k=3, fetch_k=5)
-    results_page_content = [r.page_content for r in results]
+    db = load_vector_store(get_root_data_path() / "examples")
+    results = db.similarity_search(query, k=3, mode=mode)
+    # only the descriptions are embedded, the full examples are stored in the metadata
+    results_page_content = [r.metadata.get("example", r.page_content) for r in results]
     prompt_examples = _format_examples(results_page_content)
     return prompt_examples
 
-# %% ../../nbs/Helper.ipynb 24
+# %% ../../nbs/Helper.ipynb 30
 def strip_white_spaces(description: str) -> str:
     """Remove and strip excess whitespaces from a given description
 
@@ -215,7 +284,7 @@ def strip_white_spaces(description: str) -> str:
     pattern = re.compile(r"\s+")
     return pattern.sub(" ", description).strip()
 
-# %% ../../nbs/Helper.ipynb 26
+# %% ../../nbs/Helper.ipynb 32
 def write_file_contents(output_file: str, contents: str) -> None:
     """Write the given contents to the specified output file.
 
@@ -237,7 +306,7 @@ def write_file_contents(output_file: str, contents: str) -> None:
             f"Error: Failed to save file at '{output_file}' due to: '{e}'. Please ensure that the specified 'output_path' is valid and that you have the necessary permissions to write files to it."
         )
 
-# %% ../../nbs/Helper.ipynb 28
+# %% ../../nbs/Helper.ipynb 34
 def read_file_contents(output_file: str) -> str:
     """Read and return the contents from the specified file.
 
@@ -259,7 +328,17 @@ def read_file_contents(output_file: str) -> str:
             f"Error: The file '{output_file}' does not exist. Please ensure that the specified 'output_path' is valid and that you have the necessary permissions to access it."
         )
 
-# %% ../../nbs/Helper.ipynb 31
+# %% ../../nbs/Helper.ipynb 37
+def _mock_openai_stream(test_response: str) -> Generator[Dict[str, Any], None, None]:
+    for i in range(0, len(test_response), 4):
+        yield {"choices": [{"delta": {"content": test_response[i : i + 4]}}]}
+
+
+async def _amock_openai_stream(test_response: str) -> AsyncGenerator[Dict[str, Any], None]:
+    for chunk in _mock_openai_stream(test_response):
+        yield chunk
+
+
 @contextmanager
 def mock_openai_create(test_response: str) -> Generator[None, None, None]:
     mock_choices = {
@@ -272,15 +351,23 @@ def mock_openai_create(test_response: str) -> Generator[None, None, None]:
     }
 
     with unittest.mock.patch("openai.ChatCompletion") as mock:
-        mock.create.return_value = mock_choices
+        mock.create.side_effect = lambda **kwargs: (
+            _mock_openai_stream(test_response) if kwargs.get("stream") else mock_choices
+        )
+        mock.acreate = unittest.mock.AsyncMock(
+            side_effect=lambda **kwargs: (
+                _amock_openai_stream(test_response) if kwargs.get("stream") else mock_choices
+            )
+        )
         yield
 
-# %% ../../nbs/Helper.ipynb 33
-def _fetch_content(url: str) -> requests.models.Response: # type: ignore
+# %% ../../nbs/Helper.ipynb 39
+def _fetch_content(url: str, stream: bool = False) -> requests.models.Response: # type: ignore
     """Fetch content from a URL using an HTTP GET request.
 
     Args:
         url (str): The URL to fetch content from.
+        stream (bool): If True, the content is not downloaded until it is read from the response.
 
     Returns:
         Response: The response object containing the content and HTTP status.
@@ -292,7 +379,7 @@ def _fetch_content(url: str) -> requests.models.Response: # type: ignore
     attempt = 0
     while attempt < 4:
         try:
-            response = requests.get(url, timeout=50)
+            response = requests.get(url, timeout=50, stream=stream)
             response.raise_for_status()  # Raises an exception for HTTP errors
             return response
         except requests.exceptions.Timeout:
@@ -305,23 +392,77 @@ def _fetch_content(url: str) -> requests.models.Response: # type: ignore
         except requests.exceptions.RequestException as e:
             raise requests.exceptions.RequestException(f"An error occurred: {e}")
 
-# %% ../../nbs/Helper.ipynb 35
+# %% ../../nbs/Helper.ipynb 41
+def _get_prefix_filter(prefixes: List[str]) -> Callable[[str], bool]:
+    """Create a predicate which selects the archive members inside the given directories.
+
+    Args:
+        prefixes: The directories to select, including the root directory of the archive.
+
+    Returns:
+        The predicate which returns True for the members inside one of the directories.
+    """
+    prefixes = [p.rstrip("/") + "/" for p in prefixes]
+    return lambda name: any(name.startswith(p) for p in prefixes)
+
+
+def _extract_members(
+    zip_ref: zipfile.ZipFile,
+    output_path: Path,
+    include: Optional[Callable[[str], bool]] = None,
+    max_workers: int = 1,
+) -> None:
+    members = [
+        m for m in zip_ref.infolist() if include is None or include(m.filename)
+    ]
+    files = [m for m in members if not m.is_dir()]
+
+    # directories are created upfront, so the parallel extraction doesn't race on them
+    for m in members:
+        target = output_path / m.filename
+        (target if m.is_dir() else target.parent).mkdir(parents=True, exist_ok=True)
+
+    if max_workers > 1:
+        # ZipFile serializes the reads from the archive, decompression runs in parallel
+        with concurrent.futures.ThreadPoolExecutor(max_workers=max_workers) as executor:
+            list(executor.map(lambda m: zip_ref.extract(m, output_path), files))
+    else:
+        for m in files:
+            zip_ref.extract(m, output_path)
+
+
 @contextmanager
-def download_and_extract_github_repo(url: str) -> Generator[Path, None, None]:
+def download_and_extract_github_repo(
+    url: str,
+    include: Optional[Callable[[str], bool]] = None,
+    max_workers: int = 1,
+) -> Generator[Path, None, None]:
+    """Download the repository archive and extract it into a temporary directory.
+
+    The archive is streamed into a temporary file instead of being held in memory.
+
+    Args:
+        url: The URL of the repository zip archive.
+        include: The predicate which selects the archive members to extract. All members are extracted if not passed.
+        max_workers: The number of threads extracting the members.
+
+    Yields:
+        The path to the directory with the extracted files.
+    """
     with TemporaryDirectory() as d:
         try:
-            input_path = Path(f"{d}/archive.zip")
             extrated_path = Path(f"{d}/extrated_path")
             extrated_path.mkdir(parents=True, exist_ok=True)
 
-            response = _fetch_content(url)
+            # zipfile needs a seekable file, which SpooledTemporaryFile is not before Python 3.11
+            with TemporaryFile(dir=d) as f:
+                with _fetch_content(url, stream=True) as response:
+                    for chunk in response.iter_content(chunk_size=GITHUB_ARCHIVE_CHUNK_SIZE):
+                        f.write(chunk)
 
-            with open(input_path, "wb") as f:
-                f.write(response.content)
-
-            with zipfile.ZipFile(input_path, "r") as zip_ref:
-                for member in zip_ref.namelist():
-                    zip_ref.extract(member, extrated_path)
+                f.seek(0)
+                with zipfile.ZipFile(f, "r") as zip_ref:
+                    _extract_members(zip_ref, extrated_path, include, max_workers)
 
             yield extrated_path
 
@@ -330,7 +471,7 @@ def download_and_extract_github_repo(url: str) -> Generator[Path, None, None]:
             typer.secho(f"Unexpected internal error: {e}", err=True, fg=fg)
             raise typer.Exit(code=1)
 
-# %% ../../nbs/Helper.ipynb 37
+# %% ../../nbs/Helper.ipynb 44
 def validate_python_code(file_name: str, **kwargs: Dict[str, Any]) -> List[str]:
     """Validate and report errors in the provided Python code.
 
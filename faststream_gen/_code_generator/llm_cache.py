@@ -0,0 +1,248 @@
+# AUTOGENERATED! DO NOT EDIT! File to edit: ../../nbs/LLM_Cache.ipynb.
+
+# %% auto 0
+__all__ = ['logger', 'LLMResponseCache', 'get_llm_cache']
+
+# %% ../../nbs/LLM_Cache.ipynb 1
+from typing import *
+import os
+import json
+import time
+import uuid
+import hashlib
+import threading
+import contextvars
+from pathlib import Path
+from contextlib import contextmanager
+
+from .._components.logger import get_logger
+from faststream_gen._code_generator.constants import (
+    FASTSTREAM_GEN_CACHE_DIR,
+    LLM_CACHE_DIR_NAME,
+    LLM_CACHE_MODE_ENV_VAR,
+    LLM_CACHE_MAX_SIZE_BYTES,
+    LLM_CACHE_MAX_AGE_SECONDS,
+    LLMCacheMode,
+)
+
+# %% ../../nbs/LLM_Cache.ipynb 3
+logger = get_logger(__name__)
+
+# %% ../../nbs/LLM_Cache.ipynb 4
+_cache_attempt: "contextvars.ContextVar[int]" = contextvars.ContextVar("_cache_attempt", default=0)
+
+
+@contextmanager
+def _set_cache_attempt(attempt: int) -> Generator[None, None, None]:
+    """Make the requests sent within the context manager part of the given attempt of the step.
+
+    A restarted step sends the same requests as the failed attempt, so the attempt is a
+    part of the cache key. Otherwise, the restart would replay the failing responses.
+
+    Args:
+        attempt: The zero-based attempt of the step.
+    """
+    token = _cache_attempt.set(attempt)
+    try:
+        yield
+    finally:
+        _cache_attempt.reset(token)
+
+
+def _get_cache_key(model: str, params: Dict[str, Any], messages: List[Dict[str, str]]) -> str:
+    """Return the content hash of the chat completion request.
+
+    Args:
+        model: The OpenAI model.
+        params: The parameters of the request, such as temperature.
+        messages: The list of messages sent to the model.
+
+    Returns:
+        The SHA-256 hex digest of the request.
+    """
+    attempt = _cache_attempt.get()
+    if attempt > 0:
+        params = {**params, "attempt": attempt}
+    request = json.dumps(
+        {"model": model, "params": params, "messages": messages},
+        sort_keys=True,
+        ensure_ascii=False,
+    )
+    return hashlib.sha256(request.encode("utf-8")).hexdigest()
+
+# %% ../../nbs/LLM_Cache.ipynb 6
+def _evict_files(
+    paths: Iterable[Path],
+    max_size_bytes: Optional[int] = None,
+    max_entries: Optional[int] = None,
+    max_age_seconds: Optional[int] = None,
+) -> Tuple[int, int]:
+    """Delete the least recently modified files until the remaining ones are within the limits.
+
+    The files may be deleted at the same time by another process sharing the cache
+    directory, so the files which vanish in the meantime are skipped.
+
+    Args:
+        paths: The files to evict from.
+        max_size_bytes: The maximum total size of the remaining files.
+        max_entries: The maximum number of the remaining files.
+        max_age_seconds: The maximum age of the remaining files.
+
+    Returns:
+        The number and the total size of the remaining files.
+    """
+    entries = []
+    for p in paths:
+        try:
+            stat = p.stat()
+        except FileNotFoundError:
+            continue
+        entries.append((stat.st_mtime, stat.st_size, p))
+    entries.sort(key=lambda x: x[0])
+
+    num_entries = len(entries)
+    total_size = sum(size for _, size, _ in entries)
+    now = time.time()
+    for mtime, size, p in entries:
+        if (
+            (max_size_bytes is None or total_size <= max_size_bytes)
+            and (max_entries is None or num_entries <= max_entries)
+            and (max_age_seconds is None or now - mtime <= max_age_seconds)
+        ):
+            continue
+        p.unlink(missing_ok=True)
+        num_entries -= 1
+        total_size -= size
+    return num_entries, total_size
+
+# %% ../../nbs/LLM_Cache.ipynb 8
+class LLMResponseCache:
+    """An on-disk cache of the OpenAI chat completion responses.
+
+    Responses are stored as JSON files named by the content hash of the request.
+    Entries older than max_age_seconds are dropped on read and the least recently
+    used entries are evicted when the estimated total size exceeds max_size_bytes.
+    The directory may be shared by several processes, each of them evicting entries.
+
+    Attributes:
+        root_path: The directory where the responses are stored.
+        mode: off disables the cache, read-write reads and stores responses, replay only reads
+            and fails on a cache miss, record always calls the API and stores the responses.
+        max_size_bytes: The maximum total size of the cached responses.
+        max_age_seconds: The maximum age of a cached response.
+    """
+
+    def __init__(
+        self,
+        root_path: Optional[Union[str, Path]] = None,
+        mode: Optional[LLMCacheMode] = None,
+        max_size_bytes: int = LLM_CACHE_MAX_SIZE_BYTES,
+        max_age_seconds: int = LLM_CACHE_MAX_AGE_SECONDS,
+    ):
+        """Instantiates a new LLMResponseCache object.
+
+        Args:
+            root_path: The directory where the responses are stored. Defaults to the faststream-gen cache directory.
+            mode: The cache mode. If not passed, it is read from the FASTSTREAM_GEN_LLM_CACHE environment variable.
+            max_size_bytes: The maximum total size of the cached responses.
+            max_age_seconds: The maximum age of a cached response.
+        """
+        self.root_path = Path(
+            root_path
+            if root_path is not None
+            else FASTSTREAM_GEN_CACHE_DIR / LLM_CACHE_DIR_NAME
+        )
+        self.mode = (
+            mode
+            if mode is not None
+            else LLMCacheMode(os.environ.get(LLM_CACHE_MODE_ENV_VAR) or LLMCacheMode.off.value)
+        )
+        self.max_size_bytes = max_size_bytes
+        self.max_age_seconds = max_age_seconds
+        self._lock = threading.Lock()
+        # the directory is scanned only when the estimate crosses max_size_bytes
+        self._size_estimate: Optional[int] = None
+
+    def _get_path(self, key: str) -> Path:
+        return self.root_path / key[:2] / f"{key}.json"
+
+    def get(self, key: str) -> Optional[Dict[str, Any]]:
+        """Return the cached response for the key.
+
+        Args:
+            key: The content hash of the request.
+
+        Returns:
+            The cached response or None if the cache is not read in the current mode or the response is not cached.
+
+        Raises:
+            KeyError: If the response is not cached in replay mode.
+        """
+        if self.mode in [LLMCacheMode.off, LLMCacheMode.record]:
+            return None
+
+        path = self._get_path(key)
+        with self._lock:
+            response = self._read(path)
+        if response is None and self.mode == LLMCacheMode.replay:
+            raise KeyError(
+                f"Error: The response for the request '{key}' was not found in the LLM cache at '{self.root_path}'. Run the command with the '{LLMCacheMode.read_write.value}' or '{LLMCacheMode.record.value}' cache mode to store it."
+            )
+        return response
+
+    def _read(self, path: Path) -> Optional[Dict[str, Any]]:
+        try:
+            if time.time() - path.stat().st_mtime > self.max_age_seconds:
+                path.unlink(missing_ok=True)
+                return None
+
+            # refresh the modification time, so the least recently used entries are evicted first
+            os.utime(path)
+            return json.loads(path.read_text(encoding="utf-8"))  # type: ignore
+        except FileNotFoundError:
+            # evicted by another process sharing the cache directory
+            return None
+
+    def set(self, key: str, response: Dict[str, Any]) -> None:
+        """Store the response for the key.
+
+        Args:
+            key: The content hash of the request.
+            response: The response from the OpenAI API.
+        """
+        if self.mode in [LLMCacheMode.off, LLMCacheMode.replay]:
+            return
+
+        path = self._get_path(key)
+        with self._lock:
+            path.parent.mkdir(parents=True, exist_ok=True)
+            tmp_path = path.with_name(f"{path.name}.{uuid.uuid4().hex}.tmp")
+            tmp_path.write_text(json.dumps(response), encoding="utf-8")
+            size = tmp_path.stat().st_size
+            os.replace(tmp_path, path)
+            if self._size_estimate is None or self._size_estimate + size > self.max_size_bytes:
+                self._evict()
+            else:
+                self._size_estimate += size
+
+    def _evict(self) -> None:
+        _, self._size_estimate = _evict_files(
+            self.root_path.glob("*/*.json"),
+            max_size_bytes=self.max_size_bytes,
+            max_age_seconds=self.max_age_seconds,
+        )
+
+# %% ../../nbs/LLM_Cache.ipynb 13
+_llm_cache: Optional[LLMResponseCache] = None
+
+
+def get_llm_cache() -> LLMResponseCache:
+    """Return the process-wide LLM response cache.
+
+    Returns:
+        The shared LLMResponseCache instance.
+    """
+    global _llm_cache
+    if _llm_cache is None:
+        _llm_cache = LLMResponseCache()
+    return _llm_cache
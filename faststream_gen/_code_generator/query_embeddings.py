@@ -0,0 +1,244 @@
+# AUTOGENERATED! DO NOT EDIT! File to edit: ../../nbs/Query_Embeddings.ipynb.
+
+# %% auto 0
+__all__ = ['logger', 'save_precomputed_query_embeddings', 'QueryEmbeddingCache', 'get_query_embedding_cache',
+           'CachedQueryEmbeddings']
+
+# %% ../../nbs/Query_Embeddings.ipynb 1
+from typing import *
+import os
+import json
+import uuid
+import hashlib
+import threading
+from pathlib import Path
+
+from .._components.logger import get_logger
+from .._components.package_data import get_root_data_path
+from .vector_store import Embeddings
+from .llm_cache import _evict_files
+from faststream_gen._code_generator.constants import (
+    FASTSTREAM_GEN_CACHE_DIR,
+    OPENAI_EMBEDDING_MODEL,
+    DESCRIPTION_VALIDATION_QUERY,
+    QUERY_EMBEDDINGS_CACHE_DIR_NAME,
+    QUERY_EMBEDDINGS_CACHE_MAX_ENTRIES,
+    QUERY_EMBEDDINGS_FILE_NAME,
+)
+
+# %% ../../nbs/Query_Embeddings.ipynb 3
+logger = get_logger(__name__)
+
+# %% ../../nbs/Query_Embeddings.ipynb 4
+def _get_query_key(model: str, text: str) -> str:
+    """Return the content hash of the embedding request.
+
+    Args:
+        model: The OpenAI embedding model.
+        text: The query text.
+
+    Returns:
+        The SHA-256 hex digest of the request.
+    """
+    request = json.dumps({"model": model, "text": text}, sort_keys=True, ensure_ascii=False)
+    return hashlib.sha256(request.encode("utf-8")).hexdigest()
+
+# %% ../../nbs/Query_Embeddings.ipynb 6
+def _read_precomputed_query_embeddings(path: Path) -> Dict[str, List[float]]:
+    if not path.exists():
+        return {}
+    entries = json.loads(path.read_text(encoding="utf-8"))
+    return {_get_query_key(e["model"], e["text"]): e["embedding"] for e in entries}
+
+
+def _create_openai_embeddings(model: str) -> Embeddings:
+    # langchain takes seconds to import, so it is imported only when the OpenAI API is actually needed
+    from langchain.embeddings import OpenAIEmbeddings
+
+    return OpenAIEmbeddings(model=model)  # type: ignore
+
+
+def save_precomputed_query_embeddings(
+    queries: List[str],
+    path: Union[str, Path],
+    embeddings: Optional[Embeddings] = None,
+    model: str = OPENAI_EMBEDDING_MODEL,
+) -> None:
+    """Embed the queries and save them to a JSON file shipped with the package data.
+
+    Queries already saved in the file with the same model are not embedded again.
+
+    Args:
+        queries: The queries to embed.
+        path: The path of the JSON file.
+        embeddings: The embeddings used for the queries. Defaults to the OpenAI embeddings.
+        model: The name of the embedding model the vectors were created with.
+    """
+    path = Path(path)
+    saved = _read_precomputed_query_embeddings(path)
+    missing = [q for q in queries if _get_query_key(model, q) not in saved]
+    if len(missing) > 0:
+        if embeddings is None:
+            embeddings = _create_openai_embeddings(model)
+        for query, embedding in zip(missing, embeddings.embed_documents(missing)):
+            saved[_get_query_key(model, query)] = embedding
+
+    entries = [
+        {"model": model, "text": query, "embedding": saved[_get_query_key(model, query)]}
+        for query in queries
+    ]
+    path.parent.mkdir(parents=True, exist_ok=True)
+    path.write_text(json.dumps(entries), encoding="utf-8")
+
+# %% ../../nbs/Query_Embeddings.ipynb 8
+class QueryEmbeddingCache:
+    """An on-disk cache of the query embeddings.
+
+    Embeddings precomputed when the vector databases are built are read from the
+    package data. All other embeddings are stored as JSON files named by the content
+    hash of the request and the least recently used ones are evicted when there are
+    more than max_entries of them.
+
+    Attributes:
+        root_path: The directory where the embeddings are stored.
+        precomputed_path: The JSON file with the precomputed embeddings.
+        max_entries: The maximum number of cached embeddings.
+    """
+
+    def __init__(
+        self,
+        root_path: Optional[Union[str, Path]] = None,
+        precomputed_path: Optional[Union[str, Path]] = None,
+        max_entries: int = QUERY_EMBEDDINGS_CACHE_MAX_ENTRIES,
+    ):
+        """Instantiates a new QueryEmbeddingCache object.
+
+        Args:
+            root_path: The directory where the embeddings are stored. Defaults to the faststream-gen cache directory.
+            precomputed_path: The JSON file with the precomputed embeddings. Defaults to the one in the package data.
+            max_entries: The maximum number of cached embeddings.
+        """
+        self.root_path = Path(
+            root_path
+            if root_path is not None
+            else FASTSTREAM_GEN_CACHE_DIR / QUERY_EMBEDDINGS_CACHE_DIR_NAME
+        )
+        self.precomputed_path = Path(
+            precomputed_path
+            if precomputed_path is not None
+            else get_root_data_path() / QUERY_EMBEDDINGS_FILE_NAME
+        )
+        self.max_entries = max_entries
+        self._precomputed: Optional[Dict[str, List[float]]] = None
+        self._lock = threading.Lock()
+        # the directory is scanned only when the estimate crosses max_entries
+        self._num_entries_estimate: Optional[int] = None
+
+    def _get_path(self, key: str) -> Path:
+        return self.root_path / key[:2] / f"{key}.json"
+
+    def get(self, key: str) -> Optional[List[float]]:
+        """Return the cached embedding for the key.
+
+        Args:
+            key: The content hash of the request.
+
+        Returns:
+            The cached embedding or None if it is not cached.
+        """
+        with self._lock:
+            if self._precomputed is None:
+                self._precomputed = _read_precomputed_query_embeddings(self.precomputed_path)
+            if key in self._precomputed:
+                return self._precomputed[key]
+
+            path = self._get_path(key)
+            try:
+                # refresh the modification time, so the least recently used entries are evicted first
+                os.utime(path)
+                return json.loads(path.read_text(encoding="utf-8"))  # type: ignore
+            except FileNotFoundError:
+                # not cached or evicted by another process sharing the cache directory
+                return None
+
+    def set(self, key: str, embedding: List[float]) -> None:
+        """Store the embedding for the key.
+
+        Args:
+            key: The content hash of the request.
+            embedding: The embedding of the query.
+        """
+        path = self._get_path(key)
+        with self._lock:
+            path.parent.mkdir(parents=True, exist_ok=True)
+            tmp_path = path.with_name(f"{path.name}.{uuid.uuid4().hex}.tmp")
+            tmp_path.write_text(json.dumps(embedding), encoding="utf-8")
+            os.replace(tmp_path, path)
+            if self._num_entries_estimate is None or self._num_entries_estimate >= self.max_entries:
+                self._evict()
+            else:
+                self._num_entries_estimate += 1
+
+    def _evict(self) -> None:
+        self._num_entries_estimate, _ = _evict_files(
+            self.root_path.glob("*/*.json"), max_entries=self.max_entries
+        )
+
+# %% ../../nbs/Query_Embeddings.ipynb 10
+_query_embedding_cache: Optional[QueryEmbeddingCache] = None
+
+
+def get_query_embedding_cache() -> QueryEmbeddingCache:
+    """Return the process-wide query embedding cache.
+
+    Returns:
+        The shared QueryEmbeddingCache instance.
+    """
+    global _query_embedding_cache
+    if _query_embedding_cache is None:
+        _query_embedding_cache = QueryEmbeddingCache()
+    return _query_embedding_cache
+
+# %% ../../nbs/Query_Embeddings.ipynb 12
+class CachedQueryEmbeddings:
+    """OpenAI embeddings with the query embeddings served from the on-disk cache.
+
+    The OpenAI client is created only on a cache miss, so the cached queries
+    don't need an API key at all.
+
+    Attributes:
+        model: The OpenAI embedding model.
+        cache: The query embedding cache.
+    """
+
+    def __init__(
+        self,
+        model: str = OPENAI_EMBEDDING_MODEL,
+        cache: Optional[QueryEmbeddingCache] = None,
+    ):
+        """Instantiates a new CachedQueryEmbeddings object.
+
+        Args:
+            model: The OpenAI embedding model.
+            cache: The query embedding cache. Defaults to the process-wide one.
+        """
+        self.model = model
+        self.cache = cache if cache is not None else get_query_embedding_cache()
+        self._embeddings: Optional[Embeddings] = None
+
+    @property
+    def embeddings(self) -> Embeddings:
+        if self._embeddings is None:
+            self._embeddings = _create_openai_embeddings(self.model)
+        return self._embeddings
+
+    def embed_documents(self, texts: List[str]) -> List[List[float]]:
+        return self.embeddings.embed_documents(texts)
+
+    def embed_query(self, text: str) -> List[float]:
+        key = _get_query_key(self.model, text)
+        embedding = self.cache.get(key)
+        if embedding is None:
+            embedding = self.embeddings.embed_query(text)
+            self.cache.set(key, embedding)
+        return embedding
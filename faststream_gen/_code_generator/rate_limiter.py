@@ -0,0 +1,261 @@
+# AUTOGENERATED! DO NOT EDIT! File to edit: ../../nbs/Rate_Limiter.ipynb.
+
+# %% auto 0
+__all__ = ['logger', 'RateLimiter', 'get_rate_limiter']
+
+# %% ../../nbs/Rate_Limiter.ipynb 1
+from typing import *
+import os
+import json
+import time
+import asyncio
+import functools
+import hashlib
+import sqlite3
+from pathlib import Path
+
+import openai
+
+from .._components.logger import get_logger
+from faststream_gen._code_generator.constants import (
+    FASTSTREAM_GEN_CACHE_DIR,
+    RATE_LIMITER_DB_FILE_NAME,
+    MODEL_RATE_LIMITS,
+    RATE_LIMITER_BURST_SECONDS,
+    RATE_LIMITS_ENV_VAR,
+)
+
+# %% ../../nbs/Rate_Limiter.ipynb 3
+logger = get_logger(__name__)
+
+# %% ../../nbs/Rate_Limiter.ipynb 4
+def _get_bucket_key(api_key: str, model: str) -> str:
+    return hashlib.sha256(f"{api_key}:{model}".encode("utf-8")).hexdigest()[:32]
+
+# %% ../../nbs/Rate_Limiter.ipynb 6
+def _read_rate_limits() -> Dict[str, Dict[str, int]]:
+    """Return the default rate limits with the overrides from the FASTSTREAM_GEN_RATE_LIMITS environment variable.
+
+    The variable is either "off", which disables the rate limiter, or a JSON object with the
+    limits of the API key's usage tier, e.g. '{"gpt-4": {"tokens_per_minute": 300000}}'.
+    The limits missing from the object keep their default values.
+
+    Returns:
+        The requests and tokens per minute limits for each model.
+
+    Raises:
+        ValueError: If the environment variable is neither "off" nor a JSON object of limits.
+    """
+    value = os.environ.get(RATE_LIMITS_ENV_VAR, "").strip()
+    if value == "":
+        return MODEL_RATE_LIMITS
+    if value.lower() == "off":
+        # models without limits are not paced
+        return {}
+
+    try:
+        overrides = json.loads(value)
+        if not isinstance(overrides, dict) or not all(isinstance(v, dict) for v in overrides.values()):
+            raise ValueError("not a JSON object of limits")
+    except ValueError as e:
+        raise ValueError(
+            f'Error: Invalid {RATE_LIMITS_ENV_VAR} environment variable, expected "off" or a JSON object like \'{{"gpt-4": {{"tokens_per_minute": 300000}}}}\': {e}'
+        )
+    return {
+        model: {**MODEL_RATE_LIMITS.get(model, {}), **overrides.get(model, {})}
+        for model in {**MODEL_RATE_LIMITS, **overrides}
+    }
+
+# %% ../../nbs/Rate_Limiter.ipynb 8
+class RateLimiter:
+    """A token-bucket rate limiter for the OpenAI API shared by all processes on the machine.
+
+    There are two buckets for each API key and model pair, one for requests and one for
+    tokens. The buckets refill at the per-minute limits and hold at most burst_seconds
+    worth of them, so a full minute of requests is never fired at once. The bucket state
+    is kept in a SQLite database and every update runs in an exclusive transaction, so
+    concurrent faststream_gen processes wait for their turn instead of hitting 429 errors.
+
+    Attributes:
+        db_path: The path to the SQLite database with the bucket state.
+        limits: The requests and tokens per minute limits for each model.
+        burst_seconds: The capacity of the buckets in seconds of the per-minute limits.
+    """
+
+    def __init__(
+        self,
+        db_path: Optional[Union[str, Path]] = None,
+        limits: Optional[Dict[str, Dict[str, int]]] = None,
+        burst_seconds: float = RATE_LIMITER_BURST_SECONDS,
+    ):
+        """Instantiates a new RateLimiter object.
+
+        Args:
+            db_path: The path to the SQLite database. Defaults to a file in the faststream-gen cache directory.
+            limits: The requests and tokens per minute limits for each model. Models without limits are not paced.
+                If not passed, they are read with the overrides from the FASTSTREAM_GEN_RATE_LIMITS environment variable.
+            burst_seconds: The capacity of the buckets in seconds of the per-minute limits.
+        """
+        self.db_path = Path(
+            db_path
+            if db_path is not None
+            else FASTSTREAM_GEN_CACHE_DIR / RATE_LIMITER_DB_FILE_NAME
+        )
+        self.limits = limits if limits is not None else _read_rate_limits()
+        self.burst_seconds = burst_seconds
+
+    def _connect(self) -> sqlite3.Connection:
+        self.db_path.parent.mkdir(parents=True, exist_ok=True)
+        conn = sqlite3.connect(str(self.db_path), timeout=60, isolation_level=None)
+        conn.execute(
+            "CREATE TABLE IF NOT EXISTS buckets (key TEXT PRIMARY KEY, requests REAL, tokens REAL, updated_at REAL)"
+        )
+        return conn
+
+    def _get_max_tokens(self, model: str) -> float:
+        return self.limits[model]["tokens_per_minute"] * self.burst_seconds / 60
+
+    def _take(
+        self, model: str, api_key: str, requests: int, tokens: float, force: bool
+    ) -> float:
+        """Take requests and tokens from the buckets.
+
+        Returns:
+            0 if they were taken, otherwise the number of seconds to wait before trying again.
+        """
+        rpm = self.limits[model]["requests_per_minute"]
+        tpm = self.limits[model]["tokens_per_minute"]
+        max_requests = max(rpm * self.burst_seconds / 60, 1)
+        max_tokens = self._get_max_tokens(model)
+        # a request bigger than the bucket would wait forever
+        taken_tokens = tokens if force else min(tokens, max_tokens)
+        key = _get_bucket_key(api_key, model)
+
+        conn = self._connect()
+        try:
+            conn.execute("BEGIN IMMEDIATE")
+            row = conn.execute(
+                "SELECT requests, tokens, updated_at FROM buckets WHERE key = ?", (key,)
+            ).fetchone()
+            now = time.time()
+            if row is None:
+                available_requests, available_tokens = max_requests, max_tokens
+            else:
+                elapsed = max(now - row[2], 0)
+                available_requests = min(max_requests, row[0] + elapsed * rpm / 60)
+                available_tokens = min(max_tokens, row[1] + elapsed * tpm / 60)
+
+            wait = 0.0
+            if force or (available_requests >= requests and available_tokens >= taken_tokens):
+                available_requests -= requests
+                available_tokens -= taken_tokens
+            else:
+                wait = max(
+                    (requests - available_requests) * 60 / rpm,
+                    (taken_tokens - available_tokens) * 60 / tpm,
+                )
+
+            conn.execute(
+                "INSERT OR REPLACE INTO buckets VALUES (?, ?, ?, ?)",
+                (key, available_requests, available_tokens, now),
+            )
+            conn.execute("COMMIT")
+        finally:
+            conn.close()
+
+        return wait
+
+    @staticmethod
+    def _get_api_key(api_key: Optional[str]) -> str:
+        if api_key is not None:
+            return api_key
+        return openai.api_key or os.environ.get("OPENAI_API_KEY") or ""
+
+    def acquire(self, model: str, tokens: int, api_key: Optional[str] = None) -> float:
+        """Block until a request with the given number of tokens fits within the rate limits.
+
+        Args:
+            model: The OpenAI model.
+            tokens: The estimated number of tokens used by the request.
+            api_key: The OpenAI API key. Defaults to the key used by the openai library.
+
+        Returns:
+            The number of tokens taken from the bucket, which must be passed to record_usage.
+            It is smaller than tokens if the request is bigger than the bucket.
+        """
+        if model not in self.limits:
+            return 0
+
+        api_key = self._get_api_key(api_key)
+        taken_tokens = min(tokens, self._get_max_tokens(model))
+        while (wait := self._take(model, api_key, 1, taken_tokens, force=False)) > 0:
+            logger.info(f"Rate limit for {model} reached, waiting {wait:.1f} seconds.")
+            time.sleep(wait)
+        return taken_tokens
+
+    async def aacquire(
+        self, model: str, tokens: int, api_key: Optional[str] = None
+    ) -> float:
+        """Wait without blocking the event loop until a request with the given number of tokens fits within the rate limits.
+
+        Args:
+            model: The OpenAI model.
+            tokens: The estimated number of tokens used by the request.
+            api_key: The OpenAI API key. Defaults to the key used by the openai library.
+
+        Returns:
+            The number of tokens taken from the bucket, which must be passed to record_usage.
+            It is smaller than tokens if the request is bigger than the bucket.
+        """
+        if model not in self.limits:
+            return 0
+
+        api_key = self._get_api_key(api_key)
+        taken_tokens = min(tokens, self._get_max_tokens(model))
+        loop = asyncio.get_running_loop()
+        while True:
+            # the sqlite transaction may wait for the other processes, so it runs in the default executor
+            wait = await loop.run_in_executor(
+                None, functools.partial(self._take, model, api_key, 1, taken_tokens, force=False)
+            )
+            if wait <= 0:
+                break
+            logger.info(f"Rate limit for {model} reached, waiting {wait:.1f} seconds.")
+            await asyncio.sleep(wait)
+        return taken_tokens
+
+    def record_usage(
+        self,
+        model: str,
+        taken_tokens: float,
+        total_tokens: int,
+        api_key: Optional[str] = None,
+    ) -> None:
+        """Correct the token bucket with the actual usage reported by the API.
+
+        Args:
+            model: The OpenAI model.
+            taken_tokens: The number of tokens returned by acquire.
+            total_tokens: The number of tokens actually used by the request.
+            api_key: The OpenAI API key. Defaults to the key used by the openai library.
+        """
+        if model not in self.limits:
+            return
+
+        api_key = self._get_api_key(api_key)
+        self._take(model, api_key, 0, total_tokens - taken_tokens, force=True)
+
+# %% ../../nbs/Rate_Limiter.ipynb 13
+_rate_limiter: Optional[RateLimiter] = None
+
+
+def get_rate_limiter() -> RateLimiter:
+    """Return the process-wide OpenAI API rate limiter.
+
+    Returns:
+        The shared RateLimiter instance.
+    """
+    global _rate_limiter
+    if _rate_limiter is None:
+        _rate_limiter = RateLimiter()
+    return _rate_limiter
@@ -0,0 +1,80 @@
+# AUTOGENERATED! DO NOT EDIT! File to edit: ../../nbs/Token_Counter.ipynb.
+
+# %% auto 0
+__all__ = ['logger', 'count_tokens', 'count_message_tokens']
+
+# %% ../../nbs/Token_Counter.ipynb 1
+from typing import *
+import functools
+import threading
+
+import tiktoken
+
+from .._components.logger import get_logger
+from faststream_gen._code_generator.constants import (
+    TOKEN_ENCODING_NAME,
+    TOKEN_ENCODING_LOAD_TIMEOUT_SECONDS,
+    OpenAIModel,
+)
+
+# %% ../../nbs/Token_Counter.ipynb 3
+logger = get_logger(__name__)
+
+# %% ../../nbs/Token_Counter.ipynb 4
+def _load_encoding(model: str, result: List[Any]) -> None:
+    try:
+        try:
+            result.append(tiktoken.encoding_for_model(model))
+        except KeyError:
+            result.append(tiktoken.get_encoding(TOKEN_ENCODING_NAME))
+    except Exception as e:
+        result.append(e)
+
+
+@functools.lru_cache(maxsize=None)
+def _get_encoding(
+    model: str, timeout: float = TOKEN_ENCODING_LOAD_TIMEOUT_SECONDS
+) -> Optional[tiktoken.Encoding]:
+    # tiktoken downloads the encoding on first use without a timeout, so the download runs
+    # in a daemon thread which is abandoned if it takes too long, e.g. without a network connection
+    result: List[Any] = []
+    thread = threading.Thread(target=_load_encoding, args=(model, result), daemon=True)
+    thread.start()
+    thread.join(timeout)
+    if len(result) == 0 or isinstance(result[0], Exception):
+        error = result[0] if len(result) > 0 else f"timed out after {timeout} seconds"
+        logger.warning(f"Failed to load the tokenizer for '{model}', the token counts are estimated: {error}")
+        return None
+    return result[0]  # type: ignore
+
+
+def count_tokens(text: str, model: str = OpenAIModel.gpt3.value) -> int:
+    """Count the tokens in the text with the tokenizer used by the OpenAI model.
+
+    If the tokenizer can't be loaded, the count is estimated at four characters per token.
+
+    Args:
+        text: The text to count the tokens in.
+        model: The OpenAI model. Models unknown to tiktoken use the cl100k_base encoding.
+
+    Returns:
+        The number of tokens in the text.
+    """
+    encoding = _get_encoding(model)
+    if encoding is None:
+        return len(text) // 4 + 1
+    return len(encoding.encode(text, disallowed_special=()))
+
+
+def count_message_tokens(messages: List[Dict[str, str]], model: str = OpenAIModel.gpt3.value) -> int:
+    """Count the prompt tokens used by the chat messages.
+
+    Args:
+        messages: The chat messages with the role and the content.
+        model: The OpenAI model.
+
+    Returns:
+        The number of prompt tokens the OpenAI API charges for the messages.
+    """
+    # every message is wrapped in three special tokens and the reply is primed with three more
+    return sum(3 + count_tokens(m["role"], model) + count_tokens(m["content"], model) for m in messages) + 3
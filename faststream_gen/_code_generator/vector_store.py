@@ -0,0 +1,308 @@
+# AUTOGENERATED! DO NOT EDIT! File to edit: ../../nbs/Vector_Store.ipynb.
+
+# %% auto 0
+__all__ = ['Document', 'Embeddings', 'VectorStore']
+
+# %% ../../nbs/Vector_Store.ipynb 1
+from typing import *
+import os
+import json
+import uuid
+import hashlib
+from pathlib import Path
+
+import numpy as np
+
+from faststream_gen._code_generator.constants import (
+    VECTOR_STORE_VECTORS_FILE_NAME,
+    VECTOR_STORE_DOCUMENTS_FILE_NAME,
+    VECTOR_STORE_BM25_FILE_NAME,
+    HYBRID_RETRIEVAL_VECTOR_WEIGHT,
+    RetrievalMode,
+)
+from .bm25_index import BM25Index
+
+# %% ../../nbs/Vector_Store.ipynb 3
+class Document(NamedTuple):
+    """A piece of text stored in the vector store.
+
+    Attributes:
+        page_content: The text of the document.
+        metadata: Arbitrary metadata of the document, such as its source.
+    """
+
+    page_content: str
+    metadata: Dict[str, Any] = {}
+
+
+class Embeddings(Protocol):
+    """The interface of the models used to embed the documents and the queries."""
+
+    def embed_documents(self, texts: List[str]) -> List[List[float]]:
+        ...
+
+    def embed_query(self, text: str) -> List[float]:
+        ...
+
+# %% ../../nbs/Vector_Store.ipynb 4
+def _get_content_hash(text: str) -> str:
+    return hashlib.sha256(text.encode("utf-8")).hexdigest()
+
+
+def _normalize(vectors: np.ndarray) -> np.ndarray:
+    norms = np.linalg.norm(vectors, axis=-1, keepdims=True)
+    return cast(np.ndarray, (vectors / np.where(norms == 0, 1, norms)).astype(np.float32))
+
+
+def _min_max_scale(scores: np.ndarray) -> np.ndarray:
+    if len(scores) == 0 or scores.max() == scores.min():
+        return np.zeros_like(scores)
+    return (scores - scores.min()) / (scores.max() - scores.min())  # type: ignore
+
+
+def _top_k(scores: np.ndarray, k: int) -> np.ndarray:
+    """Return the indices of the k highest scores in descending order."""
+    if k < len(scores):
+        indices = np.argpartition(-scores, k - 1)[:k]
+    else:
+        indices = np.arange(len(scores))
+    return indices[np.argsort(-scores[indices], kind="stable")]
+
+
+def _max_marginal_relevance(
+    scores: np.ndarray, vectors: np.ndarray, k: int, lambda_mult: float
+) -> List[int]:
+    """Select k of the vectors balancing the relevance to the query and the diversity.
+
+    Args:
+        scores: The similarity of each vector to the query.
+        vectors: The normalized candidate vectors.
+        k: The number of vectors to select.
+        lambda_mult: 1 selects by relevance only and 0 by diversity only.
+
+    Returns:
+        The indices of the selected vectors in the order they were selected.
+    """
+    if len(scores) == 0:
+        return []
+    selected = [int(np.argmax(scores))]
+    # the highest similarity of every candidate to any of the already selected ones
+    max_similarity = vectors @ vectors[selected[0]]
+    while len(selected) < min(k, len(scores)):
+        mmr = lambda_mult * scores - (1 - lambda_mult) * max_similarity
+        mmr[selected] = -np.inf
+        i = int(np.argmax(mmr))
+        selected.append(i)
+        max_similarity = np.maximum(max_similarity, vectors @ vectors[i])
+    return selected
+
+# %% ../../nbs/Vector_Store.ipynb 6
+def _save_vectors(path: Path, vectors: np.ndarray) -> None:
+    # np.save appends the .npy suffix to the paths without it, but not to the open files
+    with open(path, "wb") as f:
+        np.save(f, vectors)
+
+
+def _save_documents(path: Path, documents: List[Document]) -> None:
+    path.write_text(json.dumps([d._asdict() for d in documents]), encoding="utf-8")
+
+
+def _write_atomically(path: Path, write: Callable[[Path], None]) -> None:
+    # the readers may have the old file mmapped, so it is replaced instead of overwritten
+    tmp_path = path.with_name(f"{path.name}.{uuid.uuid4().hex}.tmp")
+    try:
+        write(tmp_path)
+        os.replace(tmp_path, path)
+    finally:
+        if tmp_path.exists():
+            tmp_path.unlink()
+
+# %% ../../nbs/Vector_Store.ipynb 7
+class VectorStore:
+    """An in-memory vector store for small collections of documents.
+
+    The normalized embeddings are stored as a NumPy matrix which is memory-mapped
+    when loaded and the documents are stored as JSON. Searches compute the exact
+    cosine similarity to every document, which is fast enough for a few thousand
+    of them. The documents are also indexed with BM25, so they can be searched
+    lexically without embedding the query, or with both scores fused.
+
+    Attributes:
+        embeddings: The model used to embed the queries.
+        vectors: The normalized embeddings of the documents, one per row.
+        documents: The stored documents.
+        bm25: The BM25 index of the documents.
+    """
+
+    def __init__(
+        self,
+        embeddings: Embeddings,
+        vectors: np.ndarray,
+        documents: List[Document],
+        bm25: Optional[BM25Index] = None,
+    ):
+        """Instantiates a new VectorStore object.
+
+        Args:
+            embeddings: The model used to embed the queries.
+            vectors: The normalized embeddings of the documents, one per row.
+            documents: The stored documents.
+            bm25: The BM25 index of the documents. If not passed, only the vector search is available.
+        """
+        if len(vectors) != len(documents):
+            raise ValueError(
+                f"The number of vectors ({len(vectors)}) does not match the number of documents ({len(documents)})."
+            )
+        self.embeddings = embeddings
+        self.vectors = vectors
+        self.documents = documents
+        self.bm25 = bm25
+
+    @classmethod
+    def from_documents(
+        cls,
+        documents: Sequence[Any],
+        embeddings: Embeddings,
+        cached_vectors: Optional[Dict[str, np.ndarray]] = None,
+    ) -> "VectorStore":
+        """Embed the documents and create a vector store.
+
+        Args:
+            documents: The documents to store. Any objects with the page_content and metadata attributes can be used.
+            embeddings: The model used to embed the documents and the queries.
+            cached_vectors: The normalized embeddings from the previous build keyed by the content hash of the
+                documents. Only the documents which are not in it are embedded.
+
+        Returns:
+            The new vector store.
+        """
+        documents = [Document(d.page_content, dict(d.metadata)) for d in documents]
+        vectors_by_hash = dict(cached_vectors) if cached_vectors is not None else {}
+
+        texts_to_embed = list(
+            {
+                _get_content_hash(d.page_content): d.page_content
+                for d in documents
+                if _get_content_hash(d.page_content) not in vectors_by_hash
+            }.items()
+        )
+        if len(texts_to_embed) > 0:
+            new_vectors = _normalize(
+                np.array(
+                    embeddings.embed_documents([text for _, text in texts_to_embed]),
+                    dtype=np.float32,
+                )
+            )
+            vectors_by_hash.update(zip([h for h, _ in texts_to_embed], new_vectors))
+
+        vectors = np.array(
+            [vectors_by_hash[_get_content_hash(d.page_content)] for d in documents],
+            dtype=np.float32,
+        )
+        bm25 = BM25Index.from_texts([d.page_content for d in documents])
+        return cls(embeddings, vectors, documents, bm25)
+
+    def save_local(self, db_path: Union[str, Path]) -> None:
+        """Save the vector store to a directory.
+
+        Args:
+            db_path: The path to the directory.
+        """
+        db_path = Path(db_path)
+        db_path.mkdir(parents=True, exist_ok=True)
+        _write_atomically(db_path / VECTOR_STORE_VECTORS_FILE_NAME, lambda p: _save_vectors(p, self.vectors))
+        _write_atomically(db_path / VECTOR_STORE_DOCUMENTS_FILE_NAME, lambda p: _save_documents(p, self.documents))
+        if self.bm25 is not None:
+            _write_atomically(db_path / VECTOR_STORE_BM25_FILE_NAME, self.bm25.save)
+
+    @classmethod
+    def load_local(
+        cls, db_path: Union[str, Path], embeddings: Embeddings
+    ) -> "VectorStore":
+        """Load the vector store from a directory.
+
+        Args:
+            db_path: The path to the directory.
+            embeddings: The model used to embed the queries.
+
+        Returns:
+            The loaded vector store.
+        """
+        db_path = Path(db_path)
+        vectors = np.load(db_path / VECTOR_STORE_VECTORS_FILE_NAME, mmap_mode="r")
+        documents = [
+            Document(**d)
+            for d in json.loads(
+                (db_path / VECTOR_STORE_DOCUMENTS_FILE_NAME).read_text(encoding="utf-8")
+            )
+        ]
+        bm25_path = db_path / VECTOR_STORE_BM25_FILE_NAME
+        bm25 = BM25Index.load(bm25_path) if bm25_path.exists() else None
+        return cls(embeddings, vectors, documents, bm25)
+
+    def _get_scores(self, query: str, mode: RetrievalMode) -> np.ndarray:
+        if mode != RetrievalMode.vector and self.bm25 is None:
+            raise RuntimeError(
+                f"Error: The vector database has no BM25 index required for the '{mode.value}' retrieval. Please regenerate it with the 'embeddings generate' command."
+            )
+
+        if mode == RetrievalMode.lexical:
+            return _min_max_scale(self.bm25.get_scores(query))  # type: ignore
+
+        query_vector = _normalize(np.array(self.embeddings.embed_query(query), dtype=np.float32))
+        vector_scores = self.vectors @ query_vector
+        if mode == RetrievalMode.vector:
+            return vector_scores  # type: ignore
+
+        return HYBRID_RETRIEVAL_VECTOR_WEIGHT * _min_max_scale(vector_scores) + (
+            1 - HYBRID_RETRIEVAL_VECTOR_WEIGHT
+        ) * _min_max_scale(self.bm25.get_scores(query))  # type: ignore
+
+    def similarity_search(
+        self, query: str, k: int = 4, mode: RetrievalMode = RetrievalMode.vector
+    ) -> List[Document]:
+        """Return the documents most similar to the query.
+
+        Args:
+            query: The query text.
+            k: The number of documents to return.
+            mode: Search by the embeddings, by BM25 which needs no embeddings, or by both scores fused.
+
+        Returns:
+            The documents sorted by the similarity to the query.
+
+        Raises:
+            RuntimeError: If the lexical search is requested and the store has no BM25 index.
+        """
+        scores = self._get_scores(query, mode)
+        return [self.documents[i] for i in _top_k(scores, k)]
+
+    def max_marginal_relevance_search(
+        self,
+        query: str,
+        k: int = 4,
+        fetch_k: int = 20,
+        lambda_mult: float = 0.5,
+        mode: RetrievalMode = RetrievalMode.vector,
+    ) -> List[Document]:
+        """Return the documents selected using the maximal marginal relevance.
+
+        Args:
+            query: The query text.
+            k: The number of documents to return.
+            fetch_k: The number of the most similar documents to select from.
+            lambda_mult: 1 selects by relevance only and 0 by diversity only.
+            mode: Search by the embeddings, by BM25 which needs no embeddings, or by both scores fused.
+
+        Returns:
+            The selected documents.
+
+        Raises:
+            RuntimeError: If the lexical search is requested and the store has no BM25 index.
+        """
+        scores = self._get_scores(query, mode)
+        candidates = _top_k(scores, fetch_k)
+        selected = _max_marginal_relevance(
+            scores[candidates], np.asarray(self.vectors[candidates]), k, lambda_mult
+        )
+        return [self.documents[candidates[i]] for i in selected]
@@ -0,0 +1,135 @@
+# AUTOGENERATED! DO NOT EDIT! File to edit: ../../nbs/Checkpoint.ipynb.
+
+# %% auto 0
+__all__ = ['logger', 'GenerationCheckpoint']
+
+# %% ../../nbs/Checkpoint.ipynb 1
+from typing import *
+import json
+import uuid
+from pathlib import Path
+
+from .logger import get_logger
+from faststream_gen._code_generator.constants import (
+    LOGS_DIR_NAME,
+    CHECKPOINT_FILE_NAME,
+    CHECKPOINT_FILES,
+)
+
+# %% ../../nbs/Checkpoint.ipynb 3
+logger = get_logger(__name__)
+
+# %% ../../nbs/Checkpoint.ipynb 4
+class GenerationCheckpoint:
+    """The checkpoint of the completed steps of a project generation.
+
+    The checkpoint is stored in the logs directory of the generated project. For every
+    completed step it keeps the token usage, the step outputs and a snapshot of the
+    project files, because the failed attempts of the next step overwrite them.
+
+    Attributes:
+        output_directory: The path to the generated project.
+        description: The validated application description.
+        model: The OpenAI model used for the generation.
+        steps: The completed steps in the order they were completed.
+    """
+
+    def __init__(self, output_directory: str, description: str, model: str):
+        """Instantiates a new GenerationCheckpoint object.
+
+        Args:
+            output_directory: The path to the generated project.
+            description: The cleaned application description.
+            model: The OpenAI model used for the generation.
+        """
+        self.output_directory = output_directory
+        self.description = description
+        self.model = model
+        self.steps: Dict[str, Dict[str, Any]] = {}
+
+    @property
+    def path(self) -> Path:
+        return Path(self.output_directory) / LOGS_DIR_NAME / CHECKPOINT_FILE_NAME
+
+    def load(self) -> bool:
+        """Load the completed steps from the checkpoint file.
+
+        The checkpoint is ignored if it was created for a different description or model.
+
+        Returns:
+            True if the checkpoint was loaded, False otherwise.
+        """
+        if not self.path.exists():
+            return False
+
+        checkpoint = json.loads(self.path.read_text(encoding="utf-8"))
+        if checkpoint["description"] != self.description or checkpoint["model"] != self.model:
+            logger.info(f"Ignoring the checkpoint '{self.path}' created for a different description or model.")
+            return False
+
+        self.steps = checkpoint["steps"]
+        return True
+
+    def is_completed(self, step: str) -> bool:
+        """Check if the step was completed.
+
+        Args:
+            step: The name of the step.
+
+        Returns:
+            True if the step is in the checkpoint, False otherwise.
+        """
+        return step in self.steps
+
+    def get(self, step: str) -> Dict[str, Any]:
+        """Return the outputs of the completed step.
+
+        Args:
+            step: The name of the step.
+
+        Returns:
+            The outputs saved for the step.
+        """
+        return self.steps[step]["outputs"]  # type: ignore
+
+    def save(
+        self,
+        step: str,
+        usage: List[Dict[str, int]],
+        outputs: Optional[Dict[str, Any]] = None,
+    ) -> None:
+        """Save the completed step together with a snapshot of the project files.
+
+        Args:
+            step: The name of the step.
+            usage: The token usage of the step.
+            outputs: The outputs of the step needed by the next steps.
+        """
+        files = {}
+        for file_name in CHECKPOINT_FILES:
+            file_path = Path(self.output_directory) / file_name
+            if file_path.exists():
+                files[file_name] = file_path.read_text(encoding="utf-8")
+
+        self.steps[step] = {"usage": usage, "outputs": outputs or {}, "files": files}
+
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        checkpoint = {"description": self.description, "model": self.model, "steps": self.steps}
+        tmp_path = self.path.with_name(f"{self.path.name}.{uuid.uuid4().hex}.tmp")
+        tmp_path.write_text(json.dumps(checkpoint, indent=4), encoding="utf-8")
+        tmp_path.replace(self.path)
+
+    def restore(self) -> None:
+        """Restore the project files as they were after the last completed step."""
+        if len(self.steps) == 0:
+            return
+        last_step = list(self.steps.values())[-1]
+        for file_name, contents in last_step["files"].items():
+            file_path = Path(self.output_directory) / file_name
+            file_path.parent.mkdir(parents=True, exist_ok=True)
+            file_path.write_text(contents, encoding="utf-8")
+
+    def clear(self) -> None:
+        """Delete the checkpoint file and forget the completed steps."""
+        self.steps = {}
+        self.path.unlink(missing_ok=True)
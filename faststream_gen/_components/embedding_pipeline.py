@@ -0,0 +1,173 @@
+# AUTOGENERATED! DO NOT EDIT! File to edit: ../../nbs/Embedding_Pipeline.ipynb.
+
+# %% auto 0
+__all__ = ['logger', 'BatchedEmbeddings']
+
+# %% ../../nbs/Embedding_Pipeline.ipynb 1
+from typing import *
+import os
+import json
+import time
+import uuid
+import hashlib
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+
+import openai
+
+from .logger import get_logger
+from faststream_gen._code_generator.constants import (
+    FASTSTREAM_GEN_CACHE_DIR,
+    OPENAI_EMBEDDING_MODEL,
+    EMBEDDING_BATCH_MAX_TOKENS,
+    EMBEDDING_BATCH_MAX_SIZE,
+    EMBEDDING_CHECKPOINTS_DIR_NAME,
+    MAX_CONCURRENT_REQUESTS,
+)
+from .._code_generator.chat import _retry_with_exponential_backoff
+from .._code_generator.rate_limiter import get_rate_limiter
+from .._code_generator.token_counter import count_tokens
+
+# %% ../../nbs/Embedding_Pipeline.ipynb 3
+logger = get_logger(__name__)
+
+# %% ../../nbs/Embedding_Pipeline.ipynb 4
+def _make_batches(texts: List[str], model: str, max_tokens: int, max_size: int) -> List[List[int]]:
+    """Split the texts into batches by the number of tokens.
+
+    Args:
+        texts: The texts to embed.
+        model: The OpenAI embedding model, whose tokenizer is used to count the tokens.
+        max_tokens: The maximum number of tokens in a batch. A longer text gets a batch of its own.
+        max_size: The maximum number of texts in a batch.
+
+    Returns:
+        The indices of the texts in each batch.
+    """
+    batches: List[List[int]] = []
+    batch: List[int] = []
+    batch_tokens = 0
+    for i, text in enumerate(texts):
+        tokens = count_tokens(text, model)
+        if len(batch) > 0 and (batch_tokens + tokens > max_tokens or len(batch) >= max_size):
+            batches.append(batch)
+            batch, batch_tokens = [], 0
+        batch.append(i)
+        batch_tokens += tokens
+    if len(batch) > 0:
+        batches.append(batch)
+    return batches
+
+# %% ../../nbs/Embedding_Pipeline.ipynb 6
+class BatchedEmbeddings:
+    """OpenAI embeddings of the documents computed in concurrent batches.
+
+    The documents are split into batches by the number of tokens and the
+    batches are sent concurrently within the rate limits. Every completed batch is
+    saved to the checkpoint directory, so a failed run can be restarted without
+    embedding the completed batches again. The checkpoints are removed once all
+    the documents are embedded.
+
+    Attributes:
+        model: The OpenAI embedding model.
+        checkpoint_dir: The directory where the completed batches are saved.
+        max_batch_tokens: The maximum number of tokens in a batch.
+        max_batch_size: The maximum number of documents in a batch.
+        max_workers: The maximum number of batches sent at the same time.
+    """
+
+    def __init__(
+        self,
+        model: str = OPENAI_EMBEDDING_MODEL,
+        checkpoint_dir: Optional[Union[str, Path]] = None,
+        max_batch_tokens: int = EMBEDDING_BATCH_MAX_TOKENS,
+        max_batch_size: int = EMBEDDING_BATCH_MAX_SIZE,
+        max_workers: int = MAX_CONCURRENT_REQUESTS,
+    ):
+        """Instantiates a new BatchedEmbeddings object.
+
+        Args:
+            model: The OpenAI embedding model.
+            checkpoint_dir: The directory where the completed batches are saved. Defaults to the faststream-gen cache directory.
+            max_batch_tokens: The maximum number of tokens in a batch.
+            max_batch_size: The maximum number of documents in a batch.
+            max_workers: The maximum number of batches sent at the same time.
+        """
+        self.model = model
+        self.checkpoint_dir = Path(
+            checkpoint_dir
+            if checkpoint_dir is not None
+            else FASTSTREAM_GEN_CACHE_DIR / EMBEDDING_CHECKPOINTS_DIR_NAME
+        )
+        self.max_batch_tokens = max_batch_tokens
+        self.max_batch_size = max_batch_size
+        self.max_workers = max_workers
+
+    def _get_checkpoint_path(self, texts: List[str]) -> Path:
+        key = hashlib.sha256(
+            json.dumps({"model": self.model, "texts": texts}).encode("utf-8")
+        ).hexdigest()
+        return self.checkpoint_dir / f"{key}.json"
+
+    @_retry_with_exponential_backoff()
+    def _create(self, texts: List[str]) -> Dict[str, Any]:
+        estimated_tokens = sum(count_tokens(t, self.model) for t in texts)
+        taken_tokens = get_rate_limiter().acquire(self.model, estimated_tokens)
+        response = openai.Embedding.create(model=self.model, input=texts)
+        get_rate_limiter().record_usage(
+            self.model, taken_tokens, response["usage"]["total_tokens"]
+        )
+        return response  # type: ignore
+
+    def _embed_batch(self, texts: List[str]) -> Tuple[List[List[float]], int, bool]:
+        path = self._get_checkpoint_path(texts)
+        if path.exists():
+            checkpoint = json.loads(path.read_text(encoding="utf-8"))
+            return checkpoint["embeddings"], checkpoint["total_tokens"], True
+
+        response = self._create(texts)
+        embeddings = [d["embedding"] for d in sorted(response["data"], key=lambda d: d["index"])]
+        total_tokens = response["usage"]["total_tokens"]
+
+        path.parent.mkdir(parents=True, exist_ok=True)
+        tmp_path = path.with_name(f"{path.name}.{uuid.uuid4().hex}.tmp")
+        tmp_path.write_text(
+            json.dumps({"embeddings": embeddings, "total_tokens": total_tokens}),
+            encoding="utf-8",
+        )
+        os.replace(tmp_path, path)
+        return embeddings, total_tokens, False
+
+    def embed_documents(self, texts: List[str]) -> List[List[float]]:
+        """Embed the documents.
+
+        Args:
+            texts: The texts of the documents.
+
+        Returns:
+            The embeddings of the documents in the same order.
+        """
+        batches = [
+            [texts[i] for i in batch]
+            for batch in _make_batches(texts, self.model, self.max_batch_tokens, self.max_batch_size)
+        ]
+
+        start = time.monotonic()
+        with ThreadPoolExecutor(max_workers=self.max_workers) as executor:
+            results = list(executor.map(self._embed_batch, batches))
+        elapsed = max(time.monotonic() - start, 1e-6)
+
+        num_resumed = sum(resumed for _, _, resumed in results)
+        num_tokens = sum(tokens for _, tokens, resumed in results if not resumed)
+        num_docs = sum(len(b) for b, (_, _, resumed) in zip(batches, results) if not resumed)
+        logger.info(
+            f"Embedded {len(texts)} documents in {len(batches)} batches ({num_resumed} resumed from the checkpoints) in {elapsed:.1f}s: {num_docs / elapsed:.1f} docs/s, {num_tokens / elapsed:.0f} tokens/s."
+        )
+
+        for batch in batches:
+            self._get_checkpoint_path(batch).unlink(missing_ok=True)
+
+        return [embedding for embeddings, _, _ in results for embedding in embeddings]
+
+    def embed_query(self, text: str) -> List[float]:
+        return self.embed_documents([text])[0]
@@ -8,15 +8,16 @@ from typing import *
 import shutil
 import re
 import os
+import json
+import functools
+from concurrent.futures import ThreadPoolExecutor
 from tempfile import TemporaryDirectory
 from contextlib import contextmanager
 from pathlib import Path
 
-from langchain.document_loaders import UnstructuredMarkdownLoader, DirectoryLoader, TextLoader
+from langchain.document_loaders import DirectoryLoader, TextLoader
 from langchain.schema.document import Document
-from langchain.text_splitter import CharacterTextSplitter
-from langchain.vectorstores import FAISS
-from langchain.embeddings import OpenAIEmbeddings
+import numpy as np
 from yaspin import yaspin
 import typer
 
@@ -31,9 +32,25 @@ from faststream_gen._code_generator.constants import (
     FASTSTREAM_DIR_TO_EXCLUDE,
     FASTSTREAM_ROOT_DIR_NAME,
     FASTSTREAM_EN_DOCS_DIR,
+    FASTSTREAM_DOCS_SRC_DIR,
+    DESCRIPTION_VALIDATION_QUERY,
+    QUERY_EMBEDDINGS_FILE_NAME,
+    DESCRIPTION_VALIDATION_CONTEXT_FILE_NAME,
+    OPENAI_EMBEDDING_MODEL,
+    VECTOR_STORE_VECTORS_FILE_NAME,
+    VECTOR_STORE_BM25_FILE_NAME,
+    VECTOR_STORE_MANIFEST_FILE_NAME,
+    DOCS_CHUNK_MAX_TOKENS,
+    FASTSTREAM_TEMPLATE_ZIP_URL,
+    TEMPLATE_ARCHIVE_FILE_NAME,
 )
 from .package_data import get_root_data_path
-from .._code_generator.helper import download_and_extract_github_repo
+from .._code_generator.helper import download_and_extract_github_repo, examples_delimiter, _split_text, _fetch_content, _get_prefix_filter
+from .._code_generator.query_embeddings import save_precomputed_query_embeddings
+from .._code_generator.chat import _get_relevant_document
+from .._code_generator.vector_store import VectorStore, Embeddings, _get_content_hash
+from .embedding_pipeline import BatchedEmbeddings
+from .._code_generator.token_counter import count_tokens
 
 # %% ../../nbs/Embeddings_CLI.ipynb 3
 def _create_documents(
@@ -57,8 +74,8 @@ def _create_documents(
     if api_directory.exists() and api_directory.is_dir():
         shutil.rmtree(api_directory)
 
-    loader_cls = TextLoader if extension == "*.txt" else UnstructuredMarkdownLoader
-    loader = DirectoryLoader(str(extrated_path), glob=extension, loader_cls=loader_cls) # type: ignore
+    # the markdown is loaded as is, the headings are needed to split it into sections
+    loader = DirectoryLoader(str(extrated_path), glob=extension, loader_cls=TextLoader)
     docs = loader.load()
 
     typer.echo("\nBelow files are included in the embeddings:")
@@ -73,43 +90,170 @@ def _create_documents(
     return docs
 
 # %% ../../nbs/Embeddings_CLI.ipynb 5
-def _split_document_into_chunks(
-    documents: List[Document],
-    separator: str,
-    chunk_size: int = 500,
-    chunk_overlap: int = 0,
+_MARKDOWN_HEADING = re.compile(r"^(#{1,6})\s+(.*?)\s*#*\s*$")
+_MARKDOWN_FENCE = re.compile(r"^\s*(```|~~~)")
+_MARKDOWN_FRONT_MATTER = re.compile(r"\A---\n.*?\n---\n", re.DOTALL)
+
+
+def _split_markdown_sections(text: str) -> List[Tuple[List[str], str]]:
+    """Split the markdown text by its headings.
+
+    Args:
+        text: The markdown text.
+
+    Returns:
+        The heading path and the text of each section. Lines starting with # inside code blocks are not headings.
+    """
+    # the YAML front matter holds only the page settings of the docs site
+    text = _MARKDOWN_FRONT_MATTER.sub("", text)
+    sections: List[Tuple[List[str], str]] = []
+    headings: List[Tuple[int, str]] = []
+    lines: List[str] = []
+    in_code_block = False
+
+    for line in text.splitlines():
+        if _MARKDOWN_FENCE.match(line):
+            in_code_block = not in_code_block
+        heading = None if in_code_block else _MARKDOWN_HEADING.match(line)
+        if heading is None:
+            lines.append(line)
+            continue
+
+        sections.append(([title for _, title in headings], "\n".join(lines).strip()))
+        level = len(heading.group(1))
+        headings = [h for h in headings if h[0] < level] + [(level, heading.group(2))]
+        lines = []
+
+    sections.append(([title for _, title in headings], "\n".join(lines).strip()))
+    return [(path, body) for path, body in sections if body != ""]
+
+
+def _split_into_blocks(text: str) -> List[str]:
+    """Split the text into paragraphs, keeping the code blocks whole."""
+    blocks: List[str] = []
+    lines: List[str] = []
+    in_code_block = False
+    for line in text.splitlines():
+        if _MARKDOWN_FENCE.match(line):
+            in_code_block = not in_code_block
+        if line.strip() == "" and not in_code_block:
+            if len(lines) > 0:
+                blocks.append("\n".join(lines))
+            lines = []
+        else:
+            lines.append(line)
+    if len(lines) > 0:
+        blocks.append("\n".join(lines))
+    return blocks
+
+
+def _count_tokens(text: str) -> int:
+    # the chunks are embedded, so they are measured with the embedding model's tokenizer
+    return count_tokens(text, OPENAI_EMBEDDING_MODEL)
+
+
+def _split_by_tokens(text: str, max_tokens: int) -> List[str]:
+    """Pack the paragraphs of the text into chunks of at most max_tokens.
+
+    Paragraphs which don't fit into a chunk on their own are split by lines.
+    """
+    pieces: List[str] = []
+    for block in _split_into_blocks(text):
+        if _count_tokens(block) <= max_tokens:
+            pieces.append(block)
+        else:
+            pieces.extend(block.splitlines())
+
+    chunks: List[str] = []
+    chunk: List[str] = []
+    for piece in pieces:
+        if len(chunk) > 0 and _count_tokens("\n\n".join(chunk + [piece])) > max_tokens:
+            chunks.append("\n\n".join(chunk))
+            chunk = []
+        chunk.append(piece)
+    if len(chunk) > 0:
+        chunks.append("\n\n".join(chunk))
+    return chunks
+
+
+def _split_markdown_into_chunks(
+    documents: List[Document], max_tokens: int = DOCS_CHUNK_MAX_TOKENS
 ) -> List[Document]:
-    """Split the list of documents into chunks
+    """Split the markdown documents into chunks by their headings.
+
+    Every section becomes a chunk of its own and the sections longer than max_tokens are
+    split further by paragraphs. Each chunk starts with the heading path of its section,
+    which is also stored in the section metadata.
 
     Args:
-        documents: List of documents to be split into chunks.
-        separators: List of separator patterns used for chunking.
-        chunk_size: The maximum size of each chunk in characters. Defaults to 1500.
-        chunk_overlap: The overlap between consecutive chunks in characters. Defaults to 150.
+        documents: The markdown documents.
+        max_tokens: The maximum estimated number of tokens in a chunk, not counting the heading path.
 
     Returns:
         A list of documents where each document represents a chunk.
     """
-    text_splitter = CharacterTextSplitter(
-        chunk_size=chunk_size,
-        chunk_overlap=chunk_overlap,
-        separator=separator
-    )
-    chunks = text_splitter.split_documents(documents)
+    chunks = []
+    for doc in documents:
+        for path, body in _split_markdown_sections(doc.page_content):
+            section = " > ".join(path)
+            for text in _split_by_tokens(body, max_tokens):
+                chunks.append(
+                    Document(
+                        page_content=f"{section}\n\n{text}" if section else text,
+                        metadata={**doc.metadata, "section": section},
+                    )
+                )
     return chunks
 
-# %% ../../nbs/Embeddings_CLI.ipynb 7
-def _save_embeddings_db(doc_chunks: List[Document], db_path: Path) -> None:
-    """Save the embeddings in a FAISS db
+# %% ../../nbs/Embeddings_CLI.ipynb 8
+def _load_cached_vectors(db_path: Path) -> Dict[str, np.ndarray]:
+    """Load the embeddings of the existing vector db keyed by the content hash of the documents.
+
+    Args:
+        db_path: Path to the vector db.
+
+    Returns:
+        The embeddings listed in the manifest of the db or an empty dictionary if there is no manifest
+        or the embeddings were created with a different model.
+    """
+    manifest_path = db_path / VECTOR_STORE_MANIFEST_FILE_NAME
+    if not manifest_path.exists():
+        return {}
+    manifest = json.loads(manifest_path.read_text(encoding="utf-8"))
+    if manifest["embedding_model"] != OPENAI_EMBEDDING_MODEL:
+        return {}
+    # not memory-mapped, the file is overwritten when the db is saved
+    vectors = np.load(db_path / VECTOR_STORE_VECTORS_FILE_NAME)
+    return dict(zip(manifest["content_hashes"], vectors))
+
+
+def _save_embeddings_db(
+    doc_chunks: List[Document], db_path: Path, embeddings: Optional[Embeddings] = None
+) -> None:
+    """Save the embeddings in a vector db
+
+    Only the chunks which are not listed in the manifest of the existing db are embedded,
+    the rest reuse the stored embeddings and chunks which are gone are dropped.
     
     Args:
         doc_chunks: A list of documents where each document represents a chunk.
-        db_path: Path to save the FAISS db.
+        db_path: Path to save the vector db.
+        embeddings: The model used to embed the chunks. Defaults to the OpenAI embeddings computed in concurrent batches.
     """
-    db = FAISS.from_documents(doc_chunks, OpenAIEmbeddings())
-    db.save_local(str(db_path))
+    if embeddings is None:
+        embeddings = BatchedEmbeddings(model=OPENAI_EMBEDDING_MODEL)
+    db = VectorStore.from_documents(doc_chunks, embeddings, _load_cached_vectors(db_path))
+    db.save_local(db_path)
+
+    manifest = {
+        "embedding_model": OPENAI_EMBEDDING_MODEL,
+        "content_hashes": [_get_content_hash(d.page_content) for d in db.documents],
+    }
+    (db_path / VECTOR_STORE_MANIFEST_FILE_NAME).write_text(
+        json.dumps(manifest, indent=4), encoding="utf-8"
+    )
 
-# %% ../../nbs/Embeddings_CLI.ipynb 9
+# %% ../../nbs/Embeddings_CLI.ipynb 11
 def _delete_directory(d: str) -> None:
     """Delete a directory and its contents if it exists.
 
@@ -123,16 +267,22 @@ def _delete_directory(d: str) -> None:
         except Exception as e:
             print(f"Error deleting directory: {e}")
 
-# %% ../../nbs/Embeddings_CLI.ipynb 11
-def _read_lines_from_file(file_path: Path, lines_spec: str) -> str:
+# %% ../../nbs/Embeddings_CLI.ipynb 13
+@functools.lru_cache(maxsize=None)
+def _read_file_lines(file_path: Path) -> Tuple[str, ...]:
+    # the same docs_src file is included many times, so it is read only once
     with open(file_path, "r") as file:
-        all_lines = file.readlines()
+        return tuple(file.readlines())
+
+
+def _read_lines_from_file(file_path: Path, lines_spec: str) -> str:
+    all_lines = _read_file_lines(file_path)
 
     # Check if lines_spec is empty (indicating all lines should be read)
     if not lines_spec:
         return "".join(all_lines)
 
-    selected_lines = []
+    selected_lines: List[str] = []
     line_specs = lines_spec.split(",")
 
     for line_spec in line_specs:
@@ -149,6 +299,16 @@ def _read_lines_from_file(file_path: Path, lines_spec: str) -> str:
     return "".join(selected_lines)
 
 
+@functools.lru_cache(maxsize=None)
+def _get_docs_src_parent(root_path: Path) -> Path:
+    if Path(f"{root_path}/docs/docs_src").exists():
+        return Path(f"{root_path}/docs")
+    elif Path(f"{root_path}/docs_src").exists():
+        return Path(f"{root_path}/")
+    else:
+        raise ValueError(f"Couldn't find docs_src directory")
+
+
 def _extract_lines(embedded_line: str, root_path: Path) -> str:
     to_expand_path = re.search("{!>(.*)!}", embedded_line).group(1).strip() # type: ignore 
     lines_spec = ""
@@ -157,13 +317,7 @@ def _extract_lines(embedded_line: str, root_path: Path) -> str:
         to_expand_path = to_expand_path.strip()
         lines_spec = lines_spec[:-1]
 
-    if Path(f"{root_path}/docs/docs_src").exists():
-        to_expand_path = Path(f"{root_path}/docs") / to_expand_path
-    elif Path(f"{root_path}/docs_src").exists():
-        to_expand_path = Path(f"{root_path}/") / to_expand_path
-    else:
-        raise ValueError(f"Couldn't find docs_src directory")
-    return _read_lines_from_file(to_expand_path, lines_spec)
+    return _read_lines_from_file(_get_docs_src_parent(root_path) / to_expand_path, lines_spec)
 
 
 def _expand_markdown(
@@ -182,7 +336,7 @@ def _expand_markdown(
             else:
                 output_file.write(_extract_lines(embedded_line=line, root_path=root_path))
 
-# %% ../../nbs/Embeddings_CLI.ipynb 12
+# %% ../../nbs/Embeddings_CLI.ipynb 14
 def _expand_faststream_docs(root_path: Path) -> None:
     docs_suffix = root_path / FASTSTREAM_DOCS_DIR_SUFFIX
     docs_suffix.mkdir(exist_ok=True)
@@ -196,10 +350,15 @@ def _expand_faststream_docs(root_path: Path) -> None:
             input_markdown_path=input_path, output_markdown_path=output_path, root_path=root_path
         )
 
-    for md_file in md_files:
-        expand_doc(md_file)
-
-# %% ../../nbs/Embeddings_CLI.ipynb 14
+    try:
+        with ThreadPoolExecutor() as executor:
+            # list() reraises the first error from the workers
+            list(executor.map(expand_doc, md_files))
+    finally:
+        _read_file_lines.cache_clear()
+        _get_docs_src_parent.cache_clear()
+
+# %% ../../nbs/Embeddings_CLI.ipynb 17
 def _generate_docs_db(input_path: Path, output_path: Path) -> None:
     """Generate Document Embeddings Database.
 
@@ -218,12 +377,13 @@ def _generate_docs_db(input_path: Path, output_path: Path) -> None:
         _expand_faststream_docs(input_path / FASTSTREAM_ROOT_DIR_NAME)
 
         docs = _create_documents(input_path / FASTSTREAM_ROOT_DIR_NAME / FASTSTREAM_DOCS_DIR_SUFFIX) 
-        _save_embeddings_db(docs, output_path)
+        doc_chunks = _split_markdown_into_chunks(docs)
+        _save_embeddings_db(doc_chunks, output_path)
 
         sp.text = ""
         sp.ok(f" ✔ Docs embeddings created and saved to: {output_path}")
 
-# %% ../../nbs/Embeddings_CLI.ipynb 16
+# %% ../../nbs/Embeddings_CLI.ipynb 19
 def _check_all_files_exist(d: Path, required_files: List[str]) -> bool:
     """Check if all required files exist in a directory.
 
@@ -238,7 +398,7 @@ def _check_all_files_exist(d: Path, required_files: List[str]) -> bool:
     """
     return all((d / file_name).exists() for file_name in required_files)
 
-# %% ../../nbs/Embeddings_CLI.ipynb 19
+# %% ../../nbs/Embeddings_CLI.ipynb 22
 def _append_file_contents(d: Path, parent_d: Path, required_files: List[str]) -> None:
     """Append contents of specified files to a result file.
 
@@ -262,7 +422,25 @@ def _append_file_contents(d: Path, parent_d: Path, required_files: List[str]) ->
                     f"==== {file_name} starts ====\n{file.read()}\n==== {file_name} ends ====\n"
                 )
 
-# %% ../../nbs/Embeddings_CLI.ipynb 21
+# %% ../../nbs/Embeddings_CLI.ipynb 24
+def _get_description_documents(examples: List[Document]) -> List[Document]:
+    """Create the documents with only the description of each example as the content.
+
+    Args:
+        examples: The documents with the appended example files.
+
+    Returns:
+        The description documents. The full example is stored in their example metadata.
+    """
+    return [
+        Document(
+            page_content=_split_text(d.page_content, examples_delimiter["description"]).strip(),
+            metadata={**d.metadata, "example": d.page_content},
+        )
+        for d in examples
+    ]
+
+# %% ../../nbs/Embeddings_CLI.ipynb 26
 def _format_examples(input_path: Path, required_files: List[str]) -> None:
     """Format Examples by Appending File Contents.
 
@@ -294,8 +472,9 @@ def _generate_examples_db(
     This function creates embeddings for a collection of example documents located in
     the specified input directory and saves the embeddings database to the specified
     output directory. It appends the contents of specified files in each example
-    directory, splits the concatenated document into chunks based on specified
-    separators, and saves the embeddings for each chunk in the output database.
+    directory and embeds only the description of each example, because the examples
+    are searched by the app description. The full example is stored in the example
+    metadata of the document.
 
     Args:
         input_path (Path): The path to the directory containing example documents.
@@ -312,23 +491,43 @@ def _generate_examples_db(
         docs = _create_documents(
             input_path / FASTSTREAM_TMP_DIR_PREFIX, extension="*.txt"
         )
-#         doc_chunks = _split_document_into_chunks(
-#             docs, separator="==== description.txt ends ===="
-#         )
-        _save_embeddings_db(docs, output_path)
+        _save_embeddings_db(_get_description_documents(docs), output_path)
 
         sp.text = ""
         sp.ok(f" ✔ Examples embeddings created and saved to: {output_path}")
 
-# %% ../../nbs/Embeddings_CLI.ipynb 23
+# %% ../../nbs/Embeddings_CLI.ipynb 28
+def _save_description_validation_context(db_path: Path) -> None:
+    """Save the document used as the context for the app description validation.
+
+    The validation always searches the docs for the same query, so the result is
+    stored next to the vector databases and loaded as a static string at runtime.
+
+    Args:
+        db_path: The path to the directory with the docs vector database.
+    """
+    context = _get_relevant_document(DESCRIPTION_VALIDATION_QUERY, db_path / "docs")
+    (db_path / DESCRIPTION_VALIDATION_CONTEXT_FILE_NAME).write_text(context, encoding="utf-8")
+
+# %% ../../nbs/Embeddings_CLI.ipynb 30
+def _save_template_archive(db_path: Path) -> None:
+    """Save the faststream-template archive used when the template can't be downloaded.
+
+    Args:
+        db_path: The path to the package data directory.
+    """
+    response = _fetch_content(FASTSTREAM_TEMPLATE_ZIP_URL)
+    (db_path / TEMPLATE_ARCHIVE_FILE_NAME).write_bytes(response.content)
+
+# %% ../../nbs/Embeddings_CLI.ipynb 32
 app = typer.Typer(
     short_help="Download the zipped FastKafka documentation markdown files, generate embeddings, and save them in a vector database.",
 )
 
-# %% ../../nbs/Embeddings_CLI.ipynb 24
+# %% ../../nbs/Embeddings_CLI.ipynb 33
 @app.command(
     "generate",
-    help="Download the docs and examples from FastStream repo, generate embeddings, and save them in a vector database.",
+    help="Download the docs and examples from FastStream repo, generate embeddings, and save them in a vector database together with the project template archive.",
 )
 def generate(
     db_path: str = typer.Option(
@@ -342,23 +541,35 @@ def generate(
         f"Downloading documentation and examples for semantic search."
     )
     try:
-        _delete_directory(db_path)
-
+        # only the docs and the code snippets included in them are extracted
         with download_and_extract_github_repo(
-            FASTSTREAM_REPO_ZIP_URL
+            FASTSTREAM_REPO_ZIP_URL,
+            include=_get_prefix_filter([
+                f"{FASTSTREAM_ROOT_DIR_NAME}/{FASTSTREAM_EN_DOCS_DIR}",
+                f"{FASTSTREAM_ROOT_DIR_NAME}/{FASTSTREAM_DOCS_SRC_DIR}",
+            ]),
+            max_workers=os.cpu_count() or 1,
         ) as extracted_path:
             _generate_docs_db(
                 extracted_path, Path(db_path) / "docs"
             )
 
         with download_and_extract_github_repo(
-            FASTSTREAM_GEN_REPO_ZIP_URL
+            FASTSTREAM_GEN_REPO_ZIP_URL,
+            include=_get_prefix_filter([FASTSTREAM_GEN_EXAMPLES_DIR_SUFFIX]),
+            max_workers=os.cpu_count() or 1,
         ) as extracted_path:
             _generate_examples_db(
                 extracted_path / FASTSTREAM_GEN_EXAMPLES_DIR_SUFFIX,
                 Path(db_path) / "examples",
             )
 
+        save_precomputed_query_embeddings(
+            [DESCRIPTION_VALIDATION_QUERY], Path(db_path) / QUERY_EMBEDDINGS_FILE_NAME
+        )
+        _save_description_validation_context(Path(db_path))
+        _save_template_archive(Path(db_path))
+
         typer.echo(
             f"\nSuccessfully generated all the embeddings and saved to: {db_path}"
         )
@@ -0,0 +1,51 @@
+# AUTOGENERATED! DO NOT EDIT! File to edit: ../../nbs/File_Lock.ipynb.
+
+# %% auto 0
+__all__ = ['file_lock']
+
+# %% ../../nbs/File_Lock.ipynb 1
+from typing import *
+import sys
+import time
+from pathlib import Path
+from contextlib import contextmanager
+
+if sys.platform == "win32":
+    import msvcrt
+else:
+    import fcntl
+
+# %% ../../nbs/File_Lock.ipynb 3
+@contextmanager
+def file_lock(path: Union[str, Path]) -> Generator[None, None, None]:
+    """Hold an exclusive lock on the file for the duration of the context manager.
+
+    The lock is taken on a new file descriptor every time, so it serializes both the
+    threads of one process and the processes sharing the same cache directory. The lock
+    is released by the operating system if the process dies while holding it.
+
+    Args:
+        path: The path to the lock file, which is created if it doesn't exist.
+    """
+    path = Path(path)
+    path.parent.mkdir(parents=True, exist_ok=True)
+    with open(path, "a+b") as f:
+        if sys.platform == "win32":
+            f.seek(0)
+            while True:
+                try:
+                    # LK_LOCK gives up after 10 seconds
+                    msvcrt.locking(f.fileno(), msvcrt.LK_LOCK, 1)
+                    break
+                except OSError:
+                    time.sleep(0.1)
+        else:
+            fcntl.flock(f.fileno(), fcntl.LOCK_EX)
+        try:
+            yield
+        finally:
+            if sys.platform == "win32":
+                f.seek(0)
+                msvcrt.locking(f.fileno(), msvcrt.LK_UNLCK, 1)
+            else:
+                fcntl.flock(f.fileno(), fcntl.LOCK_UN)
@@ -8,8 +8,10 @@ from typing import *
 import shutil
 from pathlib import Path
 import os
+import json
 import toml
 import re
+import shlex
 from tempfile import TemporaryDirectory
 from contextlib import contextmanager
 from collections import defaultdict
@@ -18,6 +20,8 @@ import subprocess  # nosec: B404: Consider possible security implications associ
 from yaspin import yaspin
 
 from .logger import get_logger
+from .venv_pool import get_venv_pool, _get_site_packages
+from .wheelhouse import get_wheelhouse
 
 from .._code_generator.prompts import REQUIREMENTS_GENERATION_PROMPT
 from faststream_gen._code_generator.constants import (
@@ -25,6 +29,7 @@ from faststream_gen._code_generator.constants import (
     TEST_FILE_PATH,
     STEP_LOG_DIR_NAMES,
     TOML_FILE_NAME,
+    VENV_INSTALLED_REQUIREMENTS_FILE_NAME,
     OpenAIModel,
 )
 
@@ -33,7 +38,6 @@ from .._code_generator.chat import CustomAIChat, ValidateAndFixResponse
 from faststream_gen._code_generator.helper import (
     write_file_contents,
     read_file_contents,
-    set_cwd,
     mock_openai_create,
     retry_on_error,
 )
@@ -45,20 +49,38 @@ create_venv_and_run_tests_bash_script = """
 # get the project directory from command line argument
 project_dir=$1
 
-# get the venv directory from command line argument
+# get the venv directory borrowed from the pool from command line argument
 venv_dir=$2
 
-# create a new venv in the specified directory
-python3 -m venv $venv_dir/my_venv > /dev/null 2>&1
+# get the file with the requirements which are not yet installed in the venv from command line argument
+requirements_file=$3
+
+# get the flag for building and installing the project from command line argument
+install_project=$4
 
 # activate the venv
-source $venv_dir/my_venv/bin/activate
+source $venv_dir/bin/activate
 
 # navigate to the project directory
 cd $project_dir
 
-# install the python project inside the venv
-pip install .['dev'] > /dev/null 2>&1
+# install only the missing requirements inside the venv
+pip_exit_code=0
+if [ -s $requirements_file ]; then
+    pip install -r $requirements_file > /dev/null 2>&1
+    pip_exit_code=$?
+fi
+
+# print the pip exit code
+echo "pip_exit_code:$pip_exit_code"
+
+if [ "$install_project" = "true" ]; then
+    # build and install the python project inside the venv, its requirements are already installed
+    pip install --no-deps . > /dev/null 2>&1
+else
+    # put the project root on sys.path instead of installing the project
+    export PYTHONPATH=$project_dir${PYTHONPATH:+:$PYTHONPATH}
+fi
 
 # run pytest and capture output
 pytest_output=$(pytest --tb=short)
@@ -77,18 +99,131 @@ deactivate
 """
 
 # %% ../../nbs/Integration_Test_Generator.ipynb 4
-def _setup_venv_and_run_tests(output_path: str) -> List[str]:
+def _parse_requirement(requirement: str) -> Tuple[str, Set[str], str]:
+    requirement, _, marker = requirement.partition(";")
+    match = re.match(
+        r"^([A-Za-z0-9][A-Za-z0-9._-]*)\s*(?:\[(.*)\])?\s*(.*)$", requirement.strip()
+    )
+    if match is None:
+        return requirement.strip().lower(), set(), ""
+
+    name = re.sub(r"[-_.]+", "-", match.group(1)).lower()
+    extras = {e.strip().lower() for e in (match.group(2) or "").split(",") if e.strip()}
+    spec = re.sub(r"\s+", "", match.group(3))
+    marker = " ".join(marker.split())
+    if marker:
+        spec = f"{spec}; {marker}"
+    return name, extras, spec
+
+
+def _format_requirement(name: str, extras: Set[str], spec: str) -> str:
+    extras_str = f"[{','.join(sorted(extras))}]" if len(extras) > 0 else ""
+    return f"{name}{extras_str}{spec}"
+
+
+def _merge_requirements(requirements: List[str], new_requirements: List[str]) -> List[str]:
+    """Merge two lists of requirements into a normalized list without duplicates.
+
+    Requirements with the same name are merged into one, their extras are combined
+    and the version specifier of the later one takes precedence.
+
+    Args:
+        requirements: The existing requirements.
+        new_requirements: The requirements to add.
+
+    Returns:
+        The normalized and deduplicated list of requirements.
+    """
+    merged: Dict[str, Tuple[Set[str], str]] = {}
+    for requirement in requirements + new_requirements:
+        if requirement.strip() == "":
+            continue
+        name, extras, spec = _parse_requirement(requirement)
+        if name in merged:
+            prev_extras, prev_spec = merged[name]
+            extras = extras | prev_extras
+            spec = spec or prev_spec
+        merged[name] = (extras, spec)
+
+    return [_format_requirement(name, extras, spec) for name, (extras, spec) in merged.items()]
+
+# %% ../../nbs/Integration_Test_Generator.ipynb 6
+def _get_project_requirements(data: Dict[str, Any]) -> List[str]:
+    project_name = _parse_requirement(data["project"]["name"])[0]
+    requirements = data["project"].get("dependencies", []) + [
+        r for group in data["project"].get("optional-dependencies", {}).values() for r in group
+    ]
+    return [
+        r
+        for r in _merge_requirements([], requirements)
+        if _parse_requirement(r)[0] != project_name
+    ]
+
+
+def _get_installed_requirements_file(venv_dir: str) -> Path:
+    # inside site-packages, so the venv pool doesn't hand back the clone with the extra requirements
+    return _get_site_packages(Path(venv_dir)) / VENV_INSTALLED_REQUIREMENTS_FILE_NAME
+
+
+def _read_installed_requirements(venv_dir: str) -> List[str]:
+    installed_requirements_file = _get_installed_requirements_file(venv_dir)
+    if not installed_requirements_file.exists():
+        return []
+    return json.loads(read_file_contents(str(installed_requirements_file)))  # type: ignore
+
+
+def _write_installed_requirements(venv_dir: str, requirements: List[str]) -> None:
+    installed_requirements_file = _get_installed_requirements_file(venv_dir)
+    write_file_contents(str(installed_requirements_file), json.dumps(requirements))
+
+# %% ../../nbs/Integration_Test_Generator.ipynb 8
+def _setup_venv_and_run_tests(
+    output_path: str, venv_dir: Optional[str] = None, install_project: bool = False
+) -> List[str]:
+    if venv_dir is None:
+        with get_venv_pool().borrow() as borrowed_venv_dir:
+            return _setup_venv_and_run_tests(
+                output_path, str(borrowed_venv_dir), install_project
+            )
+
     output_path_resolved = Path(output_path).resolve()
+    toml_data = toml.loads(read_file_contents(str(output_path_resolved / TOML_FILE_NAME)))
+    installed_requirements = _read_installed_requirements(venv_dir)
+    missing_requirements = [
+        r for r in _get_project_requirements(toml_data) if r not in installed_requirements
+    ]
     with TemporaryDirectory() as d:
         bash_file = Path(d) / "run_tests.sh"
         write_file_contents(str(bash_file), create_venv_and_run_tests_bash_script)
-        with set_cwd(d):
-            # nosemgrep: python.lang.security.audit.subprocess-shell-true.subprocess-shell-true
-            p = subprocess.run( # nosec: B602, B603, B607 subprocess call - check for execution of untrusted input.
-                ["bash", "run_tests.sh", output_path_resolved, Path(d).resolve()],
-                capture_output=True,
-                text=True,
-            )
+        requirements_file = Path(d) / "requirements.txt"
+        if len(missing_requirements) > 0:
+            # Install from the local wheelhouse, without reaching the package index if everything is cached
+            wheelhouse = get_wheelhouse()
+            wheelhouse.fill(missing_requirements)
+            pip_args = shlex.join(wheelhouse.get_pip_args(missing_requirements))
+            write_file_contents(str(requirements_file), "\n".join([pip_args] + missing_requirements))
+        else:
+            requirements_file.touch()
+        # the working directory is passed to the subprocess, the batch command runs the jobs in threads of one process
+        # nosemgrep: python.lang.security.audit.subprocess-shell-true.subprocess-shell-true
+        p = subprocess.run( # nosec: B602, B603, B607 subprocess call - check for execution of untrusted input.
+            [
+                "bash",
+                str(bash_file.resolve()),
+                output_path_resolved,
+                venv_dir,
+                requirements_file.resolve(),
+                str(install_project).lower(),
+            ],
+            capture_output=True,
+            text=True,
+            cwd=d,
+        )
+
+        # Remember the installed requirements so the next attempt installs only the changes
+        pip_exit_code = int(re.search('pip_exit_code:(\d+)', p.stdout).group(1)) # type: ignore
+        if pip_exit_code == 0:
+            _write_installed_requirements(venv_dir, installed_requirements + missing_requirements)
             
         # Extract exit code
         exit_code = int(re.search('pytest_exit_code:(\d+)', p.stdout).group(1)) # type: ignore
@@ -99,7 +234,7 @@ def _setup_venv_and_run_tests(output_path: str) -> List[str]:
         
         return []    
 
-# %% ../../nbs/Integration_Test_Generator.ipynb 7
+# %% ../../nbs/Integration_Test_Generator.ipynb 13
 def _stript(s: str) -> str:
     return s.strip().strip('"')
 
@@ -111,7 +246,7 @@ def _split_app_and_test_req(response: str) -> Tuple[str, str]:
     )
     return _stript(app_req), _stript(test_req)
 
-# %% ../../nbs/Integration_Test_Generator.ipynb 10
+# %% ../../nbs/Integration_Test_Generator.ipynb 16
 def _update_toml_file(output_dir: str, app_req: str, test_req: str) -> None:
     toml_file_path = f"{output_dir}/{TOML_FILE_NAME}"
     toml_contents = read_file_contents(toml_file_path)
@@ -121,15 +256,19 @@ def _update_toml_file(output_dir: str, app_req: str, test_req: str) -> None:
     test_reqs = [r.strip() for r in test_req.split(",")]
     test_reqs = [r for r in test_reqs if r != "pytest"]
     
-    data["project"]["dependencies"] = data["project"]["dependencies"] + app_reqs
-    data["project"]["optional-dependencies"]["testing"] = data["project"]["optional-dependencies"]["testing"] + test_reqs
+    data["project"]["dependencies"] = _merge_requirements(data["project"]["dependencies"], app_reqs)
+    data["project"]["optional-dependencies"]["testing"] = _merge_requirements(data["project"]["optional-dependencies"]["testing"], test_reqs)
     
     toml_string = toml.dumps(data)
     write_file_contents(toml_file_path, toml_string)
 
-# %% ../../nbs/Integration_Test_Generator.ipynb 12
+# %% ../../nbs/Integration_Test_Generator.ipynb 19
 def _validate_response(
-    response: str, output_directory: str, **kwargs: Dict[str, Any]
+    response: str,
+    output_directory: str,
+    venv_dir: Optional[str] = None,
+    install_project: bool = False,
+    **kwargs: Dict[str, Any],
 ) -> List[str]:
     try:
         app_req, test_req = _split_app_and_test_req(response)
@@ -140,9 +279,9 @@ def _validate_response(
     
     _update_toml_file(output_directory, app_req, test_req)
     
-    return _setup_venv_and_run_tests(output_directory)
+    return _setup_venv_and_run_tests(output_directory, venv_dir, install_project)
 
-# %% ../../nbs/Integration_Test_Generator.ipynb 16
+# %% ../../nbs/Integration_Test_Generator.ipynb 23
 @retry_on_error()  # type: ignore
 def _generate(
     model: str,
@@ -175,11 +314,12 @@ def _generate(
         else validator_result
     )
 
-# %% ../../nbs/Integration_Test_Generator.ipynb 19
+# %% ../../nbs/Integration_Test_Generator.ipynb 26
 def fix_requirements_and_run_tests(
     output_directory: str,
     model: str,
     total_usage: List[Dict[str, int]],
+    install_project: bool = False,
 ) -> Tuple[List[Dict[str, int]], bool]:
     with yaspin(
         text="Running integration tests...", color="cyan", spinner="clock"
@@ -192,13 +332,17 @@ def fix_requirements_and_run_tests(
 
         app_and_test_code = f"==== APP CODE ====\n\n{app_code}\n\n==== TEST CODE ====\n\n{test_code}\n\n"
 
-        total_usage, is_requirements_file_valid = _generate(
-            model,
-            REQUIREMENTS_GENERATION_PROMPT,
-            app_and_test_code,
-            total_usage,
-            output_directory,
-        )
+        # Keep the same venv across the retries so only the changed requirements are installed
+        with get_venv_pool().borrow() as venv_dir:
+            total_usage, is_requirements_file_valid = _generate(
+                model,
+                REQUIREMENTS_GENERATION_PROMPT,
+                app_and_test_code,
+                total_usage,
+                output_directory,
+                venv_dir=str(venv_dir),
+                install_project=install_project,
+            )
 
         sp.text = ""
         if is_requirements_file_valid:
@@ -10,13 +10,10 @@ from yaspin import yaspin
 import shutil
 import os
 
+import typer
 
-from faststream_gen._code_generator.helper import (
-    download_and_extract_github_repo,
-)
+from .template_cache import get_template_cache
 from faststream_gen._code_generator.constants import (
-    FASTSTREAM_TEMPLATE_ZIP_URL,
-    FASTSTREAM_TEMPLATE_DIR_SUFFIX,
     APPLICATION_FILE_PATH,
     TEST_FILE_PATH,
     STAT_0o775
@@ -31,28 +28,20 @@ def create_project(
     with yaspin(
         text="Creating a new FastStream project...", color="cyan", spinner="clock"
     ) as sp:
-        with download_and_extract_github_repo(
-            FASTSTREAM_TEMPLATE_ZIP_URL
-        ) as extracted_path:
-            app_file = str(
-                extracted_path / FASTSTREAM_TEMPLATE_DIR_SUFFIX / APPLICATION_FILE_PATH
-            )
-            write_file_contents(app_file, "")
-            test_file = str(
-                extracted_path / FASTSTREAM_TEMPLATE_DIR_SUFFIX / TEST_FILE_PATH
-            )
-            write_file_contents(test_file, "")
-
-            for p in (
-                Path(extracted_path) / FASTSTREAM_TEMPLATE_DIR_SUFFIX / "scripts"
-            ).glob("*.sh"):
-                p.chmod(STAT_0o775)
-
-            shutil.copytree(
-                str(extracted_path / FASTSTREAM_TEMPLATE_DIR_SUFFIX),
-                output_path,
-                dirs_exist_ok=True,
-            )
+        try:
+            template_path = get_template_cache().get_template_path()
+        except RuntimeError as e:
+            sp.stop()
+            typer.secho(f"Unexpected internal error: {e}", err=True, fg=typer.colors.RED)
+            raise typer.Exit(code=1)
+
+        shutil.copytree(str(template_path), output_path, dirs_exist_ok=True)
+
+        write_file_contents(str(Path(output_path) / APPLICATION_FILE_PATH), "")
+        write_file_contents(str(Path(output_path) / TEST_FILE_PATH), "")
+
+        for p in (Path(output_path) / "scripts").glob("*.sh"):
+            p.chmod(STAT_0o775)
 
         sp.text = ""
         sp.ok(f" ✔ New FastStream project created.")
@@ -0,0 +1,189 @@
+# AUTOGENERATED! DO NOT EDIT! File to edit: ../../nbs/Template_Cache.ipynb.
+
+# %% auto 0
+__all__ = ['logger', 'TemplateCache', 'get_template_cache']
+
+# %% ../../nbs/Template_Cache.ipynb 1
+from typing import *
+import io
+import json
+import time
+import uuid
+import shutil
+import hashlib
+import zipfile
+import threading
+from pathlib import Path
+
+import requests
+
+from .logger import get_logger
+from .file_lock import file_lock
+from .package_data import get_root_data_path
+from .wheelhouse import _is_offline
+from faststream_gen._code_generator.constants import (
+    FASTSTREAM_GEN_CACHE_DIR,
+    FASTSTREAM_TEMPLATE_ZIP_URL,
+    FASTSTREAM_TEMPLATE_DIR_SUFFIX,
+    TEMPLATE_CACHE_DIR_NAME,
+    TEMPLATE_CACHE_MAX_AGE_SECONDS,
+    TEMPLATE_ARCHIVE_FILE_NAME,
+)
+
+# %% ../../nbs/Template_Cache.ipynb 3
+logger = get_logger(__name__)
+
+# %% ../../nbs/Template_Cache.ipynb 4
+class TemplateCache:
+    """A local, versioned cache of the faststream-template archive.
+
+    The archive is revalidated with ETag/If-Modified-Since at most once per max_age_seconds
+    and each version is extracted only once into a directory named by its content hash.
+    When the archive can't be downloaded, the cached version is used and, if there is none,
+    the copy bundled in the package data.
+
+    Attributes:
+        root_path: The directory where the archive and the extracted versions are stored.
+        url: The URL of the template archive.
+        bundled_path: The archive used when nothing could be downloaded.
+        offline: If True, the archive is never downloaded.
+        max_age_seconds: How long the cached archive is used without revalidating it.
+    """
+
+    def __init__(
+        self,
+        root_path: Optional[Union[str, Path]] = None,
+        url: str = FASTSTREAM_TEMPLATE_ZIP_URL,
+        bundled_path: Optional[Union[str, Path]] = None,
+        offline: Optional[bool] = None,
+        max_age_seconds: int = TEMPLATE_CACHE_MAX_AGE_SECONDS,
+    ):
+        """Instantiates a new TemplateCache object.
+
+        Args:
+            root_path: The directory where the archive is stored. Defaults to the faststream-gen cache directory.
+            url: The URL of the template archive.
+            bundled_path: The archive used when nothing could be downloaded. Defaults to the one in the package data.
+            offline: Disable downloads. If not passed, it is read from the FASTSTREAM_GEN_OFFLINE environment variable.
+            max_age_seconds: How long the cached archive is used without revalidating it.
+        """
+        self.root_path = Path(
+            root_path
+            if root_path is not None
+            else FASTSTREAM_GEN_CACHE_DIR / TEMPLATE_CACHE_DIR_NAME
+        )
+        self.url = url
+        self.bundled_path = Path(
+            bundled_path
+            if bundled_path is not None
+            else get_root_data_path() / TEMPLATE_ARCHIVE_FILE_NAME
+        )
+        self.offline = offline if offline is not None else _is_offline()
+        self.max_age_seconds = max_age_seconds
+        self._lock = threading.Lock()
+
+    @property
+    def archive_path(self) -> Path:
+        return self.root_path / TEMPLATE_ARCHIVE_FILE_NAME
+
+    def _read_metadata(self) -> Dict[str, Any]:
+        metadata_path = self.root_path / "metadata.json"
+        if not metadata_path.exists() or not self.archive_path.exists():
+            return {}
+        try:
+            metadata: Dict[str, Any] = json.loads(metadata_path.read_text(encoding="utf-8"))
+        except json.JSONDecodeError:
+            # a corrupted metadata file is treated as a cache miss and rewritten on the next download
+            return {}
+        return metadata if metadata.get("url") == self.url else {}
+
+    def _write_metadata(self, metadata: Dict[str, Any]) -> None:
+        metadata_path = self.root_path / "metadata.json"
+        tmp_path = self.root_path / f"metadata.json.{uuid.uuid4().hex}.tmp"
+        tmp_path.write_text(json.dumps(metadata, indent=4), encoding="utf-8")
+        tmp_path.replace(metadata_path)
+
+    def _revalidate(self, metadata: Dict[str, Any]) -> None:
+        headers = {}
+        if "etag" in metadata:
+            headers["If-None-Match"] = metadata["etag"]
+        if "last_modified" in metadata:
+            headers["If-Modified-Since"] = metadata["last_modified"]
+
+        response = requests.get(self.url, headers=headers, timeout=50)
+        response.raise_for_status()
+
+        if response.status_code != 304:
+            self.root_path.mkdir(parents=True, exist_ok=True)
+            tmp_path = self.root_path / f"{TEMPLATE_ARCHIVE_FILE_NAME}.{uuid.uuid4().hex}.tmp"
+            tmp_path.write_bytes(response.content)
+            tmp_path.replace(self.archive_path)
+            metadata = {"url": self.url}
+            if "ETag" in response.headers:
+                metadata["etag"] = response.headers["ETag"]
+            if "Last-Modified" in response.headers:
+                metadata["last_modified"] = response.headers["Last-Modified"]
+
+        metadata["checked_at"] = time.time()
+        self._write_metadata(metadata)
+
+    def _get_archive_path(self) -> Path:
+        metadata = self._read_metadata()
+        is_fresh = time.time() - metadata.get("checked_at", 0) <= self.max_age_seconds
+        if not self.offline and not is_fresh:
+            try:
+                self._revalidate(metadata)
+            except requests.exceptions.RequestException as e:
+                logger.info(f"Failed to download the template from '{self.url}': {e}")
+
+        if self.archive_path.exists():
+            return self.archive_path
+        if self.bundled_path.exists():
+            return self.bundled_path
+        raise RuntimeError(
+            f"Error: The template archive couldn't be downloaded from '{self.url}' and there is no bundled copy at '{self.bundled_path}'."
+        )
+
+    def get_template_path(self) -> Path:
+        """Return the directory with the extracted template.
+
+        Returns:
+            The path to the extracted template directory.
+
+        Raises:
+            RuntimeError: If the template is neither cached nor bundled and can't be downloaded.
+        """
+        # the lock file serializes the revalidation and the extraction between the processes sharing the cache
+        with self._lock, file_lock(self.root_path.parent / f"{self.root_path.name}.lock"):
+            archive_path = self._get_archive_path()
+            content = archive_path.read_bytes()
+            version = hashlib.sha256(content).hexdigest()[:12]
+            template_path = self.root_path / "versions" / version / FASTSTREAM_TEMPLATE_DIR_SUFFIX
+            if template_path.exists():
+                return template_path
+
+            # extract to a temporary directory first, so an interrupted extraction is never used
+            tmp_path = self.root_path / "versions" / f"{version}.{uuid.uuid4().hex}.tmp"
+            with zipfile.ZipFile(io.BytesIO(content), "r") as zip_ref:
+                zip_ref.extractall(tmp_path)
+            try:
+                tmp_path.rename(template_path.parent)
+            except OSError:
+                # extracted by another process in the meantime
+                shutil.rmtree(tmp_path, ignore_errors=True)
+            return template_path
+
+# %% ../../nbs/Template_Cache.ipynb 9
+_template_cache: Optional[TemplateCache] = None
+
+
+def get_template_cache() -> TemplateCache:
+    """Return the process-wide template cache.
+
+    Returns:
+        The shared TemplateCache instance.
+    """
+    global _template_cache
+    if _template_cache is None:
+        _template_cache = TemplateCache()
+    return _template_cache
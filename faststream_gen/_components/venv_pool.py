@@ -0,0 +1,340 @@
+# AUTOGENERATED! DO NOT EDIT! File to edit: ../../nbs/Venv_Pool.ipynb.
+
+# %% auto 0
+__all__ = ['logger', 'app', 'VenvPool', 'get_venv_pool', 'warmup']
+
+# %% ../../nbs/Venv_Pool.ipynb 1
+from typing import *
+import os
+import sys
+import shutil
+import hashlib
+import platform
+import threading
+import time
+import uuid
+import atexit
+from pathlib import Path
+from contextlib import contextmanager
+import subprocess  # nosec: B404: Consider possible security implications associated with the subprocess module.
+
+import typer
+from yaspin import yaspin
+
+from .logger import get_logger
+from .file_lock import file_lock
+from .wheelhouse import get_wheelhouse
+from faststream_gen._code_generator.constants import (
+    FASTSTREAM_GEN_CACHE_DIR,
+    VENV_POOL_DIR_NAME,
+    VENV_POOL_MAX_IDLE,
+    VENV_POOL_CLONE_MAX_AGE_HOURS,
+    VENV_POOL_BASE_REQUIREMENTS,
+    STAT_0o775,
+)
+
+# %% ../../nbs/Venv_Pool.ipynb 3
+logger = get_logger(__name__)
+
+# %% ../../nbs/Venv_Pool.ipynb 5
+def _get_bin_dir(venv_path: Path) -> Path:
+    return venv_path / ("Scripts" if platform.system() == "Windows" else "bin")
+
+
+def _get_python_executable(venv_path: Path) -> Path:
+    return _get_bin_dir(venv_path) / (
+        "python.exe" if platform.system() == "Windows" else "python"
+    )
+
+
+def _get_site_packages(venv_path: Path) -> Path:
+    if platform.system() == "Windows":
+        return venv_path / "Lib" / "site-packages"
+    return next((venv_path / "lib").glob("python*/site-packages"))
+
+
+def _link_or_copy(src: str, dst: str) -> None:
+    try:
+        os.link(src, dst)
+    except OSError:
+        shutil.copy2(src, dst)
+
+
+def _clone_venv(src: Path, dst: Path) -> None:
+    """Clone a virtual environment by hardlinking its files.
+
+    Falls back to copying when hardlinks are not supported. Scripts in the bin
+    directory are rewritten so they point to the clone instead of the source.
+
+    Args:
+        src: Path to the virtual environment to clone.
+        dst: Path where the clone will be created.
+    """
+    shutil.copytree(src, dst, symlinks=True, copy_function=_link_or_copy)
+
+    src_bytes, dst_bytes = str(src).encode("utf-8"), str(dst).encode("utf-8")
+    for p in _get_bin_dir(dst).iterdir():
+        if p.is_symlink() or not p.is_file():
+            continue
+        contents = p.read_bytes()
+        if src_bytes in contents:
+            # break the hardlink before rewriting the script
+            p.unlink()
+            p.write_bytes(contents.replace(src_bytes, dst_bytes))
+            p.chmod(STAT_0o775)
+
+# %% ../../nbs/Venv_Pool.ipynb 8
+def _is_process_running(pid: int) -> bool:
+    if sys.platform == "win32":
+        # os.kill terminates the process on Windows, so only the age of the clones is checked
+        return True
+    try:
+        os.kill(pid, 0)
+    except ProcessLookupError:
+        return False
+    except PermissionError:
+        pass
+    return True
+
+
+def _hash_requirements(requirements: List[str]) -> str:
+    key = "\n".join([sys.executable, platform.python_version()] + sorted(requirements))
+    return hashlib.sha256(key.encode("utf-8")).hexdigest()[:12]
+
+
+class VenvPool:
+    """A pool of pre-warmed virtual environments for running the integration tests.
+
+    The base virtual environment is created once with the base requirements installed.
+    Each test run borrows a hardlinked clone of it and installs only the requirements
+    that are missing. Clean clones are handed back to the pool, modified ones are deleted.
+
+    Attributes:
+        root_path: The directory where the base environment and the clones are stored.
+        base_requirements: Requirements preinstalled in the base environment.
+        max_idle: Maximum number of clean clones kept in the pool.
+    """
+
+    def __init__(
+        self,
+        root_path: Optional[Union[str, Path]] = None,
+        base_requirements: List[str] = VENV_POOL_BASE_REQUIREMENTS,
+        max_idle: int = VENV_POOL_MAX_IDLE,
+    ):
+        """Instantiates a new VenvPool object.
+
+        Args:
+            root_path: The directory where the environments are stored. Defaults to the faststream-gen cache directory.
+            base_requirements: Requirements preinstalled in the base environment.
+            max_idle: Maximum number of clean clones kept in the pool.
+        """
+        self.root_path = Path(
+            root_path
+            if root_path is not None
+            else FASTSTREAM_GEN_CACHE_DIR / VENV_POOL_DIR_NAME
+        ).resolve()
+        self.base_requirements = base_requirements
+        self.max_idle = max_idle
+        self.base_path = self.root_path / f"base-{_hash_requirements(base_requirements)}"
+        self._idle: List[Path] = []
+        self._lock = threading.Lock()
+        self._pruned = False
+        # idle clones live only as long as the process which created them
+        atexit.register(self.clear)
+
+    def _prune_clones(self) -> None:
+        # clones of the processes which were killed before their atexit cleanup ran
+        clones_path = self.root_path / "clones"
+        if not clones_path.exists():
+            return
+
+        min_mtime = time.time() - VENV_POOL_CLONE_MAX_AGE_HOURS * 60 * 60
+        for clone_path in clones_path.iterdir():
+            pid = clone_path.name.split("-")[0]
+            if pid == str(os.getpid()):
+                continue
+            try:
+                is_stale = clone_path.stat().st_mtime < min_mtime or (
+                    pid.isdigit() and not _is_process_running(int(pid))
+                )
+            except FileNotFoundError:
+                continue
+            if is_stale:
+                logger.info(f"Deleting the stale virtual environment clone '{clone_path}'.")
+                shutil.rmtree(clone_path, ignore_errors=True)
+
+    def _create_base(self) -> None:
+        if not self._pruned:
+            self._prune_clones()
+            self._pruned = True
+
+        if (self.base_path / ".ready").exists():
+            return
+
+        # another process sharing the cache directory may be building the same base environment
+        with file_lock(self.root_path / f"{self.base_path.name}.lock"):
+            self._create_base_locked()
+
+    def _create_base_locked(self) -> None:
+        if (self.base_path / ".ready").exists():
+            return
+
+        if self.base_path.exists():
+            # leftover from an interrupted run
+            shutil.rmtree(self.base_path)
+
+        logger.info(f"Creating the base virtual environment in '{self.base_path}'.")
+        self.base_path.parent.mkdir(parents=True, exist_ok=True)
+        cmds = [[sys.executable, "-m", "venv", str(self.base_path)]]
+        if len(self.base_requirements) > 0:
+            wheelhouse = get_wheelhouse()
+            wheelhouse.fill(self.base_requirements)
+            cmds.append(
+                [str(_get_python_executable(self.base_path)), "-m", "pip", "install"]
+                + wheelhouse.get_pip_args(self.base_requirements)
+                + self.base_requirements
+            )
+        for cmd in cmds:
+            # nosemgrep: python.lang.security.audit.subprocess-shell-true.subprocess-shell-true
+            p = subprocess.run(  # nosec: B603 subprocess call - check for execution of untrusted input.
+                cmd, capture_output=True, text=True
+            )
+            if p.returncode != 0:
+                shutil.rmtree(self.base_path, ignore_errors=True)
+                raise RuntimeError(
+                    f"Failed to create the base virtual environment:\n{p.stderr}"
+                )
+
+        (self.base_path / ".ready").touch()
+
+    def _clone(self) -> Path:
+        # the name records the owner, so the clones of dead processes can be pruned later
+        clone_path = self.root_path / "clones" / f"{os.getpid()}-{uuid.uuid4().hex}"
+        clone_path.parent.mkdir(parents=True, exist_ok=True)
+        _clone_venv(self.base_path, clone_path)
+        return clone_path
+
+    def _is_clean(self, venv_path: Path) -> bool:
+        return sorted(os.listdir(_get_site_packages(venv_path))) == sorted(
+            os.listdir(_get_site_packages(self.base_path))
+        )
+
+    def warmup(self, n: int = 1) -> None:
+        """Create the base environment and fill the pool with clean clones.
+
+        Args:
+            n: The number of clones to prepare.
+        """
+        with self._lock:
+            self._create_base()
+            while len(self._idle) < min(n, self.max_idle):
+                self._idle.append(self._clone())
+
+    def acquire(self) -> Path:
+        """Take a clean clone of the base environment from the pool.
+
+        Returns:
+            The path to the borrowed virtual environment.
+        """
+        with self._lock:
+            self._create_base()
+            while len(self._idle) > 0:
+                venv_path = self._idle.pop()
+                # pruned by another process if this one was idle for too long
+                if venv_path.exists():
+                    return venv_path
+            return self._clone()
+
+    def release(self, venv_path: Path) -> None:
+        """Hand the clone back to the pool if it is still clean, otherwise delete it.
+
+        Args:
+            venv_path: The path to the borrowed virtual environment.
+        """
+        with self._lock:
+            if len(self._idle) < self.max_idle and self._is_clean(venv_path):
+                self._idle.append(venv_path)
+                return
+        shutil.rmtree(venv_path, ignore_errors=True)
+
+    @contextmanager
+    def borrow(self) -> Generator[Path, None, None]:
+        """Borrow a clean clone of the base environment for the duration of the context manager.
+
+        Yields:
+            The path to the borrowed virtual environment.
+        """
+        venv_path = self.acquire()
+        try:
+            yield venv_path
+        finally:
+            self.release(venv_path)
+
+    def clear(self) -> None:
+        """Delete all idle clones from the pool."""
+        with self._lock:
+            for venv_path in self._idle:
+                shutil.rmtree(venv_path, ignore_errors=True)
+            self._idle = []
+
+# %% ../../nbs/Venv_Pool.ipynb 13
+_venv_pool: Optional[VenvPool] = None
+
+
+def get_venv_pool() -> VenvPool:
+    """Return the process-wide virtual environment pool.
+
+    Returns:
+        The shared VenvPool instance.
+    """
+    global _venv_pool
+    if _venv_pool is None:
+        _venv_pool = VenvPool()
+    return _venv_pool
+
+# %% ../../nbs/Venv_Pool.ipynb 16
+app = typer.Typer(
+    short_help="Prefill the local wheelhouse and the virtual environment pool used for running the integration tests.",
+)
+
+# %% ../../nbs/Venv_Pool.ipynb 17
+@app.command(
+    "warmup",
+    help="Download the wheels for the integration test requirements into the local wheelhouse and create the base virtual environment.",
+)
+def warmup(
+    requirements: Optional[List[str]] = typer.Argument(
+        None,
+        help="Additional requirements to download into the wheelhouse.",
+    ),
+) -> None:
+    try:
+        wheelhouse = get_wheelhouse()
+        with yaspin(
+            text="Downloading wheels into the local wheelhouse...",
+            color="cyan",
+            spinner="clock",
+        ) as sp:
+            missing = wheelhouse.fill(VENV_POOL_BASE_REQUIREMENTS + (requirements or []))
+
+            sp.text = ""
+            if len(missing) > 0:
+                sp.color = "red"
+                sp.ok(f" ✘ Error: Failed to download wheels for: {', '.join(missing)}")
+            else:
+                sp.ok(f" ✔ Wheels saved to: {wheelhouse.root_path}")
+
+        with yaspin(
+            text="Creating the base virtual environment...",
+            color="cyan",
+            spinner="clock",
+        ) as sp:
+            # idle clones don't outlive the process, so only the base environment is created
+            get_venv_pool().warmup(n=0)
+
+            sp.text = ""
+            sp.ok(f" ✔ Base virtual environment created in: {get_venv_pool().base_path}")
+    except Exception as e:
+        fg = typer.colors.RED
+        typer.secho(f"Unexpected internal error: {e}", err=True, fg=fg)
+        raise typer.Exit(code=1)
@@ -0,0 +1,176 @@
+# AUTOGENERATED! DO NOT EDIT! File to edit: ../../nbs/Wheelhouse.ipynb.
+
+# %% auto 0
+__all__ = ['logger', 'Wheelhouse', 'get_wheelhouse']
+
+# %% ../../nbs/Wheelhouse.ipynb 1
+from typing import *
+import os
+import re
+import sys
+import json
+import threading
+import uuid
+from datetime import datetime
+from pathlib import Path
+import subprocess  # nosec: B404: Consider possible security implications associated with the subprocess module.
+
+from .logger import get_logger
+from .file_lock import file_lock
+from faststream_gen._code_generator.constants import (
+    FASTSTREAM_GEN_CACHE_DIR,
+    FASTSTREAM_GEN_OFFLINE_ENV_VAR,
+    WHEELHOUSE_DIR_NAME,
+    WHEELHOUSE_INDEX_FILE_NAME,
+)
+
+# %% ../../nbs/Wheelhouse.ipynb 3
+logger = get_logger(__name__)
+
+# %% ../../nbs/Wheelhouse.ipynb 4
+def _get_requirement_key(requirement: str) -> str:
+    return re.sub(r"\s+", "", requirement).lower()
+
+
+def _is_offline() -> bool:
+    return os.environ.get(FASTSTREAM_GEN_OFFLINE_ENV_VAR, "").lower() not in [
+        "",
+        "0",
+        "false",
+    ]
+
+# %% ../../nbs/Wheelhouse.ipynb 6
+class Wheelhouse:
+    """A local directory of wheels used as a package index for the generated project requirements.
+
+    Wheels are downloaded with `pip wheel` the first time a requirement spec is seen and
+    the spec is recorded in the index file. Installs of cached requirements then use
+    `--no-index`, so they don't need the network at all.
+
+    Attributes:
+        root_path: The directory where the wheels are stored.
+        offline: If True, nothing is downloaded and pip never reaches the package index.
+    """
+
+    def __init__(
+        self,
+        root_path: Optional[Union[str, Path]] = None,
+        offline: Optional[bool] = None,
+    ):
+        """Instantiates a new Wheelhouse object.
+
+        Args:
+            root_path: The directory where the wheels are stored. Defaults to the faststream-gen cache directory.
+            offline: Disable downloads and the package index. If not passed, it is read from the FASTSTREAM_GEN_OFFLINE environment variable.
+        """
+        self.root_path = Path(
+            root_path
+            if root_path is not None
+            else FASTSTREAM_GEN_CACHE_DIR / WHEELHOUSE_DIR_NAME
+        ).resolve()
+        self.offline = offline if offline is not None else _is_offline()
+        self._lock = threading.Lock()
+
+    def _read_index(self) -> Dict[str, str]:
+        index_path = self.root_path / WHEELHOUSE_INDEX_FILE_NAME
+        if not index_path.exists():
+            return {}
+        return json.loads(index_path.read_text(encoding="utf-8"))  # type: ignore
+
+    def _write_index(self, index: Dict[str, str]) -> None:
+        self.root_path.mkdir(parents=True, exist_ok=True)
+        index_path = self.root_path / WHEELHOUSE_INDEX_FILE_NAME
+        tmp_path = index_path.with_name(f"{index_path.name}.{uuid.uuid4().hex}.tmp")
+        tmp_path.write_text(json.dumps(index, indent=4), encoding="utf-8")
+        os.replace(tmp_path, index_path)
+
+    def is_cached(self, requirement: str) -> bool:
+        """Check if the wheels for the requirement spec are already in the wheelhouse.
+
+        Args:
+            requirement: The requirement spec.
+
+        Returns:
+            True if the requirement was downloaded before, False otherwise.
+        """
+        return _get_requirement_key(requirement) in self._read_index()
+
+    def _download(self, requirements: List[str], python_executable: str) -> bool:
+        cmd = [
+            python_executable,
+            "-m",
+            "pip",
+            "wheel",
+            "--wheel-dir",
+            str(self.root_path),
+            "--find-links",
+            str(self.root_path),
+        ] + requirements
+        # nosemgrep: python.lang.security.audit.subprocess-shell-true.subprocess-shell-true
+        p = subprocess.run(  # nosec: B603 subprocess call - check for execution of untrusted input.
+            cmd, capture_output=True, text=True
+        )
+        if p.returncode != 0:
+            logger.info(f"Failed to download wheels for {requirements}:\n{p.stderr}")
+        return p.returncode == 0
+
+    def fill(
+        self, requirements: List[str], python_executable: str = sys.executable
+    ) -> List[str]:
+        """Download the wheels for the requirements which are not yet in the wheelhouse.
+
+        Args:
+            requirements: The requirement specs to download.
+            python_executable: The interpreter the wheels are downloaded for.
+
+        Returns:
+            The requirements which are still missing from the wheelhouse.
+        """
+        # the file lock keeps the processes sharing the wheelhouse from losing each other's index entries
+        with self._lock, file_lock(self.root_path.parent / f"{self.root_path.name}.lock"):
+            index = self._read_index()
+            missing = [r for r in requirements if _get_requirement_key(r) not in index]
+            if len(missing) == 0 or self.offline:
+                return missing
+
+            self.root_path.mkdir(parents=True, exist_ok=True)
+            # Download everything at once and fall back to one by one if some requirement is invalid
+            if len(missing) > 1 and self._download(missing, python_executable):
+                downloaded = missing
+            else:
+                downloaded = [r for r in missing if self._download([r], python_executable)]
+
+            timestamp = datetime.now().isoformat()
+            index.update({_get_requirement_key(r): timestamp for r in downloaded})
+            self._write_index(index)
+
+            return [r for r in missing if r not in downloaded]
+
+    def get_pip_args(self, requirements: List[str]) -> List[str]:
+        """Return the pip install arguments which point pip to the wheelhouse.
+
+        Args:
+            requirements: The requirement specs to install.
+
+        Returns:
+            The list of pip install arguments.
+        """
+        pip_args = ["--find-links", str(self.root_path)]
+        if self.offline or all(self.is_cached(r) for r in requirements):
+            pip_args.append("--no-index")
+        return pip_args
+
+# %% ../../nbs/Wheelhouse.ipynb 10
+_wheelhouse: Optional[Wheelhouse] = None
+
+
+def get_wheelhouse() -> Wheelhouse:
+    """Return the process-wide wheelhouse.
+
+    Returns:
+        The shared Wheelhouse instance.
+    """
+    global _wheelhouse
+    if _wheelhouse is None:
+        _wheelhouse = Wheelhouse()
+    return _wheelhouse
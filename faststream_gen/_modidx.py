@@ -7,6 +7,8 @@ d = { 'settings': { 'branch': 'main',
                 'lib_path': 'faststream_gen'},
   'syms': { 'faststream_gen._code_generator.app_and_test_generator': { 'faststream_gen._code_generator.app_and_test_generator._fix_generated_code': ( 'app_and_test_generator.html#_fix_generated_code',
                                                                                                                                                       'faststream_gen/_code_generator/app_and_test_generator.py'),
+                                                                       'faststream_gen._code_generator.app_and_test_generator._fix_generated_codes': ( 'app_and_test_generator.html#_fix_generated_codes',
+                                                                                                                                                       'faststream_gen/_code_generator/app_and_test_generator.py'),
                                                                        'faststream_gen._code_generator.app_and_test_generator._generate': ( 'app_and_test_generator.html#_generate',
                                                                                                                                             'faststream_gen/_code_generator/app_and_test_generator.py'),
                                                                        'faststream_gen._code_generator.app_and_test_generator._split_app_and_test_code': ( 'app_and_test_generator.html#_split_app_and_test_code',
@@ -15,7 +17,9 @@ d = { 'settings': { 'branch': 'main',
                                                                                                                                                      'faststream_gen/_code_generator/app_and_test_generator.py'),
                                                                        'faststream_gen._code_generator.app_and_test_generator.generate_app_and_test': ( 'app_and_test_generator.html#generate_app_and_test',
                                                                                                                                                         'faststream_gen/_code_generator/app_and_test_generator.py')},
-            'faststream_gen._code_generator.app_description_validator': { 'faststream_gen._code_generator.app_description_validator.validate_app_description': ( 'app_description_validator.html#validate_app_description',
+            'faststream_gen._code_generator.app_description_validator': { 'faststream_gen._code_generator.app_description_validator._get_description_validation_context': ( 'app_description_validator.html#_get_description_validation_context',
+                                                                                                                                                                            'faststream_gen/_code_generator/app_description_validator.py'),
+                                                                          'faststream_gen._code_generator.app_description_validator.validate_app_description': ( 'app_description_validator.html#validate_app_description',
                                                                                                                                                                  'faststream_gen/_code_generator/app_description_validator.py')},
             'faststream_gen._code_generator.app_skeleton_generator': { 'faststream_gen._code_generator.app_skeleton_generator._check_response_for_implementation': ( 'app_skeleton_generator.html#_check_response_for_implementation',
                                                                                                                                                                      'faststream_gen/_code_generator/app_skeleton_generator.py'),
@@ -27,50 +31,130 @@ d = { 'settings': { 'branch': 'main',
                                                                                                                                                      'faststream_gen/_code_generator/app_skeleton_generator.py'),
                                                                        'faststream_gen._code_generator.app_skeleton_generator.generate_app_skeleton': ( 'app_skeleton_generator.html#generate_app_skeleton',
                                                                                                                                                         'faststream_gen/_code_generator/app_skeleton_generator.py')},
-            'faststream_gen._code_generator.chat': { 'faststream_gen._code_generator.chat.CustomAIChat': ( 'chat.html#customaichat',
+            'faststream_gen._code_generator.bm25_index': { 'faststream_gen._code_generator.bm25_index.BM25Index': ( 'bm25_index.html#bm25index',
+                                                                                                                    'faststream_gen/_code_generator/bm25_index.py'),
+                                                           'faststream_gen._code_generator.bm25_index.BM25Index.__init__': ( 'bm25_index.html#bm25index.__init__',
+                                                                                                                             'faststream_gen/_code_generator/bm25_index.py'),
+                                                           'faststream_gen._code_generator.bm25_index.BM25Index.from_texts': ( 'bm25_index.html#bm25index.from_texts',
+                                                                                                                               'faststream_gen/_code_generator/bm25_index.py'),
+                                                           'faststream_gen._code_generator.bm25_index.BM25Index.get_scores': ( 'bm25_index.html#bm25index.get_scores',
+                                                                                                                               'faststream_gen/_code_generator/bm25_index.py'),
+                                                           'faststream_gen._code_generator.bm25_index.BM25Index.load': ( 'bm25_index.html#bm25index.load',
+                                                                                                                         'faststream_gen/_code_generator/bm25_index.py'),
+                                                           'faststream_gen._code_generator.bm25_index.BM25Index.save': ( 'bm25_index.html#bm25index.save',
+                                                                                                                         'faststream_gen/_code_generator/bm25_index.py'),
+                                                           'faststream_gen._code_generator.bm25_index._tokenize': ( 'bm25_index.html#_tokenize',
+                                                                                                                    'faststream_gen/_code_generator/bm25_index.py')},
+            'faststream_gen._code_generator.chat': { 'faststream_gen._code_generator.chat.AsyncCustomAIChat': ( 'chat.html#asynccustomaichat',
+                                                                                                                'faststream_gen/_code_generator/chat.py'),
+                                                     'faststream_gen._code_generator.chat.AsyncCustomAIChat.__call__': ( 'chat.html#asynccustomaichat.__call__',
+                                                                                                                         'faststream_gen/_code_generator/chat.py'),
+                                                     'faststream_gen._code_generator.chat.AsyncCustomAIChat.__init__': ( 'chat.html#asynccustomaichat.__init__',
+                                                                                                                         'faststream_gen/_code_generator/chat.py'),
+                                                     'faststream_gen._code_generator.chat.AsyncCustomAIChat._acreate': ( 'chat.html#asynccustomaichat._acreate',
+                                                                                                                         'faststream_gen/_code_generator/chat.py'),
+                                                     'faststream_gen._code_generator.chat.AsyncCustomAIChat._acreate_streaming': ( 'chat.html#asynccustomaichat._acreate_streaming',
+                                                                                                                                   'faststream_gen/_code_generator/chat.py'),
+                                                     'faststream_gen._code_generator.chat.CustomAIChat': ( 'chat.html#customaichat',
                                                                                                            'faststream_gen/_code_generator/chat.py'),
                                                      'faststream_gen._code_generator.chat.CustomAIChat.__call__': ( 'chat.html#customaichat.__call__',
                                                                                                                     'faststream_gen/_code_generator/chat.py'),
                                                      'faststream_gen._code_generator.chat.CustomAIChat.__init__': ( 'chat.html#customaichat.__init__',
                                                                                                                     'faststream_gen/_code_generator/chat.py'),
+                                                     'faststream_gen._code_generator.chat.CustomAIChat._add_user_prompt': ( 'chat.html#customaichat._add_user_prompt',
+                                                                                                                            'faststream_gen/_code_generator/chat.py'),
+                                                     'faststream_gen._code_generator.chat.CustomAIChat._create_streaming': ( 'chat.html#customaichat._create_streaming',
+                                                                                                                             'faststream_gen/_code_generator/chat.py'),
                                                      'faststream_gen._code_generator.chat.CustomAIChat._get_doc': ( 'chat.html#customaichat._get_doc',
                                                                                                                     'faststream_gen/_code_generator/chat.py'),
+                                                     'faststream_gen._code_generator.chat.CustomAIChat._run_stream_checks': ( 'chat.html#customaichat._run_stream_checks',
+                                                                                                                              'faststream_gen/_code_generator/chat.py'),
+                                                     'faststream_gen._code_generator.chat.CustomAIChat.sample': ( 'chat.html#customaichat.sample',
+                                                                                                                  'faststream_gen/_code_generator/chat.py'),
+                                                     'faststream_gen._code_generator.chat.StreamAbortedError': ( 'chat.html#streamabortederror',
+                                                                                                                 'faststream_gen/_code_generator/chat.py'),
+                                                     'faststream_gen._code_generator.chat.StreamAbortedError.__init__': ( 'chat.html#streamabortederror.__init__',
+                                                                                                                          'faststream_gen/_code_generator/chat.py'),
                                                      'faststream_gen._code_generator.chat.ValidateAndFixResponse': ( 'chat.html#validateandfixresponse',
                                                                                                                      'faststream_gen/_code_generator/chat.py'),
                                                      'faststream_gen._code_generator.chat.ValidateAndFixResponse.__init__': ( 'chat.html#validateandfixresponse.__init__',
                                                                                                                               'faststream_gen/_code_generator/chat.py'),
                                                      'faststream_gen._code_generator.chat.ValidateAndFixResponse.fix': ( 'chat.html#validateandfixresponse.fix',
                                                                                                                          'faststream_gen/_code_generator/chat.py'),
+                                                     'faststream_gen._code_generator.chat._aretry_with_exponential_backoff': ( 'chat.html#_aretry_with_exponential_backoff',
+                                                                                                                               'faststream_gen/_code_generator/chat.py'),
+                                                     'faststream_gen._code_generator.chat._check_marker': ( 'chat.html#_check_marker',
+                                                                                                            'faststream_gen/_code_generator/chat.py'),
+                                                     'faststream_gen._code_generator.chat._check_no_code_fence': ( 'chat.html#_check_no_code_fence',
+                                                                                                                   'faststream_gen/_code_generator/chat.py'),
                                                      'faststream_gen._code_generator.chat._construct_prompt_with_error_msg': ( 'chat.html#_construct_prompt_with_error_msg',
                                                                                                                                'faststream_gen/_code_generator/chat.py'),
+                                                     'faststream_gen._code_generator.chat._get_chunk_content': ( 'chat.html#_get_chunk_content',
+                                                                                                                 'faststream_gen/_code_generator/chat.py'),
+                                                     'faststream_gen._code_generator.chat._get_default_semaphore': ( 'chat.html#_get_default_semaphore',
+                                                                                                                     'faststream_gen/_code_generator/chat.py'),
                                                      'faststream_gen._code_generator.chat._get_relevant_document': ( 'chat.html#_get_relevant_document',
                                                                                                                      'faststream_gen/_code_generator/chat.py'),
+                                                     'faststream_gen._code_generator.chat._get_stream_usage': ( 'chat.html#_get_stream_usage',
+                                                                                                                'faststream_gen/_code_generator/chat.py'),
+                                                     'faststream_gen._code_generator.chat._kill_candidate_validation': ( 'chat.html#_kill_candidate_validation',
+                                                                                                                         'faststream_gen/_code_generator/chat.py'),
+                                                     'faststream_gen._code_generator.chat._read_candidate_result': ( 'chat.html#_read_candidate_result',
+                                                                                                                     'faststream_gen/_code_generator/chat.py'),
                                                      'faststream_gen._code_generator.chat._retry_with_exponential_backoff': ( 'chat.html#_retry_with_exponential_backoff',
                                                                                                                               'faststream_gen/_code_generator/chat.py'),
+                                                     'faststream_gen._code_generator.chat._run_candidate_validation': ( 'chat.html#_run_candidate_validation',
+                                                                                                                        'faststream_gen/_code_generator/chat.py'),
                                                      'faststream_gen._code_generator.chat._save_log_results': ( 'chat.html#_save_log_results',
-                                                                                                                'faststream_gen/_code_generator/chat.py')},
-            'faststream_gen._code_generator.constants': { 'faststream_gen._code_generator.constants.OpenAIModel': ( 'constants.html#openaimodel',
-                                                                                                                    'faststream_gen/_code_generator/constants.py')},
-            'faststream_gen._code_generator.helper': { 'faststream_gen._code_generator.helper._fetch_content': ( 'helper.html#_fetch_content',
+                                                                                                                'faststream_gen/_code_generator/chat.py'),
+                                                     'faststream_gen._code_generator.chat._summarize_errors': ( 'chat.html#_summarize_errors',
+                                                                                                                'faststream_gen/_code_generator/chat.py'),
+                                                     'faststream_gen._code_generator.chat._validate_candidate': ( 'chat.html#_validate_candidate',
+                                                                                                                  'faststream_gen/_code_generator/chat.py'),
+                                                     'faststream_gen._code_generator.chat._validate_candidates': ( 'chat.html#_validate_candidates',
+                                                                                                                   'faststream_gen/_code_generator/chat.py')},
+            'faststream_gen._code_generator.constants': { 'faststream_gen._code_generator.constants.LLMCacheMode': ( 'constants.html#llmcachemode',
+                                                                                                                     'faststream_gen/_code_generator/constants.py'),
+                                                          'faststream_gen._code_generator.constants.OpenAIModel': ( 'constants.html#openaimodel',
+                                                                                                                    'faststream_gen/_code_generator/constants.py'),
+                                                          'faststream_gen._code_generator.constants.RetrievalMode': ( 'constants.html#retrievalmode',
+                                                                                                                      'faststream_gen/_code_generator/constants.py')},
+            'faststream_gen._code_generator.helper': { 'faststream_gen._code_generator.helper._amock_openai_stream': ( 'helper.html#_amock_openai_stream',
+                                                                                                                       'faststream_gen/_code_generator/helper.py'),
+                                                       'faststream_gen._code_generator.helper._extract_members': ( 'helper.html#_extract_members',
+                                                                                                                   'faststream_gen/_code_generator/helper.py'),
+                                                       'faststream_gen._code_generator.helper._fetch_content': ( 'helper.html#_fetch_content',
                                                                                                                  'faststream_gen/_code_generator/helper.py'),
                                                        'faststream_gen._code_generator.helper._format_examples': ( 'helper.html#_format_examples',
                                                                                                                    'faststream_gen/_code_generator/helper.py'),
+                                                       'faststream_gen._code_generator.helper._get_db_version': ( 'helper.html#_get_db_version',
+                                                                                                                  'faststream_gen/_code_generator/helper.py'),
+                                                       'faststream_gen._code_generator.helper._get_prefix_filter': ( 'helper.html#_get_prefix_filter',
+                                                                                                                     'faststream_gen/_code_generator/helper.py'),
+                                                       'faststream_gen._code_generator.helper._mock_openai_stream': ( 'helper.html#_mock_openai_stream',
+                                                                                                                      'faststream_gen/_code_generator/helper.py'),
                                                        'faststream_gen._code_generator.helper._split_text': ( 'helper.html#_split_text',
                                                                                                               'faststream_gen/_code_generator/helper.py'),
                                                        'faststream_gen._code_generator.helper.add_tokens_usage': ( 'helper.html#add_tokens_usage',
                                                                                                                    'faststream_gen/_code_generator/helper.py'),
+                                                       'faststream_gen._code_generator.helper.clear_vector_stores': ( 'helper.html#clear_vector_stores',
+                                                                                                                      'faststream_gen/_code_generator/helper.py'),
                                                        'faststream_gen._code_generator.helper.download_and_extract_github_repo': ( 'helper.html#download_and_extract_github_repo',
                                                                                                                                    'faststream_gen/_code_generator/helper.py'),
                                                        'faststream_gen._code_generator.helper.ensure_openai_api_key_set': ( 'helper.html#ensure_openai_api_key_set',
                                                                                                                             'faststream_gen/_code_generator/helper.py'),
                                                        'faststream_gen._code_generator.helper.get_relevant_prompt_examples': ( 'helper.html#get_relevant_prompt_examples',
                                                                                                                                'faststream_gen/_code_generator/helper.py'),
+                                                       'faststream_gen._code_generator.helper.load_vector_store': ( 'helper.html#load_vector_store',
+                                                                                                                    'faststream_gen/_code_generator/helper.py'),
                                                        'faststream_gen._code_generator.helper.mock_openai_create': ( 'helper.html#mock_openai_create',
                                                                                                                      'faststream_gen/_code_generator/helper.py'),
                                                        'faststream_gen._code_generator.helper.read_file_contents': ( 'helper.html#read_file_contents',
                                                                                                                      'faststream_gen/_code_generator/helper.py'),
                                                        'faststream_gen._code_generator.helper.retry_on_error': ( 'helper.html#retry_on_error',
                                                                                                                  'faststream_gen/_code_generator/helper.py'),
+                                                       'faststream_gen._code_generator.helper.run_async': ( 'helper.html#run_async',
+                                                                                                            'faststream_gen/_code_generator/helper.py'),
                                                        'faststream_gen._code_generator.helper.set_cwd': ( 'helper.html#set_cwd',
                                                                                                           'faststream_gen/_code_generator/helper.py'),
                                                        'faststream_gen._code_generator.helper.set_logger_level': ( 'helper.html#set_logger_level',
@@ -81,11 +165,173 @@ d = { 'settings': { 'branch': 'main',
                                                                                                                        'faststream_gen/_code_generator/helper.py'),
                                                        'faststream_gen._code_generator.helper.write_file_contents': ( 'helper.html#write_file_contents',
                                                                                                                       'faststream_gen/_code_generator/helper.py')},
+            'faststream_gen._code_generator.llm_cache': { 'faststream_gen._code_generator.llm_cache.LLMResponseCache': ( 'llm_cache.html#llmresponsecache',
+                                                                                                                         'faststream_gen/_code_generator/llm_cache.py'),
+                                                          'faststream_gen._code_generator.llm_cache.LLMResponseCache.__init__': ( 'llm_cache.html#llmresponsecache.__init__',
+                                                                                                                                  'faststream_gen/_code_generator/llm_cache.py'),
+                                                          'faststream_gen._code_generator.llm_cache.LLMResponseCache._evict': ( 'llm_cache.html#llmresponsecache._evict',
+                                                                                                                                'faststream_gen/_code_generator/llm_cache.py'),
+                                                          'faststream_gen._code_generator.llm_cache.LLMResponseCache._get_path': ( 'llm_cache.html#llmresponsecache._get_path',
+                                                                                                                                   'faststream_gen/_code_generator/llm_cache.py'),
+                                                          'faststream_gen._code_generator.llm_cache.LLMResponseCache._read': ( 'llm_cache.html#llmresponsecache._read',
+                                                                                                                               'faststream_gen/_code_generator/llm_cache.py'),
+                                                          'faststream_gen._code_generator.llm_cache.LLMResponseCache.get': ( 'llm_cache.html#llmresponsecache.get',
+                                                                                                                             'faststream_gen/_code_generator/llm_cache.py'),
+                                                          'faststream_gen._code_generator.llm_cache.LLMResponseCache.set': ( 'llm_cache.html#llmresponsecache.set',
+                                                                                                                             'faststream_gen/_code_generator/llm_cache.py'),
+                                                          'faststream_gen._code_generator.llm_cache._evict_files': ( 'llm_cache.html#_evict_files',
+                                                                                                                     'faststream_gen/_code_generator/llm_cache.py'),
+                                                          'faststream_gen._code_generator.llm_cache._get_cache_key': ( 'llm_cache.html#_get_cache_key',
+                                                                                                                       'faststream_gen/_code_generator/llm_cache.py'),
+                                                          'faststream_gen._code_generator.llm_cache._set_cache_attempt': ( 'llm_cache.html#_set_cache_attempt',
+                                                                                                                           'faststream_gen/_code_generator/llm_cache.py'),
+                                                          'faststream_gen._code_generator.llm_cache.get_llm_cache': ( 'llm_cache.html#get_llm_cache',
+                                                                                                                      'faststream_gen/_code_generator/llm_cache.py')},
             'faststream_gen._code_generator.prompts': {},
+            'faststream_gen._code_generator.query_embeddings': { 'faststream_gen._code_generator.query_embeddings.CachedQueryEmbeddings': ( 'query_embeddings.html#cachedqueryembeddings',
+                                                                                                                                            'faststream_gen/_code_generator/query_embeddings.py'),
+                                                                 'faststream_gen._code_generator.query_embeddings.CachedQueryEmbeddings.__init__': ( 'query_embeddings.html#cachedqueryembeddings.__init__',
+                                                                                                                                                     'faststream_gen/_code_generator/query_embeddings.py'),
+                                                                 'faststream_gen._code_generator.query_embeddings.CachedQueryEmbeddings.embed_documents': ( 'query_embeddings.html#cachedqueryembeddings.embed_documents',
+                                                                                                                                                            'faststream_gen/_code_generator/query_embeddings.py'),
+                                                                 'faststream_gen._code_generator.query_embeddings.CachedQueryEmbeddings.embed_query': ( 'query_embeddings.html#cachedqueryembeddings.embed_query',
+                                                                                                                                                        'faststream_gen/_code_generator/query_embeddings.py'),
+                                                                 'faststream_gen._code_generator.query_embeddings.CachedQueryEmbeddings.embeddings': ( 'query_embeddings.html#cachedqueryembeddings.embeddings',
+                                                                                                                                                       'faststream_gen/_code_generator/query_embeddings.py'),
+                                                                 'faststream_gen._code_generator.query_embeddings.QueryEmbeddingCache': ( 'query_embeddings.html#queryembeddingcache',
+                                                                                                                                          'faststream_gen/_code_generator/query_embeddings.py'),
+                                                                 'faststream_gen._code_generator.query_embeddings.QueryEmbeddingCache.__init__': ( 'query_embeddings.html#queryembeddingcache.__init__',
+                                                                                                                                                   'faststream_gen/_code_generator/query_embeddings.py'),
+                                                                 'faststream_gen._code_generator.query_embeddings.QueryEmbeddingCache._evict': ( 'query_embeddings.html#queryembeddingcache._evict',
+                                                                                                                                                 'faststream_gen/_code_generator/query_embeddings.py'),
+                                                                 'faststream_gen._code_generator.query_embeddings.QueryEmbeddingCache._get_path': ( 'query_embeddings.html#queryembeddingcache._get_path',
+                                                                                                                                                    'faststream_gen/_code_generator/query_embeddings.py'),
+                                                                 'faststream_gen._code_generator.query_embeddings.QueryEmbeddingCache.get': ( 'query_embeddings.html#queryembeddingcache.get',
+                                                                                                                                              'faststream_gen/_code_generator/query_embeddings.py'),
+                                                                 'faststream_gen._code_generator.query_embeddings.QueryEmbeddingCache.set': ( 'query_embeddings.html#queryembeddingcache.set',
+                                                                                                                                              'faststream_gen/_code_generator/query_embeddings.py'),
+                                                                 'faststream_gen._code_generator.query_embeddings._create_openai_embeddings': ( 'query_embeddings.html#_create_openai_embeddings',
+                                                                                                                                                'faststream_gen/_code_generator/query_embeddings.py'),
+                                                                 'faststream_gen._code_generator.query_embeddings._get_query_key': ( 'query_embeddings.html#_get_query_key',
+                                                                                                                                     'faststream_gen/_code_generator/query_embeddings.py'),
+                                                                 'faststream_gen._code_generator.query_embeddings._read_precomputed_query_embeddings': ( 'query_embeddings.html#_read_precomputed_query_embeddings',
+                                                                                                                                                         'faststream_gen/_code_generator/query_embeddings.py'),
+                                                                 'faststream_gen._code_generator.query_embeddings.get_query_embedding_cache': ( 'query_embeddings.html#get_query_embedding_cache',
+                                                                                                                                                'faststream_gen/_code_generator/query_embeddings.py'),
+                                                                 'faststream_gen._code_generator.query_embeddings.save_precomputed_query_embeddings': ( 'query_embeddings.html#save_precomputed_query_embeddings',
+                                                                                                                                                        'faststream_gen/_code_generator/query_embeddings.py')},
+            'faststream_gen._code_generator.rate_limiter': { 'faststream_gen._code_generator.rate_limiter.RateLimiter': ( 'rate_limiter.html#ratelimiter',
+                                                                                                                          'faststream_gen/_code_generator/rate_limiter.py'),
+                                                             'faststream_gen._code_generator.rate_limiter.RateLimiter.__init__': ( 'rate_limiter.html#ratelimiter.__init__',
+                                                                                                                                   'faststream_gen/_code_generator/rate_limiter.py'),
+                                                             'faststream_gen._code_generator.rate_limiter.RateLimiter._connect': ( 'rate_limiter.html#ratelimiter._connect',
+                                                                                                                                   'faststream_gen/_code_generator/rate_limiter.py'),
+                                                             'faststream_gen._code_generator.rate_limiter.RateLimiter._get_api_key': ( 'rate_limiter.html#ratelimiter._get_api_key',
+                                                                                                                                       'faststream_gen/_code_generator/rate_limiter.py'),
+                                                             'faststream_gen._code_generator.rate_limiter.RateLimiter._get_max_tokens': ( 'rate_limiter.html#ratelimiter._get_max_tokens',
+                                                                                                                                          'faststream_gen/_code_generator/rate_limiter.py'),
+                                                             'faststream_gen._code_generator.rate_limiter.RateLimiter._take': ( 'rate_limiter.html#ratelimiter._take',
+                                                                                                                                'faststream_gen/_code_generator/rate_limiter.py'),
+                                                             'faststream_gen._code_generator.rate_limiter.RateLimiter.aacquire': ( 'rate_limiter.html#ratelimiter.aacquire',
+                                                                                                                                   'faststream_gen/_code_generator/rate_limiter.py'),
+                                                             'faststream_gen._code_generator.rate_limiter.RateLimiter.acquire': ( 'rate_limiter.html#ratelimiter.acquire',
+                                                                                                                                  'faststream_gen/_code_generator/rate_limiter.py'),
+                                                             'faststream_gen._code_generator.rate_limiter.RateLimiter.record_usage': ( 'rate_limiter.html#ratelimiter.record_usage',
+                                                                                                                                       'faststream_gen/_code_generator/rate_limiter.py'),
+                                                             'faststream_gen._code_generator.rate_limiter._get_bucket_key': ( 'rate_limiter.html#_get_bucket_key',
+                                                                                                                              'faststream_gen/_code_generator/rate_limiter.py'),
+                                                             'faststream_gen._code_generator.rate_limiter._read_rate_limits': ( 'rate_limiter.html#_read_rate_limits',
+                                                                                                                                'faststream_gen/_code_generator/rate_limiter.py'),
+                                                             'faststream_gen._code_generator.rate_limiter.get_rate_limiter': ( 'rate_limiter.html#get_rate_limiter',
+                                                                                                                               'faststream_gen/_code_generator/rate_limiter.py')},
+            'faststream_gen._code_generator.token_counter': { 'faststream_gen._code_generator.token_counter._get_encoding': ( 'token_counter.html#_get_encoding',
+                                                                                                                              'faststream_gen/_code_generator/token_counter.py'),
+                                                              'faststream_gen._code_generator.token_counter._load_encoding': ( 'token_counter.html#_load_encoding',
+                                                                                                                               'faststream_gen/_code_generator/token_counter.py'),
+                                                              'faststream_gen._code_generator.token_counter.count_message_tokens': ( 'token_counter.html#count_message_tokens',
+                                                                                                                                     'faststream_gen/_code_generator/token_counter.py'),
+                                                              'faststream_gen._code_generator.token_counter.count_tokens': ( 'token_counter.html#count_tokens',
+                                                                                                                             'faststream_gen/_code_generator/token_counter.py')},
+            'faststream_gen._code_generator.vector_store': { 'faststream_gen._code_generator.vector_store.Document': ( 'vector_store.html#document',
+                                                                                                                       'faststream_gen/_code_generator/vector_store.py'),
+                                                             'faststream_gen._code_generator.vector_store.Embeddings': ( 'vector_store.html#embeddings',
+                                                                                                                         'faststream_gen/_code_generator/vector_store.py'),
+                                                             'faststream_gen._code_generator.vector_store.Embeddings.embed_documents': ( 'vector_store.html#embeddings.embed_documents',
+                                                                                                                                         'faststream_gen/_code_generator/vector_store.py'),
+                                                             'faststream_gen._code_generator.vector_store.Embeddings.embed_query': ( 'vector_store.html#embeddings.embed_query',
+                                                                                                                                     'faststream_gen/_code_generator/vector_store.py'),
+                                                             'faststream_gen._code_generator.vector_store.VectorStore': ( 'vector_store.html#vectorstore',
+                                                                                                                          'faststream_gen/_code_generator/vector_store.py'),
+                                                             'faststream_gen._code_generator.vector_store.VectorStore.__init__': ( 'vector_store.html#vectorstore.__init__',
+                                                                                                                                   'faststream_gen/_code_generator/vector_store.py'),
+                                                             'faststream_gen._code_generator.vector_store.VectorStore._get_scores': ( 'vector_store.html#vectorstore._get_scores',
+                                                                                                                                      'faststream_gen/_code_generator/vector_store.py'),
+                                                             'faststream_gen._code_generator.vector_store.VectorStore.from_documents': ( 'vector_store.html#vectorstore.from_documents',
+                                                                                                                                         'faststream_gen/_code_generator/vector_store.py'),
+                                                             'faststream_gen._code_generator.vector_store.VectorStore.load_local': ( 'vector_store.html#vectorstore.load_local',
+                                                                                                                                     'faststream_gen/_code_generator/vector_store.py'),
+                                                             'faststream_gen._code_generator.vector_store.VectorStore.max_marginal_relevance_search': ( 'vector_store.html#vectorstore.max_marginal_relevance_search',
+                                                                                                                                                        'faststream_gen/_code_generator/vector_store.py'),
+                                                             'faststream_gen._code_generator.vector_store.VectorStore.save_local': ( 'vector_store.html#vectorstore.save_local',
+                                                                                                                                     'faststream_gen/_code_generator/vector_store.py'),
+                                                             'faststream_gen._code_generator.vector_store.VectorStore.similarity_search': ( 'vector_store.html#vectorstore.similarity_search',
+                                                                                                                                            'faststream_gen/_code_generator/vector_store.py'),
+                                                             'faststream_gen._code_generator.vector_store._get_content_hash': ( 'vector_store.html#_get_content_hash',
+                                                                                                                                'faststream_gen/_code_generator/vector_store.py'),
+                                                             'faststream_gen._code_generator.vector_store._max_marginal_relevance': ( 'vector_store.html#_max_marginal_relevance',
+                                                                                                                                      'faststream_gen/_code_generator/vector_store.py'),
+                                                             'faststream_gen._code_generator.vector_store._min_max_scale': ( 'vector_store.html#_min_max_scale',
+                                                                                                                             'faststream_gen/_code_generator/vector_store.py'),
+                                                             'faststream_gen._code_generator.vector_store._normalize': ( 'vector_store.html#_normalize',
+                                                                                                                         'faststream_gen/_code_generator/vector_store.py'),
+                                                             'faststream_gen._code_generator.vector_store._save_documents': ( 'vector_store.html#_save_documents',
+                                                                                                                              'faststream_gen/_code_generator/vector_store.py'),
+                                                             'faststream_gen._code_generator.vector_store._save_vectors': ( 'vector_store.html#_save_vectors',
+                                                                                                                            'faststream_gen/_code_generator/vector_store.py'),
+                                                             'faststream_gen._code_generator.vector_store._top_k': ( 'vector_store.html#_top_k',
+                                                                                                                     'faststream_gen/_code_generator/vector_store.py'),
+                                                             'faststream_gen._code_generator.vector_store._write_atomically': ( 'vector_store.html#_write_atomically',
+                                                                                                                                'faststream_gen/_code_generator/vector_store.py')},
+            'faststream_gen._components.checkpoint': { 'faststream_gen._components.checkpoint.GenerationCheckpoint': ( 'checkpoint.html#generationcheckpoint',
+                                                                                                                       'faststream_gen/_components/checkpoint.py'),
+                                                       'faststream_gen._components.checkpoint.GenerationCheckpoint.__init__': ( 'checkpoint.html#generationcheckpoint.__init__',
+                                                                                                                                'faststream_gen/_components/checkpoint.py'),
+                                                       'faststream_gen._components.checkpoint.GenerationCheckpoint.clear': ( 'checkpoint.html#generationcheckpoint.clear',
+                                                                                                                             'faststream_gen/_components/checkpoint.py'),
+                                                       'faststream_gen._components.checkpoint.GenerationCheckpoint.get': ( 'checkpoint.html#generationcheckpoint.get',
+                                                                                                                           'faststream_gen/_components/checkpoint.py'),
+                                                       'faststream_gen._components.checkpoint.GenerationCheckpoint.is_completed': ( 'checkpoint.html#generationcheckpoint.is_completed',
+                                                                                                                                    'faststream_gen/_components/checkpoint.py'),
+                                                       'faststream_gen._components.checkpoint.GenerationCheckpoint.load': ( 'checkpoint.html#generationcheckpoint.load',
+                                                                                                                            'faststream_gen/_components/checkpoint.py'),
+                                                       'faststream_gen._components.checkpoint.GenerationCheckpoint.path': ( 'checkpoint.html#generationcheckpoint.path',
+                                                                                                                            'faststream_gen/_components/checkpoint.py'),
+                                                       'faststream_gen._components.checkpoint.GenerationCheckpoint.restore': ( 'checkpoint.html#generationcheckpoint.restore',
+                                                                                                                               'faststream_gen/_components/checkpoint.py'),
+                                                       'faststream_gen._components.checkpoint.GenerationCheckpoint.save': ( 'checkpoint.html#generationcheckpoint.save',
+                                                                                                                            'faststream_gen/_components/checkpoint.py')},
+            'faststream_gen._components.embedding_pipeline': { 'faststream_gen._components.embedding_pipeline.BatchedEmbeddings': ( 'embedding_pipeline.html#batchedembeddings',
+                                                                                                                                    'faststream_gen/_components/embedding_pipeline.py'),
+                                                               'faststream_gen._components.embedding_pipeline.BatchedEmbeddings.__init__': ( 'embedding_pipeline.html#batchedembeddings.__init__',
+                                                                                                                                             'faststream_gen/_components/embedding_pipeline.py'),
+                                                               'faststream_gen._components.embedding_pipeline.BatchedEmbeddings._create': ( 'embedding_pipeline.html#batchedembeddings._create',
+                                                                                                                                            'faststream_gen/_components/embedding_pipeline.py'),
+                                                               'faststream_gen._components.embedding_pipeline.BatchedEmbeddings._embed_batch': ( 'embedding_pipeline.html#batchedembeddings._embed_batch',
+                                                                                                                                                 'faststream_gen/_components/embedding_pipeline.py'),
+                                                               'faststream_gen._components.embedding_pipeline.BatchedEmbeddings._get_checkpoint_path': ( 'embedding_pipeline.html#batchedembeddings._get_checkpoint_path',
+                                                                                                                                                         'faststream_gen/_components/embedding_pipeline.py'),
+                                                               'faststream_gen._components.embedding_pipeline.BatchedEmbeddings.embed_documents': ( 'embedding_pipeline.html#batchedembeddings.embed_documents',
+                                                                                                                                                    'faststream_gen/_components/embedding_pipeline.py'),
+                                                               'faststream_gen._components.embedding_pipeline.BatchedEmbeddings.embed_query': ( 'embedding_pipeline.html#batchedembeddings.embed_query',
+                                                                                                                                                'faststream_gen/_components/embedding_pipeline.py'),
+                                                               'faststream_gen._components.embedding_pipeline._make_batches': ( 'embedding_pipeline.html#_make_batches',
+                                                                                                                                'faststream_gen/_components/embedding_pipeline.py')},
             'faststream_gen._components.embeddings': { 'faststream_gen._components.embeddings._append_file_contents': ( 'embeddings_cli.html#_append_file_contents',
                                                                                                                         'faststream_gen/_components/embeddings.py'),
                                                        'faststream_gen._components.embeddings._check_all_files_exist': ( 'embeddings_cli.html#_check_all_files_exist',
                                                                                                                          'faststream_gen/_components/embeddings.py'),
+                                                       'faststream_gen._components.embeddings._count_tokens': ( 'embeddings_cli.html#_count_tokens',
+                                                                                                                'faststream_gen/_components/embeddings.py'),
                                                        'faststream_gen._components.embeddings._create_documents': ( 'embeddings_cli.html#_create_documents',
                                                                                                                     'faststream_gen/_components/embeddings.py'),
                                                        'faststream_gen._components.embeddings._delete_directory': ( 'embeddings_cli.html#_delete_directory',
@@ -102,16 +348,48 @@ d = { 'settings': { 'branch': 'main',
                                                                                                                     'faststream_gen/_components/embeddings.py'),
                                                        'faststream_gen._components.embeddings._generate_examples_db': ( 'embeddings_cli.html#_generate_examples_db',
                                                                                                                         'faststream_gen/_components/embeddings.py'),
+                                                       'faststream_gen._components.embeddings._get_description_documents': ( 'embeddings_cli.html#_get_description_documents',
+                                                                                                                             'faststream_gen/_components/embeddings.py'),
+                                                       'faststream_gen._components.embeddings._get_docs_src_parent': ( 'embeddings_cli.html#_get_docs_src_parent',
+                                                                                                                       'faststream_gen/_components/embeddings.py'),
+                                                       'faststream_gen._components.embeddings._load_cached_vectors': ( 'embeddings_cli.html#_load_cached_vectors',
+                                                                                                                       'faststream_gen/_components/embeddings.py'),
+                                                       'faststream_gen._components.embeddings._read_file_lines': ( 'embeddings_cli.html#_read_file_lines',
+                                                                                                                   'faststream_gen/_components/embeddings.py'),
                                                        'faststream_gen._components.embeddings._read_lines_from_file': ( 'embeddings_cli.html#_read_lines_from_file',
                                                                                                                         'faststream_gen/_components/embeddings.py'),
+                                                       'faststream_gen._components.embeddings._save_description_validation_context': ( 'embeddings_cli.html#_save_description_validation_context',
+                                                                                                                                       'faststream_gen/_components/embeddings.py'),
                                                        'faststream_gen._components.embeddings._save_embeddings_db': ( 'embeddings_cli.html#_save_embeddings_db',
                                                                                                                       'faststream_gen/_components/embeddings.py'),
-                                                       'faststream_gen._components.embeddings._split_document_into_chunks': ( 'embeddings_cli.html#_split_document_into_chunks',
+                                                       'faststream_gen._components.embeddings._save_template_archive': ( 'embeddings_cli.html#_save_template_archive',
+                                                                                                                         'faststream_gen/_components/embeddings.py'),
+                                                       'faststream_gen._components.embeddings._split_by_tokens': ( 'embeddings_cli.html#_split_by_tokens',
+                                                                                                                   'faststream_gen/_components/embeddings.py'),
+                                                       'faststream_gen._components.embeddings._split_into_blocks': ( 'embeddings_cli.html#_split_into_blocks',
+                                                                                                                     'faststream_gen/_components/embeddings.py'),
+                                                       'faststream_gen._components.embeddings._split_markdown_into_chunks': ( 'embeddings_cli.html#_split_markdown_into_chunks',
                                                                                                                               'faststream_gen/_components/embeddings.py'),
+                                                       'faststream_gen._components.embeddings._split_markdown_sections': ( 'embeddings_cli.html#_split_markdown_sections',
+                                                                                                                           'faststream_gen/_components/embeddings.py'),
                                                        'faststream_gen._components.embeddings.generate': ( 'embeddings_cli.html#generate',
                                                                                                            'faststream_gen/_components/embeddings.py')},
-            'faststream_gen._components.integration_test_generator': { 'faststream_gen._components.integration_test_generator._generate': ( 'integration_test_generator.html#_generate',
+            'faststream_gen._components.file_lock': { 'faststream_gen._components.file_lock.file_lock': ( 'file_lock.html#file_lock',
+                                                                                                          'faststream_gen/_components/file_lock.py')},
+            'faststream_gen._components.integration_test_generator': { 'faststream_gen._components.integration_test_generator._format_requirement': ( 'integration_test_generator.html#_format_requirement',
+                                                                                                                                                      'faststream_gen/_components/integration_test_generator.py'),
+                                                                       'faststream_gen._components.integration_test_generator._generate': ( 'integration_test_generator.html#_generate',
                                                                                                                                             'faststream_gen/_components/integration_test_generator.py'),
+                                                                       'faststream_gen._components.integration_test_generator._get_installed_requirements_file': ( 'integration_test_generator.html#_get_installed_requirements_file',
+                                                                                                                                                                   'faststream_gen/_components/integration_test_generator.py'),
+                                                                       'faststream_gen._components.integration_test_generator._get_project_requirements': ( 'integration_test_generator.html#_get_project_requirements',
+                                                                                                                                                            'faststream_gen/_components/integration_test_generator.py'),
+                                                                       'faststream_gen._components.integration_test_generator._merge_requirements': ( 'integration_test_generator.html#_merge_requirements',
+                                                                                                                                                      'faststream_gen/_components/integration_test_generator.py'),
+                                                                       'faststream_gen._components.integration_test_generator._parse_requirement': ( 'integration_test_generator.html#_parse_requirement',
+                                                                                                                                                     'faststream_gen/_components/integration_test_generator.py'),
+                                                                       'faststream_gen._components.integration_test_generator._read_installed_requirements': ( 'integration_test_generator.html#_read_installed_requirements',
+                                                                                                                                                               'faststream_gen/_components/integration_test_generator.py'),
                                                                        'faststream_gen._components.integration_test_generator._setup_venv_and_run_tests': ( 'integration_test_generator.html#_setup_venv_and_run_tests',
                                                                                                                                                             'faststream_gen/_components/integration_test_generator.py'),
                                                                        'faststream_gen._components.integration_test_generator._split_app_and_test_req': ( 'integration_test_generator.html#_split_app_and_test_req',
@@ -122,6 +400,8 @@ d = { 'settings': { 'branch': 'main',
                                                                                                                                                     'faststream_gen/_components/integration_test_generator.py'),
                                                                        'faststream_gen._components.integration_test_generator._validate_response': ( 'integration_test_generator.html#_validate_response',
                                                                                                                                                      'faststream_gen/_components/integration_test_generator.py'),
+                                                                       'faststream_gen._components.integration_test_generator._write_installed_requirements': ( 'integration_test_generator.html#_write_installed_requirements',
+                                                                                                                                                                'faststream_gen/_components/integration_test_generator.py'),
                                                                        'faststream_gen._components.integration_test_generator.fix_requirements_and_run_tests': ( 'integration_test_generator.html#fix_requirements_and_run_tests',
                                                                                                                                                                  'faststream_gen/_components/integration_test_generator.py')},
             'faststream_gen._components.logger': { 'faststream_gen._components.logger.get_default_logger_configuration': ( 'logger.html#get_default_logger_configuration',
@@ -136,12 +416,118 @@ d = { 'settings': { 'branch': 'main',
                                                                                                                                        'faststream_gen/_components/new_project_generator.py')},
             'faststream_gen._components.package_data': { 'faststream_gen._components.package_data.get_root_data_path': ( 'packagedata.html#get_root_data_path',
                                                                                                                          'faststream_gen/_components/package_data.py')},
+            'faststream_gen._components.template_cache': { 'faststream_gen._components.template_cache.TemplateCache': ( 'template_cache.html#templatecache',
+                                                                                                                        'faststream_gen/_components/template_cache.py'),
+                                                           'faststream_gen._components.template_cache.TemplateCache.__init__': ( 'template_cache.html#templatecache.__init__',
+                                                                                                                                 'faststream_gen/_components/template_cache.py'),
+                                                           'faststream_gen._components.template_cache.TemplateCache._get_archive_path': ( 'template_cache.html#templatecache._get_archive_path',
+                                                                                                                                          'faststream_gen/_components/template_cache.py'),
+                                                           'faststream_gen._components.template_cache.TemplateCache._read_metadata': ( 'template_cache.html#templatecache._read_metadata',
+                                                                                                                                       'faststream_gen/_components/template_cache.py'),
+                                                           'faststream_gen._components.template_cache.TemplateCache._revalidate': ( 'template_cache.html#templatecache._revalidate',
+                                                                                                                                    'faststream_gen/_components/template_cache.py'),
+                                                           'faststream_gen._components.template_cache.TemplateCache._write_metadata': ( 'template_cache.html#templatecache._write_metadata',
+                                                                                                                                        'faststream_gen/_components/template_cache.py'),
+                                                           'faststream_gen._components.template_cache.TemplateCache.archive_path': ( 'template_cache.html#templatecache.archive_path',
+                                                                                                                                     'faststream_gen/_components/template_cache.py'),
+                                                           'faststream_gen._components.template_cache.TemplateCache.get_template_path': ( 'template_cache.html#templatecache.get_template_path',
+                                                                                                                                          'faststream_gen/_components/template_cache.py'),
+                                                           'faststream_gen._components.template_cache.get_template_cache': ( 'template_cache.html#get_template_cache',
+                                                                                                                             'faststream_gen/_components/template_cache.py')},
+            'faststream_gen._components.venv_pool': { 'faststream_gen._components.venv_pool.VenvPool': ( 'venv_pool.html#venvpool',
+                                                                                                         'faststream_gen/_components/venv_pool.py'),
+                                                      'faststream_gen._components.venv_pool.VenvPool.__init__': ( 'venv_pool.html#venvpool.__init__',
+                                                                                                                  'faststream_gen/_components/venv_pool.py'),
+                                                      'faststream_gen._components.venv_pool.VenvPool._clone': ( 'venv_pool.html#venvpool._clone',
+                                                                                                                'faststream_gen/_components/venv_pool.py'),
+                                                      'faststream_gen._components.venv_pool.VenvPool._create_base': ( 'venv_pool.html#venvpool._create_base',
+                                                                                                                      'faststream_gen/_components/venv_pool.py'),
+                                                      'faststream_gen._components.venv_pool.VenvPool._create_base_locked': ( 'venv_pool.html#venvpool._create_base_locked',
+                                                                                                                             'faststream_gen/_components/venv_pool.py'),
+                                                      'faststream_gen._components.venv_pool.VenvPool._is_clean': ( 'venv_pool.html#venvpool._is_clean',
+                                                                                                                   'faststream_gen/_components/venv_pool.py'),
+                                                      'faststream_gen._components.venv_pool.VenvPool._prune_clones': ( 'venv_pool.html#venvpool._prune_clones',
+                                                                                                                       'faststream_gen/_components/venv_pool.py'),
+                                                      'faststream_gen._components.venv_pool.VenvPool.acquire': ( 'venv_pool.html#venvpool.acquire',
+                                                                                                                 'faststream_gen/_components/venv_pool.py'),
+                                                      'faststream_gen._components.venv_pool.VenvPool.borrow': ( 'venv_pool.html#venvpool.borrow',
+                                                                                                                'faststream_gen/_components/venv_pool.py'),
+                                                      'faststream_gen._components.venv_pool.VenvPool.clear': ( 'venv_pool.html#venvpool.clear',
+                                                                                                               'faststream_gen/_components/venv_pool.py'),
+                                                      'faststream_gen._components.venv_pool.VenvPool.release': ( 'venv_pool.html#venvpool.release',
+                                                                                                                 'faststream_gen/_components/venv_pool.py'),
+                                                      'faststream_gen._components.venv_pool.VenvPool.warmup': ( 'venv_pool.html#venvpool.warmup',
+                                                                                                                'faststream_gen/_components/venv_pool.py'),
+                                                      'faststream_gen._components.venv_pool._clone_venv': ( 'venv_pool.html#_clone_venv',
+                                                                                                            'faststream_gen/_components/venv_pool.py'),
+                                                      'faststream_gen._components.venv_pool._get_bin_dir': ( 'venv_pool.html#_get_bin_dir',
+                                                                                                             'faststream_gen/_components/venv_pool.py'),
+                                                      'faststream_gen._components.venv_pool._get_python_executable': ( 'venv_pool.html#_get_python_executable',
+                                                                                                                       'faststream_gen/_components/venv_pool.py'),
+                                                      'faststream_gen._components.venv_pool._get_site_packages': ( 'venv_pool.html#_get_site_packages',
+                                                                                                                   'faststream_gen/_components/venv_pool.py'),
+                                                      'faststream_gen._components.venv_pool._hash_requirements': ( 'venv_pool.html#_hash_requirements',
+                                                                                                                   'faststream_gen/_components/venv_pool.py'),
+                                                      'faststream_gen._components.venv_pool._is_process_running': ( 'venv_pool.html#_is_process_running',
+                                                                                                                    'faststream_gen/_components/venv_pool.py'),
+                                                      'faststream_gen._components.venv_pool._link_or_copy': ( 'venv_pool.html#_link_or_copy',
+                                                                                                              'faststream_gen/_components/venv_pool.py'),
+                                                      'faststream_gen._components.venv_pool.get_venv_pool': ( 'venv_pool.html#get_venv_pool',
+                                                                                                              'faststream_gen/_components/venv_pool.py'),
+                                                      'faststream_gen._components.venv_pool.warmup': ( 'venv_pool.html#warmup',
+                                                                                                       'faststream_gen/_components/venv_pool.py')},
+            'faststream_gen._components.wheelhouse': { 'faststream_gen._components.wheelhouse.Wheelhouse': ( 'wheelhouse.html#wheelhouse',
+                                                                                                             'faststream_gen/_components/wheelhouse.py'),
+                                                       'faststream_gen._components.wheelhouse.Wheelhouse.__init__': ( 'wheelhouse.html#wheelhouse.__init__',
+                                                                                                                      'faststream_gen/_components/wheelhouse.py'),
+                                                       'faststream_gen._components.wheelhouse.Wheelhouse._download': ( 'wheelhouse.html#wheelhouse._download',
+                                                                                                                       'faststream_gen/_components/wheelhouse.py'),
+                                                       'faststream_gen._components.wheelhouse.Wheelhouse._read_index': ( 'wheelhouse.html#wheelhouse._read_index',
+                                                                                                                         'faststream_gen/_components/wheelhouse.py'),
+                                                       'faststream_gen._components.wheelhouse.Wheelhouse._write_index': ( 'wheelhouse.html#wheelhouse._write_index',
+                                                                                                                          'faststream_gen/_components/wheelhouse.py'),
+                                                       'faststream_gen._components.wheelhouse.Wheelhouse.fill': ( 'wheelhouse.html#wheelhouse.fill',
+                                                                                                                  'faststream_gen/_components/wheelhouse.py'),
+                                                       'faststream_gen._components.wheelhouse.Wheelhouse.get_pip_args': ( 'wheelhouse.html#wheelhouse.get_pip_args',
+                                                                                                                          'faststream_gen/_components/wheelhouse.py'),
+                                                       'faststream_gen._components.wheelhouse.Wheelhouse.is_cached': ( 'wheelhouse.html#wheelhouse.is_cached',
+                                                                                                                       'faststream_gen/_components/wheelhouse.py'),
+                                                       'faststream_gen._components.wheelhouse._get_requirement_key': ( 'wheelhouse.html#_get_requirement_key',
+                                                                                                                       'faststream_gen/_components/wheelhouse.py'),
+                                                       'faststream_gen._components.wheelhouse._is_offline': ( 'wheelhouse.html#_is_offline',
+                                                                                                              'faststream_gen/_components/wheelhouse.py'),
+                                                       'faststream_gen._components.wheelhouse.get_wheelhouse': ( 'wheelhouse.html#get_wheelhouse',
+                                                                                                                 'faststream_gen/_components/wheelhouse.py')},
             'faststream_gen._testing.benchmark': { 'faststream_gen._testing.benchmark._set_cwd': ( 'benchmark_cli.html#_set_cwd',
                                                                                                    'faststream_gen/_testing/benchmark.py'),
                                                    'faststream_gen._testing.benchmark.benchmark': ( 'benchmark_cli.html#benchmark',
                                                                                                     'faststream_gen/_testing/benchmark.py')},
+            'faststream_gen.batch_cli': { 'faststream_gen.batch_cli._JobOutputRouter': ( 'batch_cli.html#_joboutputrouter',
+                                                                                         'faststream_gen/batch_cli.py'),
+                                          'faststream_gen.batch_cli._JobOutputRouter.__init__': ( 'batch_cli.html#_joboutputrouter.__init__',
+                                                                                                  'faststream_gen/batch_cli.py'),
+                                          'faststream_gen.batch_cli._JobOutputRouter.encoding': ( 'batch_cli.html#_joboutputrouter.encoding',
+                                                                                                  'faststream_gen/batch_cli.py'),
+                                          'faststream_gen.batch_cli._JobOutputRouter.flush': ( 'batch_cli.html#_joboutputrouter.flush',
+                                                                                               'faststream_gen/batch_cli.py'),
+                                          'faststream_gen.batch_cli._JobOutputRouter.isatty': ( 'batch_cli.html#_joboutputrouter.isatty',
+                                                                                                'faststream_gen/batch_cli.py'),
+                                          'faststream_gen.batch_cli._JobOutputRouter.redirect': ( 'batch_cli.html#_joboutputrouter.redirect',
+                                                                                                  'faststream_gen/batch_cli.py'),
+                                          'faststream_gen.batch_cli._JobOutputRouter.write': ( 'batch_cli.html#_joboutputrouter.write',
+                                                                                               'faststream_gen/batch_cli.py'),
+                                          'faststream_gen.batch_cli._get_description_files': ( 'batch_cli.html#_get_description_files',
+                                                                                               'faststream_gen/batch_cli.py'),
+                                          'faststream_gen.batch_cli._run_job': ('batch_cli.html#_run_job', 'faststream_gen/batch_cli.py'),
+                                          'faststream_gen.batch_cli._warmup_shared_resources': ( 'batch_cli.html#_warmup_shared_resources',
+                                                                                                 'faststream_gen/batch_cli.py'),
+                                          'faststream_gen.batch_cli.generate_batch': ( 'batch_cli.html#generate_batch',
+                                                                                       'faststream_gen/batch_cli.py')},
             'faststream_gen.cli': { 'faststream_gen.cli._calculate_price': ('cli.html#_calculate_price', 'faststream_gen/cli.py'),
+                                    'faststream_gen.cli._get_cleaned_description': ( 'cli.html#_get_cleaned_description',
+                                                                                     'faststream_gen/cli.py'),
                                     'faststream_gen.cli._get_description': ('cli.html#_get_description', 'faststream_gen/cli.py'),
+                                    'faststream_gen.cli._prepare_project': ('cli.html#_prepare_project', 'faststream_gen/cli.py'),
                                     'faststream_gen.cli._validate_app_description': ( 'cli.html#_validate_app_description',
                                                                                       'faststream_gen/cli.py'),
                                     'faststream_gen.cli.generate_fastkafka_app': ( 'cli.html#generate_fastkafka_app',
@@ -0,0 +1,313 @@
+# AUTOGENERATED! DO NOT EDIT! File to edit: ../nbs/Batch_CLI.ipynb.
+
+# %% auto 0
+__all__ = ['logger', 'app', 'generate_batch']
+
+# %% ../nbs/Batch_CLI.ipynb 1
+from typing import *
+import io
+import re
+import sys
+import glob
+import time
+import threading
+import concurrent.futures
+from pathlib import Path
+from contextlib import contextmanager
+
+import typer
+
+from ._components.logger import get_logger
+from faststream_gen._code_generator.helper import (
+    ensure_openai_api_key_set,
+    load_vector_store,
+)
+from faststream_gen._code_generator.constants import (
+    OpenAIModel,
+    INCOMPLETE_APP_ERROR_MSG,
+    LLMCacheMode,
+    LLM_CACHE_MODE_ENV_VAR,
+    RetrievalMode,
+    RETRIEVAL_MODE_ENV_VAR,
+)
+from ._code_generator.llm_cache import get_llm_cache
+from ._components.package_data import get_root_data_path
+from ._components.template_cache import get_template_cache
+from ._components.venv_pool import get_venv_pool
+from .cli import generate_fastkafka_app
+
+# %% ../nbs/Batch_CLI.ipynb 3
+logger = get_logger(__name__)
+
+# %% ../nbs/Batch_CLI.ipynb 4
+class _JobOutputRouter(io.TextIOBase):
+    """A replacement of sys.stdout or sys.stderr which writes the output of every job thread to its own log file.
+
+    The output of the thread which created the router goes to the original stream. The output
+    of all the other threads, such as the spinner animations, is dropped.
+    """
+
+    def __init__(self, stream: TextIO):
+        self._stream = stream
+        self._owner = threading.get_ident()
+        self._job_files: Dict[int, TextIO] = {}
+        self._lock = threading.Lock()
+
+    @property
+    def encoding(self) -> str:  # type: ignore
+        return "utf-8"
+
+    def isatty(self) -> bool:
+        # no cursor movements and colors in the log files
+        return False
+
+    @contextmanager
+    def redirect(self, job_file: TextIO) -> Generator[None, None, None]:
+        """Write the output of the current thread to the log file for the duration of the context manager.
+
+        Args:
+            job_file: The open log file of the job, it can be shared by the routers of stdout and stderr.
+        """
+        with self._lock:
+            self._job_files[threading.get_ident()] = job_file
+        try:
+            yield
+        finally:
+            with self._lock:
+                del self._job_files[threading.get_ident()]
+
+    def write(self, text: str) -> int:
+        ident = threading.get_ident()
+        job_file = self._job_files.get(ident)
+        if job_file is not None:
+            return job_file.write(text)
+        if ident == self._owner:
+            return self._stream.write(text)
+        return len(text)
+
+    def flush(self) -> None:
+        job_file = self._job_files.get(threading.get_ident())
+        (job_file if job_file is not None else self._stream).flush()
+
+# %% ../nbs/Batch_CLI.ipynb 6
+def _get_description_files(descriptions: str) -> List[Path]:
+    descriptions_path = Path(descriptions)
+    if descriptions_path.is_dir():
+        description_files = sorted(descriptions_path.glob("*.txt"))
+    else:
+        description_files = sorted(Path(p) for p in glob.glob(descriptions, recursive=True))
+
+    if len(description_files) == 0:
+        raise ValueError(f"Error: No app description files were found in '{descriptions}'.")
+
+    names = [p.stem for p in description_files]
+    duplicates = sorted({n for n in names if names.count(n) > 1})
+    if len(duplicates) > 0:
+        raise ValueError(
+            f"Error: The app description files must have unique names, found duplicates: {', '.join(duplicates)}."
+        )
+    return description_files
+
+# %% ../nbs/Batch_CLI.ipynb 8
+def _warmup_shared_resources(jobs: int) -> None:
+    """Load the resources shared by all the jobs once, before the jobs are started.
+
+    Args:
+        jobs: The number of jobs running at the same time.
+    """
+    load_vector_store(get_root_data_path() / "examples")
+    load_vector_store(get_root_data_path() / "docs")
+    get_template_cache().get_template_path()
+    get_venv_pool().warmup(jobs)
+
+
+def _run_job(
+    description_file: Path,
+    output_path: Path,
+    stdout_router: _JobOutputRouter,
+    stderr_router: _JobOutputRouter,
+    **kwargs: Any,
+) -> Dict[str, Any]:
+    """Generate the project for one app description with its output written to a log file.
+
+    Args:
+        description_file: The path to the file with the app description.
+        output_path: The directory where the project directory and the log file are created.
+        stdout_router: The router of the job outputs written to sys.stdout.
+        stderr_router: The router of the job outputs written to sys.stderr, such as the error messages.
+        kwargs: The options passed to the generate command.
+
+    Returns:
+        The summary of the job.
+    """
+    name = description_file.stem
+    log_path = output_path / f"{name}.log"
+    start = time.time()
+    with open(log_path, "w", encoding="utf-8") as f, stdout_router.redirect(f), stderr_router.redirect(f):
+        try:
+            generate_fastkafka_app(
+                description=None,
+                input_path=str(description_file.resolve()),
+                output_path=str(output_path / name),
+                **kwargs,
+            )
+            is_exited = False
+        except typer.Exit:
+            is_exited = True
+        except Exception as e:
+            print(f"Unexpected internal error: {e}")
+            is_exited = True
+
+    log = log_path.read_text(encoding="utf-8")
+    tokens = re.search(r"Tokens used: (\d+)", log)
+    price = re.search(r"Total Cost \(USD\): \$(\S+)", log)
+    return {
+        "name": name,
+        "is_successful": not is_exited and INCOMPLETE_APP_ERROR_MSG not in log,
+        "duration": time.time() - start,
+        "total_tokens": int(tokens.group(1)) if tokens else 0,
+        "price": float(price.group(1)) if price else 0.0,
+        "log_path": log_path,
+    }
+
+# %% ../nbs/Batch_CLI.ipynb 9
+app = typer.Typer(
+    short_help="Generate FastStream projects for many app descriptions in one process",
+)
+
+# %% ../nbs/Batch_CLI.ipynb 10
+@app.command(
+    "generate-batch",
+    help="Generate a FastStream project for every app description in the directory or glob pattern. The projects are generated concurrently in one process, which loads the retrieval indexes, the project template and the virtual environments only once.",
+)
+def generate_batch(
+    descriptions: str = typer.Argument(
+        ...,
+        help="The directory with the app description .txt files or a glob pattern matching the app description files.",
+    ),
+    output_path: str = typer.Option(
+        ".",
+        "--output_path",
+        "-o",
+        help="The directory where a project directory and a log file are created for every app description.",
+    ),
+    jobs: int = typer.Option(
+        4,
+        "--jobs",
+        "-j",
+        min=1,
+        help="The maximum number of projects generated at the same time.",
+    ),
+    model: OpenAIModel = typer.Option(
+        OpenAIModel.gpt3.value,
+        "--model",
+        "-m",
+        help=f"The OpenAI model that will be used to create the FastStream projects. For better results, we recommend using '{OpenAIModel.gpt4.value}'.",
+    ),
+    verbose: bool = typer.Option(
+        False,
+        "--verbose",
+        "-v",
+        help="Enable verbose logging by setting the logger level to INFO.",
+    ),
+    save_log_files: bool = typer.Option(
+        False,
+        "--dev",
+        "-d",
+        help="Save the complete logs generated by faststream-gen inside the project directories.",
+    ),
+    install_project: bool = typer.Option(
+        False,
+        "--install_project",
+        help="Build and install the generated projects before running the integration tests.",
+    ),
+    num_candidates: int = typer.Option(
+        1,
+        "--num_candidates",
+        min=1,
+        help="The number of candidate responses requested from OpenAI at once when generating the application skeleton and the application code.",
+    ),
+    llm_cache: LLMCacheMode = typer.Option(
+        LLMCacheMode.off.value,
+        "--llm_cache",
+        envvar=LLM_CACHE_MODE_ENV_VAR,
+        help="The on-disk cache of the OpenAI responses shared by all the jobs.",
+    ),
+    retrieval: RetrievalMode = typer.Option(
+        RetrievalMode.vector.value,
+        "--retrieval",
+        envvar=RETRIEVAL_MODE_ENV_VAR,
+        help="How the example applications are retrieved.",
+    ),
+    resume: bool = typer.Option(
+        False,
+        "--resume",
+        help="Skip the steps completed by the previous run of every project, so only the failed projects are generated again.",
+    ),
+) -> None:
+    """Generate FastStream projects for many app descriptions in one process."""
+    try:
+        description_files = _get_description_files(descriptions)
+        # the jobs get absolute paths, so they don't depend on the working directory of the process
+        output_path_obj = Path(output_path).resolve()
+        output_path_obj.mkdir(parents=True, exist_ok=True)
+
+        # the replayed responses are read from the LLM cache without calling the OpenAI API
+        if llm_cache != LLMCacheMode.replay:
+            ensure_openai_api_key_set()
+        get_llm_cache().mode = llm_cache
+        typer.secho(
+            f"Preparing the shared resources for {len(description_files)} app descriptions...",
+            fg=typer.colors.CYAN,
+        )
+        _warmup_shared_resources(jobs)
+    except ValueError as e:
+        typer.secho(e, err=True, fg=typer.colors.RED)
+        raise typer.Exit(code=1)
+    except Exception as e:
+        typer.secho(f"Unexpected internal error: {e}", err=True, fg=typer.colors.RED)
+        raise typer.Exit(code=1)
+
+    job_kwargs = dict(
+        model=model,
+        verbose=verbose,
+        save_log_files=save_log_files,
+        install_project=install_project,
+        num_candidates=num_candidates,
+        llm_cache=llm_cache,
+        retrieval=retrieval,
+        resume=resume,
+    )
+    stdout_router, stderr_router = _JobOutputRouter(sys.stdout), _JobOutputRouter(sys.stderr)
+    original_stdout, sys.stdout = sys.stdout, stdout_router  # type: ignore
+    original_stderr, sys.stderr = sys.stderr, stderr_router  # type: ignore
+    results = []
+    try:
+        with concurrent.futures.ThreadPoolExecutor(max_workers=jobs) as executor:
+            futures = [
+                executor.submit(_run_job, f, output_path_obj, stdout_router, stderr_router, **job_kwargs)
+                for f in description_files
+            ]
+            for future in concurrent.futures.as_completed(futures):
+                result = future.result()
+                results.append(result)
+                if result["is_successful"]:
+                    message, fg = f" ✔ {result['name']}", typer.colors.GREEN
+                else:
+                    message, fg = f" ✘ {result['name']}, see {result['log_path']}", typer.colors.RED
+                typer.secho(
+                    f"{len(results)}/{len(futures)}{message} ({result['duration']:.1f}s, {result['total_tokens']} tokens, ${round(result['price'], 5)})",
+                    fg=fg,
+                )
+    finally:
+        sys.stdout = original_stdout
+        sys.stderr = original_stderr
+
+    success_cnt = sum(r["is_successful"] for r in results)
+    typer.secho(
+        f"\nGenerated {success_cnt} of {len(results)} projects successfully.", fg=typer.colors.CYAN
+    )
+    typer.secho(f" Tokens used: {sum(r['total_tokens'] for r in results)}", fg=typer.colors.CYAN)
+    typer.secho(f" Total Cost (USD): ${round(sum(r['price'] for r in results), 5)}", fg=typer.colors.CYAN)
+    if success_cnt != len(results):
+        raise typer.Exit(code=1)
@@ -9,6 +9,7 @@ from typing import *
 import typer
 from pathlib import Path
 import shutil
+import concurrent.futures
 
 from ._components.logger import get_logger
 from faststream_gen._code_generator.app_description_validator import (
@@ -22,8 +23,11 @@ from faststream_gen._code_generator.helper import (
     write_file_contents,
     ensure_openai_api_key_set,
 )
-from ._code_generator.constants import MODEL_PRICING, EMPTY_DESCRIPTION_ERROR, OpenAIModel, LOGS_DIR_NAME, INCOMPLETE_APP_ERROR_MSG
+from ._code_generator.constants import MODEL_PRICING, EMPTY_DESCRIPTION_ERROR, OpenAIModel, LOGS_DIR_NAME, INCOMPLETE_APP_ERROR_MSG, LLMCacheMode, LLM_CACHE_MODE_ENV_VAR, RetrievalMode, RETRIEVAL_MODE_ENV_VAR
+from ._code_generator.llm_cache import get_llm_cache
 from ._components.new_project_generator import create_project
+from ._components.template_cache import get_template_cache
+from ._components.checkpoint import GenerationCheckpoint
 from ._code_generator.app_skeleton_generator import generate_app_skeleton
 from ._code_generator.app_and_test_generator import generate_app_and_test
 from ._components.integration_test_generator import fix_requirements_and_run_tests
@@ -84,21 +88,82 @@ def _get_description(input_path: str) -> str:
     return description
 
 # %% ../nbs/CLI.ipynb 12
+def _get_cleaned_description(description: Optional[str], input_path: str) -> str:
+    if not description:
+        if not input_path:
+            raise ValueError(EMPTY_DESCRIPTION_ERROR)
+        description = _get_description(input_path)
+
+    return strip_white_spaces(description)
+
+
 def _validate_app_description(
     description: Optional[str],
     input_path: str,
     model: OpenAIModel,
     tokens_list: List[Dict[str, int]],
 ) -> Tuple[str, List[Dict[str, int]]]:
-    if not description:
-        if not input_path:
-            raise ValueError(EMPTY_DESCRIPTION_ERROR)
-        description = _get_description(input_path)
-
-    cleaned_description = strip_white_spaces(description)
+    cleaned_description = _get_cleaned_description(description, input_path)
     return validate_app_description(cleaned_description, model.value, tokens_list)
 
 # %% ../nbs/CLI.ipynb 16
+def _prepare_project(
+    description: Optional[str],
+    input_path: str,
+    output_path: str,
+    model: OpenAIModel,
+    retrieval: RetrievalMode,
+    tokens_list: List[Dict[str, int]],
+) -> Tuple[str, Dict[str, str], List[Dict[str, int]]]:
+    """Validate the description, create the project and retrieve the relevant examples.
+
+    The validation only checks the description and doesn't change it, so the template
+    download and the examples retrieval run in the background while the description is
+    validated. The project is copied from the downloaded template only after the
+    description is validated, so nothing is written to the output path for an invalid one.
+
+    Args:
+        description: The application description.
+        input_path: The path to the file with the application description.
+        output_path: The path where the project is created.
+        model: The OpenAI model used for the validation.
+        retrieval: How the example applications are retrieved.
+        tokens_list: The list of the token usages.
+
+    Returns:
+        The validated description, the relevant examples for each step and the list of the token usages.
+
+    Raises:
+        ValueError: If the description is missing or invalid.
+    """
+    cleaned_description = _get_cleaned_description(description, input_path)
+
+    executor = concurrent.futures.ThreadPoolExecutor(max_workers=2)
+    template_future = executor.submit(get_template_cache().get_template_path)
+    examples_future = executor.submit(
+        get_relevant_prompt_examples, cleaned_description, retrieval
+    )
+    try:
+        # Step 1: Validate description
+        validated_description, tokens_list = validate_app_description(
+            cleaned_description, model.value, tokens_list
+        )
+
+        # Step 2: Project creation, create_project reports the template download errors
+        concurrent.futures.wait([template_future])
+        create_project(output_path)
+
+        # Step 3: Get relevant application examples
+        prompt_examples = examples_future.result()
+    finally:
+        # don't wait for the background steps if the validation failed, cancel_futures needs Python 3.9
+        template_future.cancel()
+        examples_future.cancel()
+        executor.shutdown(wait=False)
+
+    return validated_description, prompt_examples, tokens_list
+
+# %% ../nbs/CLI.ipynb 19
 @app.command(
     "generate",
     help="Effortlessly create a new FastStream project based on the app description.",
@@ -155,49 +220,108 @@ For each consumed message, create a new message object and increment the value o
         "-d",
         help="Save the complete logs generated by faststream-gen inside the output_path directory.",
     ),
+    install_project: bool = typer.Option(
+        False,
+        "--install_project",
+        help="Build and install the generated project before running the integration tests. By default, only the project requirements are installed and the tests are run against the project sources.",
+    ),
+    num_candidates: int = typer.Option(
+        1,
+        "--num_candidates",
+        min=1,
+        help="The number of candidate responses requested from OpenAI at once when generating the application skeleton and the application code. The candidates are validated in parallel and the first valid one is used, which trades more tokens for fewer fix rounds.",
+    ),
+    llm_cache: LLMCacheMode = typer.Option(
+        LLMCacheMode.off.value,
+        "--llm_cache",
+        envvar=LLM_CACHE_MODE_ENV_VAR,
+        help=f"The on-disk cache of the OpenAI responses. Use '{LLMCacheMode.read_write.value}' to reuse and store responses, '{LLMCacheMode.replay.value}' to only reuse stored responses without calling the OpenAI API and '{LLMCacheMode.record.value}' to always call the OpenAI API and store the responses.",
+    ),
+    retrieval: RetrievalMode = typer.Option(
+        RetrievalMode.vector.value,
+        "--retrieval",
+        envvar=RETRIEVAL_MODE_ENV_VAR,
+        help=f"How the example applications are retrieved. Use '{RetrievalMode.vector.value}' to search by OpenAI embeddings, '{RetrievalMode.lexical.value}' to search by keywords with BM25, which needs no embeddings and is deterministic, and '{RetrievalMode.hybrid.value}' to fuse both scores.",
+    ),
+    resume: bool = typer.Option(
+        False,
+        "--resume",
+        help="Continue the interrupted or failed generation in the output_path directory and skip the steps completed by the previous run. The checkpoint is used only if the app description and the model are the same.",
+    ),
 ) -> None:
     """Effortlessly create a new FastStream project based on the app description."""
     logger.info("Project generation started.")
     try:
         tokens_list: List[Dict[str, int]] = []
-        ensure_openai_api_key_set()
+        # the replayed responses are read from the LLM cache without calling the OpenAI API
+        if llm_cache != LLMCacheMode.replay:
+            ensure_openai_api_key_set()
+        get_llm_cache().mode = llm_cache
 
-        # Step 1: Validate description
-        validated_description, tokens_list = _validate_app_description(
-            description, input_path, model, tokens_list
+        checkpoint = GenerationCheckpoint(
+            output_path, _get_cleaned_description(description, input_path), model.value
         )
+        if resume and checkpoint.load():
+            checkpoint.restore()
+            typer.secho(
+                f" ✔ Resuming the generation, skipping the completed steps: {', '.join(checkpoint.steps)}.",
+                fg=typer.colors.CYAN,
+            )
+        else:
+            checkpoint.clear()
 
-        # Step 2: Project creation
-        create_project(output_path)
-
-        # Step 3: Get relevant application examples
-        prompt_examples = get_relevant_prompt_examples(validated_description)
+        # Steps 1-3: Validate description, create the project and get relevant application examples
+        if checkpoint.is_completed("description"):
+            validated_description = checkpoint.description
+            prompt_examples = checkpoint.get("description")["prompt_examples"]
+        else:
+            validated_description, prompt_examples, tokens_list = _prepare_project(
+                description, input_path, output_path, model, retrieval, tokens_list
+            )
+            checkpoint.save("description", tokens_list, {"prompt_examples": prompt_examples})
 
         # Step 4: Generate application skeleton
-        tokens_list, is_valid_skeleton_code = generate_app_skeleton(
-            validated_description,
-            output_path,
-            model.value,
-            tokens_list,
-            prompt_examples["description_to_skeleton"],
-        )
-        if is_valid_skeleton_code:
-            # Step 5: Generate application and test code only if previous step is successful
-            tokens_list, is_valid_app_code = generate_app_and_test(
+        is_valid_skeleton_code = checkpoint.is_completed("skeleton")
+        if not is_valid_skeleton_code:
+            step_start = len(tokens_list)
+            tokens_list, is_valid_skeleton_code = generate_app_skeleton(
                 validated_description,
-                model.value,
                 output_path,
+                model.value,
                 tokens_list,
-                prompt_examples["skeleton_to_app_and_test"],
+                prompt_examples["description_to_skeleton"],
+                num_candidates,
             )
-            if is_valid_app_code:
-                # Step 5: Generate application and test code only if previous step is successful
-                (
+            if is_valid_skeleton_code:
+                checkpoint.save("skeleton", tokens_list[step_start:])
+        if is_valid_skeleton_code:
+            # Step 5: Generate application and test code only if previous step is successful
+            is_valid_app_code = checkpoint.is_completed("app")
+            if not is_valid_app_code:
+                step_start = len(tokens_list)
+                tokens_list, is_valid_app_code = generate_app_and_test(
+                    validated_description,
+                    model.value,
+                    output_path,
                     tokens_list,
-                    is_requirements_file_valid,
-                ) = fix_requirements_and_run_tests(
-                    output_path, model.value, tokens_list
+                    prompt_examples["skeleton_to_app_and_test"],
+                    num_candidates,
                 )
+                if is_valid_app_code:
+                    checkpoint.save("app", tokens_list[step_start:])
+            if is_valid_app_code:
+                # Step 6: Fix requirements and run the tests only if previous step is successful
+                is_requirements_file_valid = checkpoint.is_completed("requirements")
+                if not is_requirements_file_valid:
+                    step_start = len(tokens_list)
+                    (
+                        tokens_list,
+                        is_requirements_file_valid,
+                    ) = fix_requirements_and_run_tests(
+                        output_path, model.value, tokens_list, install_project
+                    )
+                    if is_requirements_file_valid:
+                        checkpoint.save("requirements", tokens_list[step_start:])
 
         if not is_valid_skeleton_code:
             is_valid_app_code = False
@@ -242,6 +366,8 @@ For each consumed message, create a new message object and increment the value o
 {test_cmd}
 
 For in-depth debugging, check the {logs_dir} directory for complete logs, including individual step information.
+
+To retry only the failed steps, run the same command again with the --resume flag.
 """,
             fg=typer.colors.RED,
         )